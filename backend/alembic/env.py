@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Import the Base and models
 from app.core.database import Base
 from app.core.config import settings
-from app.models import User, Job, Application, ParsedProfile
+from app.models import User, Job, Application, ParsedProfile, DocumentFrequency
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,28 @@
+"""Add LSA embeddings to parsed profiles
+
+Revision ID: 5d7f20a8e6c1
+Revises: c3e1d92f4b7a
+Create Date: 2026-10-16 22:41:09.274613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7f20a8e6c1'
+down_revision: Union[str, None] = 'c3e1d92f4b7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('parsed_profiles', sa.Column('resume_embedding', sa.LargeBinary(), nullable=True))
+    op.add_column('parsed_profiles', sa.Column('embedding_version', sa.String(50), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('parsed_profiles', 'embedding_version')
+    op.drop_column('parsed_profiles', 'resume_embedding')
@@ -0,0 +1,31 @@
+"""Add persisted matching features to jobs
+
+Revision ID: 8a4031859a5c
+Revises: f99f59dcc0f9
+Create Date: 2026-10-16 10:03:17.552910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4031859a5c'
+down_revision: Union[str, None] = 'f99f59dcc0f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('required_skills', postgresql.JSON(), nullable=True))
+    op.add_column('jobs', sa.Column('feature_vector', sa.LargeBinary(), nullable=True))
+    op.add_column('jobs', sa.Column('feature_model_version', sa.String(50), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'feature_model_version')
+    op.drop_column('jobs', 'feature_vector')
+    op.drop_column('jobs', 'required_skills')
@@ -0,0 +1,82 @@
+"""Add skill bitmasks to parsed profiles and jobs
+
+Revision ID: b64e0c7d2a19
+Revises: 5d7f20a8e6c1
+Create Date: 2026-10-16 23:37:52.108436
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b64e0c7d2a19'
+down_revision: Union[str, None] = '5d7f20a8e6c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Skill vocabulary at this revision (bit i = SKILL_VOCABULARY[i]), copied so
+# that replaying the backfill never depends on the current vocabulary
+SKILL_VOCABULARY = [
+    'python', 'javascript', 'java', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby',
+    'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'sass', 'less', 'react',
+    'vue', 'angular', 'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'laravel',
+    'rails', 'asp.net', 'next.js', 'nuxt.js', 'svelte', 'postgresql', 'mysql', 'mongodb',
+    'redis', 'elasticsearch', 'cassandra', 'dynamodb', 'aws', 'azure', 'gcp', 'docker',
+    'kubernetes', 'jenkins', 'ci/cd', 'terraform', 'ansible', 'git', 'github', 'gitlab',
+    'linux', 'bash', 'shell scripting', 'machine learning', 'deep learning', 'tensorflow',
+    'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter',
+    'data analysis', 'agile', 'scrum', 'rest api', 'graphql', 'microservices',
+    'api development', 'testing', 'tdd', 'bdd', 'selenium', 'cypress', 'jest', 'pytest', 'api',
+    'rest'
+]
+SKILL_BITS = {skill: index for index, skill in enumerate(SKILL_VOCABULARY)}
+
+
+def skill_mask(skills):
+    """Signed BIGINT (lo, hi) words of the mask for a skill list (unknown skills are ignored)"""
+    value = 0
+    for skill in skills:
+        bit = SKILL_BITS.get(skill.lower())
+        if bit is not None:
+            value |= 1 << bit
+    words = [(value >> (64 * word)) & ((1 << 64) - 1) for word in range(2)]
+    return tuple(word - (1 << 64) if word >= 1 << 63 else word for word in words)
+
+
+def _backfill(table_name: str, skills_column: str, prefix: str) -> None:
+    """Compute the masks of existing rows from their stored skill lists"""
+    table = sa.table(
+        table_name,
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column(skills_column, postgresql.JSON()),
+        sa.column(f'{prefix}_lo', sa.BigInteger()),
+        sa.column(f'{prefix}_hi', sa.BigInteger())
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(table.c.id, table.c[skills_column])).fetchall()
+    for row_id, skills in rows:
+        lo, hi = skill_mask(skills or [])
+        bind.execute(
+            table.update().where(table.c.id == row_id).values({f'{prefix}_lo': lo, f'{prefix}_hi': hi})
+        )
+
+
+def upgrade() -> None:
+    op.add_column('parsed_profiles', sa.Column('skill_mask_lo', sa.BigInteger(), nullable=True))
+    op.add_column('parsed_profiles', sa.Column('skill_mask_hi', sa.BigInteger(), nullable=True))
+    op.add_column('jobs', sa.Column('required_skill_mask_lo', sa.BigInteger(), nullable=True))
+    op.add_column('jobs', sa.Column('required_skill_mask_hi', sa.BigInteger(), nullable=True))
+
+    _backfill('parsed_profiles', 'skills', 'skill_mask')
+    _backfill('jobs', 'required_skills', 'required_skill_mask')
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'required_skill_mask_hi')
+    op.drop_column('jobs', 'required_skill_mask_lo')
+    op.drop_column('parsed_profiles', 'skill_mask_hi')
+    op.drop_column('parsed_profiles', 'skill_mask_lo')
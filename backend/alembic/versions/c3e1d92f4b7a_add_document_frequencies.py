@@ -0,0 +1,31 @@
+"""Add incrementally maintained document frequencies
+
+Revision ID: c3e1d92f4b7a
+Revises: 8a4031859a5c
+Create Date: 2026-10-16 22:04:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e1d92f4b7a'
+down_revision: Union[str, None] = '8a4031859a5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'document_frequencies',
+        sa.Column('term', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('df', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('term')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('document_frequencies')
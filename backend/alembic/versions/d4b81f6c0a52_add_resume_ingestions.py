@@ -0,0 +1,45 @@
+"""Add resume ingestion queue
+
+Revision ID: d4b81f6c0a52
+Revises: e2a7c95f0b38
+Create Date: 2026-10-17 01:12:08.604213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b81f6c0a52'
+down_revision: Union[str, None] = 'e2a7c95f0b38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_ingestions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_resume_ingestions_user_id', 'resume_ingestions', ['user_id'])
+    op.create_index('ix_resume_ingestions_status_created_at', 'resume_ingestions', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resume_ingestions_status_created_at', table_name='resume_ingestions')
+    op.drop_index('ix_resume_ingestions_user_id', table_name='resume_ingestions')
+    op.drop_table('resume_ingestions')
@@ -0,0 +1,27 @@
+"""Add structured match facts to applications
+
+Revision ID: e2a7c95f0b38
+Revises: b64e0c7d2a19
+Create Date: 2026-10-17 00:26:41.530872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c95f0b38'
+down_revision: Union[str, None] = 'b64e0c7d2a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('match_facts', postgresql.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('applications', 'match_facts')
@@ -0,0 +1,28 @@
+"""Add stored resume vectors to parsed profiles
+
+Revision ID: f99f59dcc0f9
+Revises: 8b078effd620
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f99f59dcc0f9'
+down_revision: Union[str, None] = '8b078effd620'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('parsed_profiles', sa.Column('resume_vector', sa.LargeBinary(), nullable=True))
+    op.add_column('parsed_profiles', sa.Column('vector_model_version', sa.String(50), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('parsed_profiles', 'vector_model_version')
+    op.drop_column('parsed_profiles', 'resume_vector')
@@ -1,17 +1,24 @@
 """
 Admin API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Any
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.security import require_role
 from app.models.user import User, UserRole
 from app.models.job import Job
 from app.models.application import Application
+from app.models.resume_ingestion import ResumeIngestion
 from app.schemas.user import UserResponse
 from app.schemas.job import JobResponse
+from app.services.matching_service import matching_service
+from app.services.skill_index import skill_index
+from app.services.executor import cpu_executor
+from app.services.resume_ingestion import resume_ingestion
+from app.services.resume_cache import resume_cache
 
 router = APIRouter()
 
@@ -47,8 +54,21 @@ async def delete_user(
             detail="You cannot delete your own account"
         )
     
+    if user.parsed_profile:
+        matching_service.record_document_change(
+            db, matching_service.extract_resume_text(user.parsed_profile, user.resume_text or ""), None
+        )
+    # A recruiter's jobs go with them
+    job_ids = [job.id for job in user.jobs]
+    matching_service.record_document_changes(
+        db, [(matching_service.extract_job_requirements(job), None) for job in user.jobs]
+    )
     db.delete(user)
     db.commit()
+    skill_index.remove(user.id)
+    matching_service.unindex_profile(user.id)
+    for job_id in job_ids:
+        matching_service.invalidate_job(job_id)
     
     return None
 
@@ -62,3 +82,99 @@ async def get_all_jobs(
     jobs = db.query(Job).order_by(Job.posted_at.desc()).all()
     return [JobResponse.model_validate(job) for job in jobs]
 
+
+@router.get("/matching-model", response_model=Dict[str, Any])
+async def get_matching_model(
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Get the TF-IDF matching model currently in use (Admin only)"""
+    model = matching_service.model
+    return {
+        "vectorizer": "hashing" if matching_service.hashing else "tfidf",
+        "version": model.version if model else None,
+        "n_documents": model.n_documents if model else 0,
+        "n_features": model.n_features if model else 0
+    }
+
+
+@router.get("/executor", response_model=Dict[str, Any])
+async def get_executor_stats(
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Get CPU executor queue depth, outcome counters and task latency (Admin only)"""
+    return cpu_executor.stats()
+
+
+@router.get("/ranking", response_model=Dict[str, Any])
+async def get_ranking_stats(
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Get per-stage candidate counts and timings of the ranking cascade (Admin only)"""
+    return matching_service.cascade_stats.stats()
+
+
+@router.get("/match-cache", response_model=Dict[str, Any])
+async def get_match_cache_stats(
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Get match-result cache size and hit/miss counters (Admin only)"""
+    cache = matching_service.match_cache
+    return cache.stats() if cache is not None else {"backend": "none"}
+
+
+@router.get("/resume-ingestion", response_model=Dict[str, Any])
+async def get_resume_ingestion_stats(
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+    db: Session = Depends(get_db)
+):
+    """Get resume ingestion queue depth by status and this process's worker counters (Admin only)"""
+    counts = db.query(ResumeIngestion.status, func.count(ResumeIngestion.id)).group_by(ResumeIngestion.status).all()
+    return {"queue": {ingestion_status: count for ingestion_status, count in counts}, **resume_ingestion.stats()}
+
+
+@router.get("/resume-cache", response_model=Dict[str, Any])
+async def get_resume_cache_stats(
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Get parsed-resume cache size, hit rate and eviction counters (Admin only)"""
+    return resume_cache.stats() if resume_cache is not None else {"backend": "none"}
+
+
+def _refresh_stored_vectors():
+    """Background task: re-vectorize profiles and jobs, then rebuild the candidate index"""
+    db = SessionLocal()
+    try:
+        matching_service.refresh_profile_vectors(db)
+        matching_service.refresh_profile_embeddings(db)
+        matching_service.refresh_job_features(db)
+        matching_service.build_candidate_index(db)
+    finally:
+        db.close()
+
+
+@router.post("/matching-model/refit", response_model=Dict[str, Any])
+def refit_matching_model(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+    db: Session = Depends(get_db)
+):
+    """
+    Refit the TF-IDF matching model over all jobs and profiles (Admin only)
+
+    A plain def: FastAPI runs it in the threadpool, so the fit does not block the event loop.
+    """
+    try:
+        model = matching_service.fit_model(db)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    background_tasks.add_task(_refresh_stored_vectors)
+    
+    return {
+        "version": model.version,
+        "n_documents": model.n_documents,
+        "n_features": model.n_features
+    }
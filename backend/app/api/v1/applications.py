@@ -2,8 +2,9 @@
 Application API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Query as OrmQuery, Session
+from typing import Any, Dict, List, Optional
+import asyncio
 import uuid
 
 from app.core.database import get_db
@@ -12,13 +13,94 @@ from app.models.user import User, UserRole
 from app.models.job import Job
 from app.models.application import Application
 from app.models.parsed_profile import ParsedProfile
-from app.schemas.application import ApplicationCreate, ApplicationResponse, ApplicationUpdate, ApplicationWithCandidateResponse
+from app.schemas.application import (
+    ApplicationCreate, ApplicationResponse, ApplicationUpdate,
+    ApplicationWithCandidateResponse, MatchDetailsResponse, RankedCandidateResponse
+)
 from app.schemas.user import UserResponse
 from app.schemas.profile import ParsedProfileResponse
-from app.services.matching_service import MatchingService
+from app.services.matching_service import matching_service
+from app.services.match_facts import MatchFacts, render_analysis
+from app.services.skill_index import parse_skill_query, skill_index
+from app.services.skill_bitmask import mask_condition
+from app.services.executor import cpu_executor, ExecutorBusyError
+from app.services.scoring_tasks import job_fields, profile_fields, score_match
 
 router = APIRouter()
-matching_service = MatchingService()
+
+SKILLS_FILTER_DESCRIPTION = (
+    "Skill filter: ',' = AND, '|' = OR, leading '-' = NOT "
+    "(e.g. python,docker|kubernetes,-php)"
+)
+
+
+def _get_recruiter_job(job_id: uuid.UUID, current_user: User, db: Session) -> Job:
+    """Load a job the current recruiter/admin is allowed to see applicants for"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.recruiter_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view applicants for this job"
+        )
+    
+    return job
+
+
+def _match_fields(application: Application, with_analysis: bool) -> Dict[str, Any]:
+    """
+    Response fields describing an application's match
+
+    The analysis text is only rendered for single-application views; list
+    endpoints ship the structured details alone.
+    """
+    facts = MatchFacts.from_json(application.match_facts) if application.match_facts else None
+    analysis = None
+    if with_analysis:
+        analysis = render_analysis(facts) if facts else application.match_analysis
+    return {
+        "match_details": MatchDetailsResponse(**facts.details()) if facts else None,
+        "match_analysis": analysis
+    }
+
+
+def _application_response(application: Application, with_analysis: bool = True) -> ApplicationResponse:
+    """ApplicationResponse with the match fields filled in"""
+    return ApplicationResponse.model_validate(application).model_copy(
+        update=_match_fields(application, with_analysis)
+    )
+
+
+def _filter_by_skills(query: OrmQuery, skills: Optional[str], db: Session) -> List[Application]:
+    """
+    Load the applications of a query whose candidate matches the skills filter
+
+    Filters on the profile skill bitmasks in SQL when every skill is in the
+    canonical vocabulary, otherwise through the in-memory skill index.
+    """
+    if not skills:
+        return query.all()
+    
+    try:
+        clauses = parse_skill_query(skills)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    condition = mask_condition((ParsedProfile.skill_mask_lo, ParsedProfile.skill_mask_hi), clauses)
+    if condition is not None:
+        return query.join(ParsedProfile, ParsedProfile.user_id == Application.user_id).filter(condition).all()
+    
+    skill_index.ensure_built(db)
+    allowed_users = skill_index.query(skills)
+    return [app for app in query.all() if app.user_id in allowed_users]
 
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
@@ -66,18 +148,34 @@ async def create_application(
             detail="Please upload your resume before applying to jobs"
         )
     
-    # Calculate match score
+    # Calculate match score in the CPU executor, off the event loop; the match
+    # cache lives in this process, so it is checked and filled here
     resume_text = current_user.resume_text or ""
-    match_score, match_analysis, _ = matching_service.calculate_match_score(
-        job, parsed_profile, resume_text
-    )
+    cache_key, result = matching_service.cached_match_score(job, parsed_profile, resume_text)
+    try:
+        if result is None:
+            result = await cpu_executor.run(
+                score_match, job_fields(job), profile_fields(parsed_profile), resume_text
+            )
+            matching_service.cache_match_score(cache_key, result)
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Match scoring timed out, please retry"
+        )
+    match_score, match_facts, _ = result
     
     # Create application
     new_application = Application(
         job_id=application_data.job_id,
         user_id=current_user.id,
         match_score=match_score,
-        match_analysis=match_analysis,
+        match_facts=match_facts.to_json(),
         status="Pending"
     )
     
@@ -85,7 +183,7 @@ async def create_application(
     db.commit()
     db.refresh(new_application)
     
-    return ApplicationResponse.model_validate(new_application)
+    return _application_response(new_application)
 
 
 @router.get("/my-applications", response_model=List[ApplicationResponse])
@@ -98,34 +196,26 @@ async def get_my_applications(
         Application.user_id == current_user.id
     ).order_by(Application.applied_at.desc()).all()
     
-    return [ApplicationResponse.model_validate(app) for app in applications]
+    return [_application_response(app, with_analysis=False) for app in applications]
 
 
 @router.get("/job/{job_id}/applicants", response_model=List[ApplicationWithCandidateResponse])
 async def get_job_applicants(
     job_id: uuid.UUID,
+    skills: Optional[str] = Query(None, description=SKILLS_FILTER_DESCRIPTION),
     current_user: User = Depends(require_role([UserRole.RECRUITER, UserRole.ADMIN])),
     db: Session = Depends(get_db)
 ):
     """Get all applicants for a job (Recruiter/Admin only)"""
     # Check if job exists and user has permission
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
-    
-    if job.recruiter_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to view applicants for this job"
-        )
+    _get_recruiter_job(job_id, current_user, db)
     
     # Get applications sorted by match score
-    applications = db.query(Application).filter(
-        Application.job_id == job_id
-    ).order_by(Application.match_score.desc()).all()
+    applications = _filter_by_skills(
+        db.query(Application).filter(Application.job_id == job_id).order_by(Application.match_score.desc()),
+        skills,
+        db
+    )
     
     # Enrich with candidate details
     result = []
@@ -141,7 +231,7 @@ async def get_job_applicants(
             "user_id": app.user_id,
             "status": app.status,
             "match_score": app.match_score,
-            "match_analysis": app.match_analysis,
+            **_match_fields(app, with_analysis=False),
             "applied_at": app.applied_at,
             "updated_at": app.updated_at,
             "candidate": UserResponse.model_validate(user) if user else None,
@@ -153,6 +243,47 @@ async def get_job_applicants(
     return result
 
 
+@router.get("/job/{job_id}/ranked", response_model=List[RankedCandidateResponse])
+async def rank_job_applicants(
+    job_id: uuid.UUID,
+    skills: Optional[str] = Query(None, description=SKILLS_FILTER_DESCRIPTION),
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(require_role([UserRole.RECRUITER, UserRole.ADMIN])),
+    db: Session = Depends(get_db)
+):
+    """Rank a job's applicants against its current requirements (Recruiter/Admin only)"""
+    job = _get_recruiter_job(job_id, current_user, db)
+    
+    applications = _filter_by_skills(
+        db.query(Application).filter(Application.job_id == job_id), skills, db
+    )
+    if not applications:
+        return []
+    
+    rows = db.query(ParsedProfile, User).join(
+        User, User.id == ParsedProfile.user_id
+    ).filter(ParsedProfile.user_id.in_([app.user_id for app in applications])).all()
+    users_by_profile = {profile.id: user for profile, user in rows}
+    application_by_user = {app.user_id: app for app in applications}
+    
+    ranked = matching_service.rank_candidates(
+        job,
+        [(profile, user.resume_text or "") for profile, user in rows],
+        top_k=limit
+    )
+    
+    return [
+        RankedCandidateResponse(
+            application_id=application_by_user[profile.user_id].id,
+            user_id=profile.user_id,
+            match_score=score,
+            match_details=MatchDetailsResponse(**facts.details()),
+            candidate=UserResponse.model_validate(users_by_profile[profile.id])
+        )
+        for profile, score, facts in ranked
+    ]
+
+
 @router.put("/{application_id}", response_model=ApplicationResponse)
 async def update_application(
     application_id: uuid.UUID,
@@ -183,7 +314,7 @@ async def update_application(
     db.commit()
     db.refresh(application)
     
-    return ApplicationResponse.model_validate(application)
+    return _application_response(application)
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
@@ -210,5 +341,5 @@ async def get_application(
                 detail="You don't have permission to view this application"
             )
     
-    return ApplicationResponse.model_validate(application)
+    return _application_response(application)
 
@@ -1,7 +1,7 @@
 """
 Job API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uuid
@@ -10,7 +10,12 @@ from app.core.database import get_db
 from app.core.security import get_current_user, require_role
 from app.models.user import User, UserRole
 from app.models.job import Job
-from app.schemas.job import JobCreate, JobUpdate, JobResponse
+from app.models.parsed_profile import ParsedProfile
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobRecommendation, RescoreProgressResponse
+from app.schemas.application import MatchDetailsResponse, RankedCandidateResponse
+from app.schemas.user import UserResponse
+from app.services.matching_service import matching_service
+from app.services.rescoring import application_rescorer
 
 router = APIRouter()
 
@@ -44,6 +49,60 @@ async def get_jobs(
     return [JobResponse.model_validate(job) for job in jobs]
 
 
+@router.get("/recommended", response_model=List[JobRecommendation])
+def get_recommended_jobs(
+    limit: int = Query(10, ge=1, le=100),
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    current_user: User = Depends(require_role([UserRole.JOB_SEEKER])),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the active jobs that best match the current user's resume (Job Seeker only)
+
+    A plain def: FastAPI runs it in the threadpool, so building the job matrix does not block the event loop.
+    """
+    parsed_profile = db.query(ParsedProfile).filter(
+        ParsedProfile.user_id == current_user.id
+    ).first()
+    
+    if not parsed_profile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Please upload your resume to get job recommendations"
+        )
+    
+    try:
+        recommendations = matching_service.recommend_jobs(
+            db,
+            parsed_profile,
+            current_user.resume_text or "",
+            limit=limit,
+            location=location,
+            job_type=job_type
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    
+    jobs_by_id = {
+        job.id: job
+        for job in db.query(Job).filter(Job.id.in_([job_id for job_id, _, _ in recommendations])).all()
+    }
+    
+    return [
+        JobRecommendation(
+            job=JobResponse.model_validate(jobs_by_id[job_id]),
+            match_score=score,
+            missing_skills=missing_skills
+        )
+        for job_id, score, missing_skills in recommendations
+        if job_id in jobs_by_id
+    ]
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(job_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get a specific job by ID"""
@@ -58,6 +117,64 @@ async def get_job(job_id: uuid.UUID, db: Session = Depends(get_db)):
     return JobResponse.model_validate(job)
 
 
+@router.get("/{job_id}/candidates", response_model=List[RankedCandidateResponse])
+def get_job_candidates(
+    job_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(require_role([UserRole.RECRUITER, UserRole.ADMIN])),
+    db: Session = Depends(get_db)
+):
+    """
+    Find the best-matching candidates in the whole talent pool (Recruiter/Admin only)
+
+    A plain def: FastAPI runs it in the threadpool, so scoring the shortlist does not block the event loop.
+    """
+    job = db.query(Job).filter(Job.id == job_id).first()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.recruiter_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to search candidates for this job"
+        )
+    
+    try:
+        nearest = matching_service.nearest_candidates(job, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    
+    if not nearest:
+        return []
+    
+    # Full scores (skill bonus + analysis) only for the approximate top-k
+    rows = db.query(ParsedProfile, User).join(
+        User, User.id == ParsedProfile.user_id
+    ).filter(ParsedProfile.user_id.in_([uuid.UUID(user_id) for user_id, _ in nearest])).all()
+    users_by_profile = {profile.id: user for profile, user in rows}
+    
+    ranked = matching_service.rank_candidates(
+        job, [(profile, user.resume_text or "") for profile, user in rows]
+    )
+    
+    return [
+        RankedCandidateResponse(
+            user_id=profile.user_id,
+            match_score=score,
+            match_details=MatchDetailsResponse(**facts.details()),
+            candidate=UserResponse.model_validate(users_by_profile[profile.id])
+        )
+        for profile, score, facts in ranked
+    ]
+
+
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_data: JobCreate,
@@ -69,10 +186,15 @@ async def create_job(
         **job_data.model_dump(),
         recruiter_id=current_user.id
     )
+    matching_service.apply_job_features(new_job)
+    matching_service.record_document_change(
+        db, None, matching_service.extract_job_requirements(new_job)
+    )
     
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+    matching_service.invalidate_job(new_job.id)
     
     return JobResponse.model_validate(new_job)
 
@@ -81,6 +203,7 @@ async def create_job(
 async def update_job(
     job_id: uuid.UUID,
     job_data: JobUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_role([UserRole.RECRUITER, UserRole.ADMIN])),
     db: Session = Depends(get_db)
 ):
@@ -105,15 +228,60 @@ async def update_job(
     if "is_active" in update_data:
         update_data["is_active"] = "true" if update_data["is_active"] else "false"
     
+    old_text = matching_service.extract_job_requirements(job)
     for field, value in update_data.items():
         setattr(job, field, value)
     
+    requirements_changed = "description" in update_data or "requirements" in update_data
+    if requirements_changed:
+        matching_service.apply_job_features(job)
+        matching_service.record_document_change(
+            db, old_text, matching_service.extract_job_requirements(job)
+        )
+    
     db.commit()
     db.refresh(job)
+    matching_service.invalidate_job(job.id)
+    
+    # Stored application scores were computed against the old requirements
+    if requirements_changed:
+        generation = application_rescorer.enqueue(job.id)
+        background_tasks.add_task(application_rescorer.run, job.id, generation)
     
     return JobResponse.model_validate(job)
 
 
+@router.get("/{job_id}/rescore", response_model=RescoreProgressResponse)
+async def get_rescore_progress(
+    job_id: uuid.UUID,
+    current_user: User = Depends(require_role([UserRole.RECRUITER, UserRole.ADMIN])),
+    db: Session = Depends(get_db)
+):
+    """Get the progress of re-scoring a job's applications after an update (Recruiter/Admin only)"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job.recruiter_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view this job"
+        )
+    
+    progress = application_rescorer.progress(job.id)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No re-scoring has run for this job"
+        )
+    
+    return RescoreProgressResponse(**progress)
+
+
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
     job_id: uuid.UUID,
@@ -136,8 +304,12 @@ async def delete_job(
             detail="You don't have permission to delete this job"
         )
     
+    matching_service.record_document_change(
+        db, matching_service.extract_job_requirements(job), None
+    )
     db.delete(job)
     db.commit()
+    matching_service.invalidate_job(job_id)
     
     return None
 
@@ -1,21 +1,25 @@
 """
 Profile API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
 from sqlalchemy.orm import Session
+import asyncio
 import logging
+import uuid
 
 from app.core.database import get_db
 from app.core.security import get_current_user
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.models.parsed_profile import ParsedProfile
-from app.schemas.profile import ParsedProfileResponse, ProfileUpdate
-from app.services.resume_parser import ResumeParser
+from app.models.resume_ingestion import ResumeIngestion
+from app.schemas.profile import ParsedProfileResponse, ProfileUpdate, ResumeIngestionResponse
+from app.services.resume_ingestion import resume_ingestion, parse_resume_upload, store_parsed_resume, publish_profile
+from app.services.rescoring import application_rescorer
+from app.services.executor import ExecutorBusyError
 from app.core.config import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-resume_parser = ResumeParser()
 
 
 @router.get("/me", response_model=ParsedProfileResponse)
@@ -37,74 +41,72 @@ async def get_my_profile(
     return ParsedProfileResponse.model_validate(parsed_profile)
 
 
+async def _read_resume_upload(file: UploadFile) -> bytes:
+    """Read an uploaded resume, rejecting non-PDF files and files over MAX_UPLOAD_SIZE"""
+    # Validate file type
+    if not file.filename.endswith('.pdf'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PDF files are supported"
+        )
+    
+    file_content = await file.read()
+    
+    # Check file size
+    if len(file_content) > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
+        )
+    return file_content
+
+
 @router.post("/upload-resume", response_model=ParsedProfileResponse)
 async def upload_resume(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload and parse resume"""
-    # Validate file type
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PDF files are supported"
-        )
+    file_content = await _read_resume_upload(file)
     
-    # Read file content
     try:
-        file_content = await file.read()
-        
-        # Check file size
-        if len(file_content) > settings.MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
-            )
-        
-        # Extract text from PDF
-        resume_text = resume_parser.extract_text_from_pdf(file_content)
-        
-        # Parse resume
-        parsed_data = resume_parser.parse_resume(resume_text)
+        # Extract text from PDF and parse it in the CPU executor, off the event loop
+        # (skipped when the same PDF was parsed before)
+        resume_text, parsed_data = await parse_resume_upload(file_content)
         
         # Update or create parsed profile
-        parsed_profile = db.query(ParsedProfile).filter(
-            ParsedProfile.user_id == current_user.id
-        ).first()
-        
-        if parsed_profile:
-            # Update existing profile
-            parsed_profile.skills = parsed_data["skills"]
-            parsed_profile.experience = parsed_data["experience"]
-            parsed_profile.education = parsed_data["education"]
-            parsed_profile.summary = parsed_data["summary"]
-        else:
-            # Create new profile
-            parsed_profile = ParsedProfile(
-                user_id=current_user.id,
-                skills=parsed_data["skills"],
-                experience=parsed_data["experience"],
-                education=parsed_data["education"],
-                summary=parsed_data["summary"]
-            )
-            db.add(parsed_profile)
-        
-        # Update user's resume text
-        current_user.resume_text = resume_text
+        parsed_profile = store_parsed_resume(db, current_user, resume_text, parsed_data)
         
         db.commit()
         db.refresh(parsed_profile)
+        publish_profile(current_user.id, parsed_profile)
+        
+        # Existing applications were scored against the previous resume
+        background_tasks.add_task(application_rescorer.rescore_user, current_user.id)
         
         logger.info(f"Resume parsed successfully for user {current_user.id}")
         
         return ParsedProfileResponse.model_validate(parsed_profile)
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Resume parsing timed out"
+        )
     except Exception as e:
         logger.error(f"Error uploading resume: {str(e)}")
         raise HTTPException(
@@ -113,6 +115,38 @@ async def upload_resume(
         )
 
 
+@router.post("/ingestion", response_model=ResumeIngestionResponse, status_code=status.HTTP_202_ACCEPTED)
+async def ingest_resume(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Store a resume for background parsing; poll GET /ingestion/{id} until it completes"""
+    file_content = await _read_resume_upload(file)
+    ingestion = resume_ingestion.enqueue(db, current_user.id, file.filename, file_content)
+    logger.info(f"Resume queued for ingestion {ingestion.id} for user {current_user.id}")
+    return ResumeIngestionResponse.model_validate(ingestion)
+
+
+@router.get("/ingestion/{ingestion_id}", response_model=ResumeIngestionResponse)
+async def get_ingestion_status(
+    ingestion_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of an asynchronous resume upload"""
+    ingestion = db.query(ResumeIngestion).filter(ResumeIngestion.id == ingestion_id).first()
+    
+    # Someone else's upload is reported as missing, not forbidden
+    if not ingestion or (ingestion.user_id != current_user.id and current_user.role != UserRole.ADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume ingestion not found"
+        )
+    
+    return ResumeIngestionResponse.model_validate(ingestion)
+
+
 @router.put("/me", response_model=ParsedProfileResponse)
 async def update_profile(
     profile_data: ProfileUpdate,
@@ -49,6 +49,43 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     UPLOAD_DIR: str = "uploads/resumes"
     
+    # Matching
+    MATCHING_MODEL_PATH: str = os.getenv("MATCHING_MODEL_PATH", "data/matching/tfidf_model.joblib")
+    MATCHING_VECTORIZER: str = os.getenv("MATCHING_VECTORIZER", "tfidf")  # "tfidf" (fitted vocabulary) or "hashing"
+    MATCHING_HASH_BITS: int = int(os.getenv("MATCHING_HASH_BITS", "18"))  # hashing mode: 2^18-2^20 columns
+    MATCHING_EMBEDDING_DIM: int = int(os.getenv("MATCHING_EMBEDDING_DIM", "0"))  # LSA width (128-256); 0 disables
+    MATCHING_EMBEDDING_PATH: str = os.getenv("MATCHING_EMBEDDING_PATH", "data/matching/lsa_embedding.joblib")
+    MATCHING_MODEL_RELOAD_INTERVAL: int = int(os.getenv("MATCHING_MODEL_RELOAD_INTERVAL", "60"))  # seconds
+    JOB_FEATURE_CACHE_SIZE: int = int(os.getenv("JOB_FEATURE_CACHE_SIZE", "2048"))
+    MATCH_CACHE_BACKEND: str = os.getenv("MATCH_CACHE_BACKEND", "memory")  # "memory", "redis" or "none"
+    MATCH_CACHE_SIZE: int = int(os.getenv("MATCH_CACHE_SIZE", "10000"))  # in-process entries
+    MATCH_CACHE_TTL: int = int(os.getenv("MATCH_CACHE_TTL", "3600"))  # seconds
+    MATCH_CACHE_URL: str = os.getenv("MATCH_CACHE_URL", "redis://localhost:6379/0")  # redis backend only
+    JOB_MATRIX_TTL: int = int(os.getenv("JOB_MATRIX_TTL", "300"))  # seconds before other workers' job edits show up
+    MATRIX_STORE_DIR: str = os.getenv("MATRIX_STORE_DIR", "data/matching/matrices")  # Memory-mapped candidate/job bundles
+    CANDIDATE_INDEX_SAVE_EVERY: int = int(os.getenv("CANDIDATE_INDEX_SAVE_EVERY", "100"))  # inserts between saves
+    SKILL_INDEX_TTL: int = int(os.getenv("SKILL_INDEX_TTL", "300"))  # seconds before other workers' uploads show up
+    RANK_PREFILTER_KEEP: float = float(os.getenv("RANK_PREFILTER_KEEP", "1.0"))  # top-k cascade: fraction kept by skill overlap
+    RANK_SCORE_KEEP: float = float(os.getenv("RANK_SCORE_KEEP", "1.0"))  # top-k cascade: fraction of scored rows passed to analysis (never fewer than top_k)
+    RESCORE_WORKERS: int = int(os.getenv("RESCORE_WORKERS", "2"))  # processes for bulk re-scoring
+    RESCORE_CHUNK_SIZE: int = int(os.getenv("RESCORE_CHUNK_SIZE", "1000"))  # applications per bulk UPDATE
+    
+    # CPU executor (PDF parsing and scoring off the event loop)
+    CPU_EXECUTOR_WORKERS: int = int(os.getenv("CPU_EXECUTOR_WORKERS", "2"))
+    CPU_EXECUTOR_MAX_QUEUE: int = int(os.getenv("CPU_EXECUTOR_MAX_QUEUE", "32"))  # queued + running tasks
+    CPU_TASK_TIMEOUT: float = float(os.getenv("CPU_TASK_TIMEOUT", "30"))  # seconds
+    RESUME_PARSE_BUDGET: float = float(os.getenv("RESUME_PARSE_BUDGET", "2"))  # seconds of experience/education extraction per resume; 0 disables
+    RESUME_CACHE_BACKEND: str = os.getenv("RESUME_CACHE_BACKEND", "memory")  # "memory", "redis" or "none"
+    RESUME_CACHE_MAX_BYTES: int = int(os.getenv("RESUME_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # in-process, compressed
+    RESUME_CACHE_TTL: int = int(os.getenv("RESUME_CACHE_TTL", str(7 * 24 * 3600)))  # seconds, redis backend only
+    RESUME_CACHE_URL: str = os.getenv("RESUME_CACHE_URL", "redis://localhost:6379/0")  # redis backend only
+    
+    # Asynchronous resume ingestion (DB-backed queue)
+    RESUME_INGESTION_WORKERS: int = int(os.getenv("RESUME_INGESTION_WORKERS", "2"))  # in-process worker tasks; 0 leaves the queue to scripts/run_ingestion_worker.py
+    RESUME_INGESTION_POLL_INTERVAL: float = float(os.getenv("RESUME_INGESTION_POLL_INTERVAL", "2"))  # seconds between queue polls when idle
+    RESUME_INGESTION_LEASE: float = float(os.getenv("RESUME_INGESTION_LEASE", "300"))  # seconds before a claimed upload is re-queued
+    RESUME_INGESTION_MAX_ATTEMPTS: int = int(os.getenv("RESUME_INGESTION_MAX_ATTEMPTS", "3"))
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
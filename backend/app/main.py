@@ -11,6 +11,10 @@ from app.core.config import settings
 from app.core.database import engine, Base
 from app.api.v1 import auth, jobs, applications, profiles, admin, analytics
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.services.matching_service import matching_service
+from app.services.rescoring import application_rescorer
+from app.services.executor import cpu_executor
+from app.services.resume_ingestion import resume_ingestion
 
 # Configure logging
 logging.basicConfig(
@@ -28,9 +32,14 @@ async def lifespan(app: FastAPI):
     # Note: Database migrations should be run manually using: alembic upgrade head
     # This ensures proper version control and migration history
     logger.info("Database migrations should be run with: alembic upgrade head")
+    resume_ingestion.start()
     yield
     # Shutdown
     logger.info("Shutting down HireSmart AI Job Portal API...")
+    await resume_ingestion.stop()
+    matching_service.save_candidate_index()
+    application_rescorer.shutdown()
+    cpu_executor.shutdown()
 
 
 app = FastAPI(
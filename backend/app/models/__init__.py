@@ -2,6 +2,8 @@ from app.models.user import User
 from app.models.job import Job
 from app.models.application import Application
 from app.models.parsed_profile import ParsedProfile
+from app.models.document_frequency import DocumentFrequency
+from app.models.resume_ingestion import ResumeIngestion
 
-__all__ = ["User", "Job", "Application", "ParsedProfile"]
+__all__ = ["User", "Job", "Application", "ParsedProfile", "DocumentFrequency", "ResumeIngestion"]
 
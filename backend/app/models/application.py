@@ -1,7 +1,7 @@
 """
 Application model for database
 """
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -23,7 +23,8 @@ class Application(Base):
         default="Pending"
     )  # Pending, Reviewing, Interviewed, Rejected, Accepted
     match_score = Column(Integer, nullable=False, default=0)  # 0-100
-    match_analysis = Column(Text, nullable=True)
+    match_facts = Column(JSON, nullable=True)  # Score components, skill ids and counts; see MatchFacts
+    match_analysis = Column(Text, nullable=True)  # Legacy stored prose, only for rows scored before match_facts
     applied_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
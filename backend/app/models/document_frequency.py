@@ -0,0 +1,20 @@
+"""
+DocumentFrequency model for incrementally maintained IDF statistics
+"""
+from sqlalchemy import Column, Integer, BigInteger
+
+from app.core.database import Base
+
+# Row whose df column holds the number of documents N
+DOCUMENT_COUNT_TERM = -1
+
+
+class DocumentFrequency(Base):
+    """Number of documents containing each hashed term column"""
+    __tablename__ = "document_frequencies"
+    
+    term = Column(Integer, primary_key=True, autoincrement=False)  # Hashed column, or DOCUMENT_COUNT_TERM
+    df = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<DocumentFrequency(term={self.term}, df={self.df})>"
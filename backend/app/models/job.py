@@ -1,7 +1,7 @@
 """
 Job model for database
 """
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, ARRAY, JSON, LargeBinary, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -27,6 +27,13 @@ class Job(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     is_active = Column(String(10), default="true", nullable=False)  # Store as string for simplicity
     
+    # Matching features, computed at write time
+    required_skills = Column(JSON, nullable=True)  # Skills extracted from description + requirements
+    feature_vector = Column(LargeBinary, nullable=True)  # int32 indices + float32 TF-IDF weights
+    feature_model_version = Column(String(50), nullable=True)  # TF-IDF model the vector was built with
+    required_skill_mask_lo = Column(BigInteger, nullable=True)  # required_skills as a bitmask, bits 0-63
+    required_skill_mask_hi = Column(BigInteger, nullable=True)  # required_skills bitmask, bits 64-127
+    
     # Relationships
     recruiter = relationship("User", back_populates="jobs", foreign_keys=[recruiter_id])
     applications = relationship("Application", back_populates="job", cascade="all, delete-orphan")
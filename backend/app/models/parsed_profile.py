@@ -1,7 +1,7 @@
 """
 ParsedProfile model for storing extracted resume data
 """
-from sqlalchemy import Column, String, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, ForeignKey, JSON, LargeBinary, BigInteger
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -19,6 +19,12 @@ class ParsedProfile(Base):
     experience = Column(JSON, nullable=False, default=list)  # Array of experience objects
     education = Column(JSON, nullable=False, default=list)  # Array of education objects
     summary = Column(Text, nullable=True)
+    resume_vector = Column(LargeBinary, nullable=True)  # int32 indices + float32 TF-IDF weights
+    vector_model_version = Column(String(50), nullable=True)  # TF-IDF model the vector was built with
+    resume_embedding = Column(LargeBinary, nullable=True)  # Fixed-width float32 LSA embedding
+    embedding_version = Column(String(50), nullable=True)  # LSA embedding the row was projected with
+    skill_mask_lo = Column(BigInteger, nullable=True)  # Skill bitmask over SKILL_KEYWORDS, bits 0-63
+    skill_mask_hi = Column(BigInteger, nullable=True)  # Skill bitmask, bits 64-127
     
     # Relationships
     user = relationship("User", back_populates="parsed_profile")
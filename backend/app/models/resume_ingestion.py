@@ -0,0 +1,36 @@
+"""
+ResumeIngestion model: durable queue of uploaded resumes awaiting parsing
+"""
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, LargeBinary, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+INGESTION_QUEUED = "queued"
+INGESTION_PROCESSING = "processing"
+INGESTION_COMPLETED = "completed"
+INGESTION_FAILED = "failed"
+
+
+class ResumeIngestion(Base):
+    """One uploaded resume PDF and the state of its parsing"""
+    __tablename__ = "resume_ingestions"
+    __table_args__ = (
+        Index("ix_resume_ingestions_status_created_at", "status", "created_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String(255), nullable=False)
+    content = Column(LargeBinary, nullable=True)  # Uploaded PDF; cleared once the profile is written
+    status = Column(String(20), nullable=False, default=INGESTION_QUEUED)  # queued, processing, completed, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)  # Latest claim by a worker
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<ResumeIngestion(id={self.id}, user_id={self.user_id}, status={self.status})>"
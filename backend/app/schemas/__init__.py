@@ -1,12 +1,12 @@
 from app.schemas.user import UserRole, UserCreate, UserLogin, UserResponse, Token
-from app.schemas.job import JobCreate, JobUpdate, JobResponse
-from app.schemas.application import ApplicationCreate, ApplicationResponse, ApplicationUpdate
-from app.schemas.profile import ParsedProfileResponse, ProfileUpdate
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobRecommendation, RescoreProgressResponse
+from app.schemas.application import ApplicationCreate, ApplicationResponse, ApplicationUpdate, RankedCandidateResponse
+from app.schemas.profile import ParsedProfileResponse, ProfileUpdate, ResumeIngestionResponse
 
 __all__ = [
     "UserRole", "UserCreate", "UserLogin", "UserResponse", "Token",
-    "JobCreate", "JobUpdate", "JobResponse",
-    "ApplicationCreate", "ApplicationResponse", "ApplicationUpdate",
-    "ParsedProfileResponse", "ProfileUpdate"
+    "JobCreate", "JobUpdate", "JobResponse", "JobRecommendation", "RescoreProgressResponse",
+    "ApplicationCreate", "ApplicationResponse", "ApplicationUpdate", "RankedCandidateResponse",
+    "ParsedProfileResponse", "ProfileUpdate", "ResumeIngestionResponse"
 ]
 
@@ -20,6 +20,16 @@ class ApplicationUpdate(BaseModel):
     status: Optional[str] = Field(None, pattern="^(Pending|Reviewing|Interviewed|Rejected|Accepted)$")
 
 
+class MatchDetailsResponse(BaseModel):
+    """Structured facts behind a match score"""
+    similarity_score: int
+    skill_bonus: int
+    matched_skills: List[str]
+    missing_skills: List[str]
+    experience_count: int
+    education_count: int
+
+
 class ApplicationResponse(BaseModel):
     """Schema for application response"""
     id: uuid.UUID
@@ -27,7 +37,8 @@ class ApplicationResponse(BaseModel):
     user_id: uuid.UUID
     status: str
     match_score: int
-    match_analysis: Optional[str] = None
+    match_analysis: Optional[str] = None  # Rendered for single-application views only
+    match_details: Optional[MatchDetailsResponse] = None
     applied_at: datetime
     updated_at: Optional[datetime] = None
     
@@ -43,7 +54,8 @@ class ApplicationWithCandidateResponse(BaseModel):
     user_id: uuid.UUID
     status: str
     match_score: int
-    match_analysis: Optional[str] = None
+    match_analysis: Optional[str] = None  # Rendered for single-application views only
+    match_details: Optional[MatchDetailsResponse] = None
     applied_at: datetime
     updated_at: Optional[datetime] = None
     candidate: Optional[UserResponse] = None
@@ -54,3 +66,12 @@ class ApplicationWithCandidateResponse(BaseModel):
         from_attributes = True
         orm_mode = True
 
+
+class RankedCandidateResponse(BaseModel):
+    """Schema for a live-ranked candidate (for recruiters)"""
+    application_id: Optional[uuid.UUID] = None  # None for talent pool candidates who have not applied
+    user_id: uuid.UUID
+    match_score: int
+    match_analysis: Optional[str] = None  # Rendered for single-application views only
+    match_details: Optional[MatchDetailsResponse] = None
+    candidate: Optional[UserResponse] = None
@@ -47,3 +47,20 @@ class JobResponse(JobBase):
         from_attributes = True
         orm_mode = True
 
+
+class JobRecommendation(BaseModel):
+    """Schema for a recommended job with the caller's match score"""
+    job: JobResponse
+    match_score: int
+    missing_skills: List[str] = Field(default_factory=list)
+
+
+class RescoreProgressResponse(BaseModel):
+    """Schema for the progress of a job's background re-scoring"""
+    job_id: uuid.UUID
+    status: str  # queued, running, completed, failed
+    total: int
+    completed: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -3,6 +3,7 @@ Profile Pydantic schemas
 """
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import uuid
 
 
@@ -35,6 +36,23 @@ class ParsedProfileResponse(BaseModel):
         orm_mode = True
 
 
+class ResumeIngestionResponse(BaseModel):
+    """Schema for the status of an asynchronous resume upload"""
+    id: uuid.UUID
+    user_id: uuid.UUID
+    filename: str
+    status: str  # queued, processing, completed, failed
+    attempts: int
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+        orm_mode = True
+
+
 class ProfileUpdate(BaseModel):
     """Schema for profile update"""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
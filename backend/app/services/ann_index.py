@@ -0,0 +1,315 @@
+"""
+Approximate nearest-neighbour index over candidate profile vectors
+
+Random-projection LSH for cosine similarity: every vector gets one
+n_bits sign signature per table, candidates sharing a bucket (or a bucket
+one bit away) with the query are gathered, and only those are re-ranked
+with an exact sparse dot product.
+
+Wide feature spaces (hashing mode) use very sparse random projections
+(Li et al.) so the projection matrix stays small.
+
+Persisted indexes are memory-mapped bundles (see mapped_arrays): the saved
+rows stay in the shared page cache as the read-only base, and only rows
+inserted since are held privately until the next save swaps in a new bundle.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, random as sparse_random, vstack
+
+from app.services.mapped_arrays import (
+    csr_arrays, current_bundle, mapped_csr, open_bundle, write_bundle, writer_lock
+)
+
+logger = logging.getLogger(__name__)
+
+# Above this many features the projection matrix is kept sparse
+DENSE_PROJECTION_LIMIT = 1 << 14
+
+BUNDLE_NAME = "candidates"
+
+
+class CandidateANNIndex:
+    """Multi-table SimHash index with exact re-ranking"""
+
+    def __init__(
+        self,
+        n_features: int,
+        model_version: str,
+        n_tables: int = 16,
+        n_bits: int = 12,
+        seed: int = 0
+    ):
+        self.n_features = n_features
+        self.model_version = model_version
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.seed = seed
+        self.projections = self._build_projections(n_features, n_tables * n_bits, seed)
+        self._bit_weights = (1 << np.arange(n_bits)).astype(np.int64)
+
+        self._lock = threading.RLock()
+        self.bundle: Optional[str] = None  # Directory of the mapped base, if any
+        self._reset()
+
+    def _reset(self) -> None:
+        """Empty state: no base rows, no inserts (lock held or not yet shared)"""
+        self._keys: List[Optional[str]] = []
+        self._ordinals: Dict[str, int] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(self.n_tables)]
+        self._code_chunks: List[np.ndarray] = []  # (rows x n_tables) codes in ordinal order
+        self._base = csr_matrix((0, self.n_features), dtype=np.float32)  # Memory-mapped when loaded
+        self._delta = csr_matrix((0, self.n_features), dtype=np.float32)  # Rows inserted since
+        self._pending: List[csr_matrix] = []
+        self._removed: Set[str] = set()  # Keys removed since the base was mapped
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    @staticmethod
+    def _build_projections(n_features: int, n_planes: int, seed: int):
+        """Gaussian hyperplanes, or +/-1 entries at density 1/sqrt(n_features) when wide"""
+        rng = np.random.default_rng(seed)
+        if n_features <= DENSE_PROJECTION_LIMIT:
+            return rng.standard_normal((n_features, n_planes)).astype(np.float32)
+
+        return sparse_random(
+            n_features, n_planes,
+            density=1 / np.sqrt(n_features),
+            format="csr",
+            dtype=np.float32,
+            random_state=rng,
+            data_rvs=lambda size: rng.choice(np.array([-1.0, 1.0], dtype=np.float32), size)
+        )
+
+    def _signatures(self, vectors: csr_matrix) -> np.ndarray:
+        """One n_bits bucket code per table for each row"""
+        projected = vectors @ self.projections
+        if issparse(projected):
+            projected = projected.toarray()
+        bits = np.asarray(projected) > 0
+        return bits.reshape(-1, self.n_tables, self.n_bits) @ self._bit_weights
+
+    def add(self, keys: List[str], vectors: csr_matrix) -> None:
+        """Insert or replace profiles (one row per key)"""
+        if not keys:
+            return
+
+        codes = self._signatures(vectors)
+        with self._lock:
+            self._insert(keys, codes)
+            self._pending.append(csr_matrix(vectors, dtype=np.float32))
+
+    def _insert(self, keys: List[str], codes: np.ndarray) -> None:
+        """Assign ordinals and bucket entries to new rows (lock held)"""
+        for key in keys:
+            self._remove(key)
+            self._removed.discard(key)
+
+        start = len(self._keys)
+        for offset, key in enumerate(keys):
+            ordinal = start + offset
+            self._keys.append(key)
+            self._ordinals[key] = ordinal
+            for table, code in enumerate(codes[offset]):
+                self._buckets[table].setdefault(int(code), []).append(ordinal)
+        self._code_chunks.append(codes)
+
+    @property
+    def unsaved(self) -> int:
+        """Rows inserted or removed since the base was mapped"""
+        with self._lock:
+            return len(self._keys) - self._base.shape[0] + len(self._removed)
+
+    def remove(self, key: str) -> None:
+        """Drop a profile from the index"""
+        with self._lock:
+            if key in self._ordinals:
+                self._remove(key)
+                self._removed.add(key)
+
+    def _remove(self, key: str) -> None:
+        """Tombstone a key (lock held); its rows stay until the next save"""
+        ordinal = self._ordinals.pop(key, None)
+        if ordinal is not None:
+            self._keys[ordinal] = None
+
+    def _vectors(self) -> Tuple[csr_matrix, csr_matrix]:
+        """Mapped base rows and private inserted rows, folding in pending inserts (lock held)"""
+        if self._pending:
+            self._delta = vstack([self._delta] + self._pending, format="csr")
+            self._pending = []
+        return self._base, self._delta
+
+    def _rows(self, ordinals: np.ndarray) -> csr_matrix:
+        """Stored rows for sorted ordinals, spanning base and inserted rows (lock held)"""
+        base, delta = self._vectors()
+        split = int(np.searchsorted(ordinals, base.shape[0]))
+        if split == len(ordinals):
+            return base[ordinals]
+        if split == 0:
+            return delta[ordinals - base.shape[0]]
+        return vstack([base[ordinals[:split]], delta[ordinals[split:] - base.shape[0]]], format="csr")
+
+    def search(self, query: csr_matrix, k: int, exact: bool = False) -> List[Tuple[str, float]]:
+        """
+        Top-k profiles by cosine similarity to the query vector
+
+        Args:
+            query: 1 x n_features L2-normalized row
+            k: Number of neighbours to return
+            exact: Score every profile instead of only LSH candidates
+        """
+        if self.n_features <= DENSE_PROJECTION_LIMIT:
+            query_column = query.toarray().ravel().astype(np.float32)
+        else:
+            query_column = csr_matrix(query, dtype=np.float32).T
+        with self._lock:
+            if exact:
+                ordinals = np.sort(np.fromiter(self._ordinals.values(), dtype=np.int64))
+            else:
+                ordinals = self._probe(self._signatures(query)[0])
+            if not len(ordinals):
+                return []
+
+            similarities = self._rows(ordinals) @ query_column
+            if issparse(similarities):
+                similarities = similarities.toarray().ravel()
+            keys = self._keys
+
+            order = np.argsort(-similarities, kind="stable")
+            results = []
+            for position in order:
+                key = keys[ordinals[position]]
+                if key is None:
+                    continue
+                results.append((key, float(similarities[position])))
+                if len(results) == k:
+                    break
+            return results
+
+    def _probe(self, codes: np.ndarray) -> np.ndarray:
+        """Sorted ordinals in the query's buckets and in buckets one bit away (lock held)"""
+        found = []
+        for table, code in enumerate(codes):
+            buckets = self._buckets[table]
+            code = int(code)
+            found.extend(buckets.get(code, ()))
+            for bit in range(self.n_bits):
+                found.extend(buckets.get(code ^ (1 << bit), ()))
+        return np.unique(np.array(found, dtype=np.int64))
+
+    def save(self, root: str, merge: bool = True) -> None:
+        """
+        Write the live rows as a new bundle under root and map it as the base
+
+        With merge, rows inserted here are applied on top of a bundle another
+        process saved since this one was mapped, so concurrent workers do not
+        drop each other's inserts. Without it (full rebuilds) this index
+        replaces whatever is on disk.
+        """
+        with writer_lock(root, BUNDLE_NAME), self._lock:
+            current = current_bundle(root, BUNDLE_NAME)
+            if merge and current is not None and current != self.bundle:
+                latest = self.load(root)
+                if latest is not None and latest.model_version == self.model_version:
+                    self._rebase(latest)
+
+            base, delta = self._vectors()
+            live = np.array(sorted(self._ordinals.values()), dtype=np.int64)
+            live_matrix = self._rows(live) if len(live) else base[:0]
+            codes = np.concatenate(self._code_chunks)[live] if len(live) else np.empty((0, self.n_tables))
+
+            arrays = {
+                "keys": np.array([self._keys[ordinal] for ordinal in live], dtype=str),
+                "codes": codes.astype(np.int64),
+                **csr_arrays(live_matrix, "vectors")
+            }
+            # Sparse projections are regenerated from the seed on load
+            if not issparse(self.projections):
+                arrays["projections"] = self.projections
+            meta = {
+                "n_features": self.n_features,
+                "n_tables": self.n_tables,
+                "n_bits": self.n_bits,
+                "seed": self.seed,
+                "model_version": self.model_version
+            }
+            directory = write_bundle(root, BUNDLE_NAME, arrays, meta)
+            self._map(directory)
+        logger.info(f"Saved candidate ANN index with {len(live)} profiles to {directory}")
+
+    def _rebase(self, latest: "CandidateANNIndex") -> None:
+        """Replay this index's unsaved rows and removals on top of a newer saved index (lock held)"""
+        base, delta = self._vectors()
+        n_base = base.shape[0]
+        local = [
+            (key, ordinal) for key, ordinal in self._ordinals.items() if ordinal >= n_base
+        ]
+        if local:
+            local.sort(key=lambda item: item[1])
+            latest.add([key for key, _ in local], delta[[ordinal - n_base for _, ordinal in local]])
+        for key in self._removed:
+            latest.remove(key)
+
+        with latest._lock:
+            latest._vectors()
+            self.bundle = latest.bundle
+            self._keys, self._ordinals, self._buckets = latest._keys, latest._ordinals, latest._buckets
+            self._code_chunks = latest._code_chunks
+            self._base, self._delta, self._pending = latest._base, latest._delta, []
+            self._removed = latest._removed
+
+    def _map(self, directory: str) -> None:
+        """Replace all state with the bundle at directory (lock held)"""
+        arrays, meta = open_bundle(directory)
+        self._reset()
+        self.bundle = directory
+        if "projections" in arrays:
+            self.projections = arrays["projections"]
+
+        keys = [str(key) for key in arrays["keys"]]
+        codes = arrays["codes"]
+        self._keys = list(keys)
+        self._ordinals = {key: ordinal for ordinal, key in enumerate(keys)}
+        self._code_chunks = [codes]
+        self._base = mapped_csr(arrays, "vectors", self.n_features)
+
+        # Buckets straight from the stored codes: no re-projection on load
+        for table in range(self.n_tables):
+            table_codes = np.asarray(codes[:, table])
+            order = np.argsort(table_codes, kind="stable")
+            sorted_codes = table_codes[order]
+            boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+            self._buckets[table] = {
+                int(group_codes[0]): group.tolist()
+                for group_codes, group in zip(np.split(sorted_codes, boundaries), np.split(order, boundaries))
+                if len(group)
+            }
+
+    @staticmethod
+    def current_bundle(root: str) -> Optional[str]:
+        """Directory of the index bundle currently published under root"""
+        return current_bundle(root, BUNDLE_NAME)
+
+    @classmethod
+    def load(cls, root: str) -> Optional["CandidateANNIndex"]:
+        """Map the current bundle under root, or None if none has been saved yet"""
+        directory = current_bundle(root, BUNDLE_NAME)
+        if directory is None:
+            return None
+
+        _, meta = open_bundle(directory)
+        index = cls(
+            meta["n_features"],
+            meta["model_version"],
+            n_tables=meta["n_tables"],
+            n_bits=meta["n_bits"],
+            seed=meta["seed"]
+        )
+        with index._lock:
+            index._map(directory)
+        return index
@@ -0,0 +1,121 @@
+"""
+Incrementally maintained document frequencies for the hashing model
+
+Every job and resume write applies the +1/-1 change of its document's
+hashed term columns to the document_frequencies table in the same
+transaction, so the IDF vector can be rebuilt from one O(vocab) read
+instead of a scan over every job and profile.
+"""
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.document_frequency import DocumentFrequency, DOCUMENT_COUNT_TERM
+from app.services.tfidf_model import build_hashing_vectorizer
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentFrequencyStore:
+    """Per-column document frequencies and N for one hash width"""
+
+    def __init__(self, n_features: int, batch_size: int = 5000):
+        self.n_features = n_features
+        self.batch_size = batch_size
+        self.hasher = build_hashing_vectorizer(n_features)
+
+    def document_terms(self, text: Optional[str]) -> np.ndarray:
+        """Distinct hashed columns of one document (empty for blank text)"""
+        if not text or not text.strip():
+            return np.empty(0, dtype=np.int64)
+        return np.unique(self.hasher.transform([text]).indices).astype(np.int64)
+
+    def apply(self, db: Session, old_text: Optional[str], new_text: Optional[str]) -> None:
+        """
+        Record a document being added, replaced or removed (caller commits)
+
+        Args:
+            old_text: Document text before the write, or None when added
+            new_text: Document text after the write, or None when removed
+        """
+        self.apply_many(db, [(old_text, new_text)])
+
+    def apply_many(self, db: Session, changes: Iterable[Tuple[Optional[str], Optional[str]]]) -> None:
+        """Record a batch of (old_text, new_text) document writes with one upsert (caller commits)"""
+        delta: Dict[int, int] = {}
+        for old_text, new_text in changes:
+            old_terms = self.document_terms(old_text)
+            new_terms = self.document_terms(new_text)
+
+            for term in np.setdiff1d(new_terms, old_terms, assume_unique=True):
+                delta[int(term)] = delta.get(int(term), 0) + 1
+            for term in np.setdiff1d(old_terms, new_terms, assume_unique=True):
+                delta[int(term)] = delta.get(int(term), 0) - 1
+
+            count_delta = int(len(new_terms) > 0) - int(len(old_terms) > 0)
+            if count_delta:
+                delta[DOCUMENT_COUNT_TERM] = delta.get(DOCUMENT_COUNT_TERM, 0) + count_delta
+
+        self._upsert(db, {term: change for term, change in delta.items() if change})
+
+    def _upsert(self, db: Session, delta: Dict[int, int]) -> None:
+        """Add delta to the stored counts, creating missing rows"""
+        if not delta:
+            return
+
+        # Ascending term order so concurrent writers lock rows in the same order
+        rows = [{"term": term, "df": delta[term]} for term in sorted(delta)]
+        for start in range(0, len(rows), self.batch_size):
+            statement = insert(DocumentFrequency).values(rows[start:start + self.batch_size])
+            db.execute(statement.on_conflict_do_update(
+                index_elements=[DocumentFrequency.term],
+                set_={"df": DocumentFrequency.df + statement.excluded.df}
+            ))
+
+    def rebuild(self, db: Session, documents: Iterable[str]) -> int:
+        """
+        Replace the stored counts with a full scan of the given documents
+
+        Returns:
+            Number of non-empty documents counted
+        """
+        df = np.zeros(self.n_features, dtype=np.int64)
+        n_documents = 0
+        for text in documents:
+            terms = self.document_terms(text)
+            if len(terms):
+                df[terms] += 1
+                n_documents += 1
+
+        db.query(DocumentFrequency).delete(synchronize_session=False)
+        columns = np.flatnonzero(df)
+        rows = [{"term": DOCUMENT_COUNT_TERM, "df": n_documents}]
+        rows.extend({"term": int(term), "df": int(df[term])} for term in columns)
+        for start in range(0, len(rows), self.batch_size):
+            db.bulk_insert_mappings(DocumentFrequency, rows[start:start + self.batch_size])
+        db.commit()
+
+        logger.info(f"Rebuilt document frequencies over {n_documents} documents, {len(columns)} columns")
+        return n_documents
+
+    def snapshot(self, db: Session) -> Tuple[np.ndarray, int]:
+        """
+        Current counts in O(vocab): only stored non-zero rows are read
+
+        Returns:
+            Tuple of (df array of length n_features, document count N)
+        """
+        rows = np.array(
+            db.query(DocumentFrequency.term, DocumentFrequency.df).filter(DocumentFrequency.df > 0).all(),
+            dtype=np.int64
+        ).reshape(-1, 2)
+        terms, counts = rows[:, 0], rows[:, 1]
+
+        df = np.zeros(self.n_features, dtype=np.int64)
+        in_range = (terms >= 0) & (terms < self.n_features)
+        df[terms[in_range]] = counts[in_range]
+        n_documents = int(counts[terms == DOCUMENT_COUNT_TERM].sum())
+        return df, n_documents
@@ -0,0 +1,162 @@
+"""
+Process pool for CPU-bound request work (PDF parsing, match scoring)
+
+Endpoints await run() instead of calling parsers and scorers inline, so a
+slow PDF or vectorizer fit never blocks the event loop. Submissions beyond
+the queue bound are rejected immediately rather than piling up. A task
+holds its queue slot until its worker is really free again; a task still
+running at its timeout gets the pool replaced, and the old pool's workers
+are killed once its other tasks have had time to finish.
+"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusyError(Exception):
+    """The executor queue is full"""
+
+
+class CPUExecutor:
+    """Bounded process pool with per-task timeouts and counters"""
+
+    def __init__(self, workers: int, max_queue: int, default_timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._pool_futures: Set[Future] = set()  # Submitted to the current pool and not yet done
+        self._counters = {
+            "submitted": 0, "completed": 0, "failed": 0, "timed_out": 0, "rejected": 0, "pools_recycled": 0
+        }
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use (lock held)"""
+        if self._pool is None:
+            # spawn: forking a threaded server can copy held locks into the children
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def run(self, fn: Callable, *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process and await the result
+
+        fn and args must be picklable: pass plain data, not ORM objects.
+
+        Raises:
+            ExecutorBusyError: max_queue tasks are already queued or running
+            asyncio.TimeoutError: the task did not finish within timeout seconds
+        """
+        with self._lock:
+            if self._in_flight >= self.max_queue:
+                self._counters["rejected"] += 1
+                raise ExecutorBusyError("Server is busy, please retry shortly")
+            self._in_flight += 1
+            self._counters["submitted"] += 1
+            future = self._get_pool().submit(fn, *args)
+            self._pool_futures.add(future)
+        # The slot is freed when the task really ends, not when its caller stops waiting
+        future.add_done_callback(self._release)
+
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout or self.default_timeout
+            )
+            outcome = "completed"
+            return result
+        except asyncio.TimeoutError:
+            outcome = "timed_out"
+            if not future.cancel():
+                # Already running: it keeps its worker until it returns, which a
+                # pathological input may never do
+                self._recycle_pool(future)
+            raise
+        finally:
+            self._record(fn.__name__, outcome, time.perf_counter() - started)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._pool_futures.discard(future)
+
+    def _recycle_pool(self, stuck: Future) -> None:
+        """Send new work to a fresh pool and retire the one running a timed-out task"""
+        with self._lock:
+            if stuck not in self._pool_futures:
+                return  # Finished meanwhile, or its pool was already retired
+            pool, others = self._pool, self._pool_futures - {stuck}
+            self._pool, self._pool_futures = None, set()
+            self._counters["pools_recycled"] += 1
+
+        # ProcessPoolExecutor has no public way to stop a running task, so its
+        # workers are killed directly; shutdown() forgets them, hence the copy
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False)
+        threading.Thread(
+            target=self._reap, args=(processes, others), name="cpu-executor-reaper", daemon=True
+        ).start()
+
+    def _reap(self, processes: List[Any], others: Set[Future]) -> None:
+        """Kill a retired pool's workers once its other tasks are done or past the default timeout"""
+        wait(others, timeout=self.default_timeout)
+        # The pool then fails its unfinished futures, which frees their slots
+        for process in processes:
+            process.terminate()
+        logger.warning(f"Killed {len(processes)} CPU executor workers after a task timed out")
+
+    def _record(self, task: str, outcome: str, seconds: float) -> None:
+        with self._lock:
+            self._counters[outcome] += 1
+            timing = self._timings.setdefault(task, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            timing["count"] += 1
+            timing["total_seconds"] += seconds
+            timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, outcome counters and per-task latency"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                **self._counters,
+                "tasks": {
+                    task: {
+                        "count": timing["count"],
+                        "avg_seconds": timing["total_seconds"] / timing["count"],
+                        "max_seconds": timing["max_seconds"]
+                    }
+                    for task, timing in self._timings.items()
+                }
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._pool_futures = set()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+cpu_executor = CPUExecutor(
+    settings.CPU_EXECUTOR_WORKERS,
+    settings.CPU_EXECUTOR_MAX_QUEUE,
+    settings.CPU_TASK_TIMEOUT
+)
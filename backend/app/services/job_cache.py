@@ -0,0 +1,84 @@
+"""
+Bounded LRU cache of per-job matching features
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class JobFeatures(NamedTuple):
+    """Everything the scorer needs from a job, computed once per job version"""
+    text: str
+    vector: Optional[csr_matrix]  # None when no corpus model is loaded
+    required_skills: List[str]
+    skill_mask: np.ndarray  # SKILL_MASK_WORDS uint64 words, the bitmask of required_skills
+
+
+CacheKey = Tuple[Hashable, Any, Optional[str]]  # (job id, updated_at, model version)
+
+
+class JobFeatureCache:
+    """Thread-safe LRU cache of JobFeatures keyed by (job id, updated_at, model version)"""
+
+    def __init__(self, max_size: int = 2048):
+        self.max_size = max_size
+        self._entries: "OrderedDict[CacheKey, JobFeatures]" = OrderedDict()
+        self._keys_by_job: Dict[Hashable, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> Optional[JobFeatures]:
+        """Return cached features and mark them as recently used"""
+        with self._lock:
+            features = self._entries.get(key)
+            if features is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return features
+
+    def put(self, key: CacheKey, features: JobFeatures) -> None:
+        """Store features, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = features
+            self._entries.move_to_end(key)
+            self._keys_by_job.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._forget(evicted)
+
+    def invalidate(self, job_id: Hashable) -> None:
+        """Drop every cached version of a job"""
+        with self._lock:
+            for key in self._keys_by_job.pop(job_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_job.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Size and hit/miss counters"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _forget(self, key: CacheKey) -> None:
+        """Remove an evicted key from the per-job index (lock held)"""
+        keys = self._keys_by_job.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_job[key[0]]
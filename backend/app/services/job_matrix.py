@@ -0,0 +1,181 @@
+"""
+Cached matrix of all active jobs for one-shot recommendation scoring
+
+Built matrices are also written as memory-mapped bundles, so other workers
+map a recent one instead of re-querying and re-stacking every job.
+"""
+import time
+import logging
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from app.services.mapped_arrays import csr_arrays, current_bundle, mapped_csr, open_bundle, write_bundle
+from app.services.skill_bitmask import mask_array, skill_mask
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_NAME = "jobs"
+
+
+class JobMatrix:
+    """Immutable snapshot of every active job's vector, skills and filter fields"""
+
+    def __init__(
+        self,
+        job_ids: List,
+        vectors: csr_matrix,
+        required_skills: List[List[str]],
+        locations: List[str],
+        types: List[str],
+        model_version: str,
+        embeddings: Optional[np.ndarray] = None,
+        skill_masks: Optional[np.ndarray] = None,
+        built_at: Optional[float] = None
+    ):
+        self.job_ids = job_ids
+        self.vectors = vectors
+        self.embeddings = embeddings  # Contiguous (jobs x dim) LSA rows when embeddings are enabled
+        self.required_skills = required_skills
+        # Filters are evaluated once per distinct value, then broadcast to rows
+        self.location_values, self.location_codes = np.unique(
+            np.array(locations, dtype=object), return_inverse=True
+        )
+        self.type_values, self.type_codes = np.unique(np.array(types, dtype=object), return_inverse=True)
+        self.model_version = model_version
+        self.built_wall_time = built_at or time.time()
+        self.built_at = time.monotonic() - (time.time() - self.built_wall_time)
+
+        # Required skills as (jobs x SKILL_MASK_WORDS) uint64 bitmasks, matched with AND + popcount
+        if skill_masks is None:
+            skill_masks = mask_array([skill_mask(skills) for skills in required_skills])
+        self.skill_masks = skill_masks
+        self.required_counts = np.array([len(skills) for skills in required_skills], dtype=np.int64)
+        self._locations = locations
+        self._types = types
+
+    def save(self, root: str) -> str:
+        """Write the matrix as the current jobs bundle under root"""
+        arrays = csr_arrays(self.vectors, "vectors")
+        arrays["skill_masks"] = self.skill_masks
+        if self.embeddings is not None:
+            arrays["embeddings"] = self.embeddings
+        meta = {
+            "job_ids": self.job_ids,
+            "required_skills": self.required_skills,
+            "locations": self._locations,
+            "types": self._types,
+            "model_version": self.model_version,
+            "n_features": self.vectors.shape[1],
+            "built_at": self.built_wall_time
+        }
+        return write_bundle(root, BUNDLE_NAME, arrays, meta)
+
+    @classmethod
+    def load(cls, root: str) -> Optional["JobMatrix"]:
+        """Map the current jobs bundle under root, or None if none has been written"""
+        directory = current_bundle(root, BUNDLE_NAME)
+        if directory is None:
+            return None
+
+        arrays, meta = open_bundle(directory)
+        return cls(
+            job_ids=meta["job_ids"],
+            vectors=mapped_csr(arrays, "vectors", meta["n_features"]),
+            required_skills=meta["required_skills"],
+            locations=meta["locations"],
+            types=meta["types"],
+            model_version=meta["model_version"],
+            embeddings=arrays.get("embeddings"),
+            skill_masks=arrays.get("skill_masks"),
+            built_at=meta["built_at"]
+        )
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def filter_mask(self, location: Optional[str] = None, job_type: Optional[str] = None) -> np.ndarray:
+        """Boolean mask of jobs matching the job board filters"""
+        mask = np.ones(len(self), dtype=bool)
+        if location:
+            # Same semantics as Job.location.ilike('%location%')
+            needle = location.lower()
+            matching = np.array([needle in value for value in self.location_values], dtype=bool)
+            mask &= matching[self.location_codes]
+        if job_type:
+            matching = np.array([value == job_type for value in self.type_values], dtype=bool)
+            mask &= matching[self.type_codes]
+        return mask
+
+
+class JobMatrixCache:
+    """
+    Holds the current JobMatrix and rebuilds it when invalidated or expired
+
+    With a root directory, a stale matrix is first replaced by the shared
+    bundle if another worker built one recently enough; otherwise the
+    rebuilt matrix is written there for the others.
+    """
+
+    def __init__(self, ttl: int, root: Optional[str] = None):
+        self.ttl = ttl
+        self.root = root
+        self._matrix: Optional[JobMatrix] = None
+        self._invalidated_at = 0.0  # Wall time of this worker's last job write
+        self._lock = threading.Lock()
+
+    def get(self, model_version: str, build: Callable[[], JobMatrix]) -> JobMatrix:
+        """Return the cached matrix, rebuilding it if stale"""
+        matrix = self._matrix
+        if matrix is not None and not self._is_stale(matrix, model_version):
+            return matrix
+
+        with self._lock:
+            matrix = self._matrix
+            if matrix is None or self._is_stale(matrix, model_version):
+                matrix = self._load_shared(model_version) or self._build_shared(build)
+                self._matrix = matrix
+            return matrix
+
+    def _load_shared(self, model_version: str) -> Optional[JobMatrix]:
+        """The shared bundle, if fresh and built after this worker's last job write"""
+        if self.root is None:
+            return None
+        try:
+            matrix = JobMatrix.load(self.root)
+        except Exception as e:
+            logger.error(f"Failed to map shared job matrix: {str(e)}")
+            return None
+
+        if (
+            matrix is None
+            or self._is_stale(matrix, model_version)
+            or matrix.built_wall_time < self._invalidated_at
+        ):
+            return None
+        return matrix
+
+    def _build_shared(self, build: Callable[[], JobMatrix]) -> JobMatrix:
+        """Build a matrix and publish it as the shared bundle"""
+        matrix = build()
+        if self.root is None:
+            return matrix
+        try:
+            matrix.save(self.root)
+            return JobMatrix.load(self.root) or matrix
+        except Exception as e:
+            logger.error(f"Failed to write shared job matrix: {str(e)}")
+            return matrix
+
+    def invalidate(self) -> None:
+        """Force a rebuild on next access (job created, updated or deleted)"""
+        self._invalidated_at = time.time()
+        self._matrix = None
+
+    def _is_stale(self, matrix: JobMatrix, model_version: str) -> bool:
+        return (
+            matrix.model_version != model_version
+            or time.monotonic() - matrix.built_at > self.ttl
+        )
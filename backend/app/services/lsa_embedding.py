@@ -0,0 +1,95 @@
+"""
+Optional LSA embedding stage on top of the TF-IDF model
+
+A TruncatedSVD fitted over the corpus TF-IDF matrix projects sparse vectors
+into a small dense float32 space where co-occurring terms ("ml" / "machine
+learning") land close together. Embeddings are L2-normalized fixed-width
+rows, so a stack of them is one contiguous array and scoring a job against
+every candidate is a single BLAS matrix-vector product.
+"""
+import os
+import logging
+from typing import List, Optional
+
+import joblib
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.decomposition import TruncatedSVD
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+
+class LSAEmbedding:
+    """
+    Projection of one TF-IDF model's vectors into a dim-dimensional space
+
+    Immutable once constructed, like the TF-IDF models it is fitted on.
+    """
+
+    def __init__(self, components: np.ndarray, base_version: str):
+        # (n_features x dim), so a CSR batch projects with one sparse @ dense product
+        self.components = np.ascontiguousarray(components, dtype=np.float32)
+        self.components.setflags(write=False)
+        self.base_version = base_version
+        self.version = f"{base_version}-lsa{self.dim}"
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("LSAEmbedding is immutable; fit or load a new one")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def fit(cls, tfidf_matrix: csr_matrix, base_version: str, dim: int) -> "LSAEmbedding":
+        """Fit the projection over the corpus TF-IDF matrix"""
+        dim = min(dim, tfidf_matrix.shape[1] - 1, tfidf_matrix.shape[0] - 1)
+        if dim < 1:
+            raise ValueError("Corpus is too small to fit an LSA embedding")
+
+        svd = TruncatedSVD(n_components=dim, algorithm="randomized", random_state=0)
+        svd.fit(tfidf_matrix)
+
+        logger.info(f"Fitted {dim}-dimensional LSA embedding for {base_version}, "
+                    f"explained variance {svd.explained_variance_ratio_.sum():.2f}")
+        return cls(svd.components_.T, base_version)
+
+    @property
+    def dim(self) -> int:
+        """Width of each embedding"""
+        return self.components.shape[1]
+
+    def transform(self, vectors: csr_matrix) -> np.ndarray:
+        """Project TF-IDF rows into L2-normalized float32 embeddings"""
+        embeddings = np.asarray(vectors @ self.components, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+
+    def encode(self, embedding: np.ndarray) -> bytes:
+        """Encode one embedding as dim little-endian float32 values"""
+        return np.asarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
+    def stack(self, blobs: List[bytes]) -> np.ndarray:
+        """Decode stored embeddings into one contiguous (len(blobs) x dim) array"""
+        return np.frombuffer(b"".join(blobs), dtype=EMBEDDING_DTYPE).reshape(len(blobs), self.dim)
+
+    def save(self, path: str) -> None:
+        """Persist the projection, replacing any previous file atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        joblib.dump({"components": self.components, "base_version": self.base_version}, tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved LSA embedding {self.version} to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["LSAEmbedding"]:
+        """Load a persisted projection, returning None if none has been fitted yet"""
+        if not os.path.exists(path):
+            return None
+
+        data = joblib.load(path)
+        return cls(data["components"], data["base_version"])
@@ -0,0 +1,132 @@
+"""
+Versioned, memory-mapped array bundles shared by every worker on a host
+
+A bundle is a directory of .npy files plus a small metadata file, written
+once and never modified. A pointer file names the current bundle and is
+replaced atomically, so readers see either the old bundle or the new one.
+Readers open the arrays with mmap_mode="r": all workers share the OS page
+cache instead of holding private copies, and a restart maps the files
+instead of recomputing them.
+"""
+import os
+import time
+import fcntl
+import shutil
+import logging
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import joblib
+import numpy as np
+from scipy.sparse import csr_matrix
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.joblib"
+
+
+def _pointer_path(root: str, name: str) -> str:
+    return os.path.join(root, f"{name}.current")
+
+
+def current_bundle(root: str, name: str) -> Optional[str]:
+    """Directory of the current bundle, or None if none has been written"""
+    try:
+        with open(_pointer_path(root, name)) as pointer:
+            bundle = pointer.read().strip()
+    except OSError:
+        return None
+    return os.path.join(root, bundle) if bundle else None
+
+
+@contextmanager
+def writer_lock(root: str, name: str) -> Iterator[None]:
+    """Serialize read-modify-write cycles on one bundle name across processes"""
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, f"{name}.lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def write_bundle(root: str, name: str, arrays: Dict[str, np.ndarray], meta: Any = None) -> str:
+    """
+    Write a new bundle and make it current
+
+    Returns:
+        Directory of the new bundle
+    """
+    bundle = f"{name}-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+    directory = os.path.join(root, bundle)
+    tmp_directory = f"{directory}.tmp"
+    os.makedirs(tmp_directory)
+
+    for key, array in arrays.items():
+        np.save(os.path.join(tmp_directory, f"{key}.npy"), np.ascontiguousarray(array), allow_pickle=False)
+    joblib.dump(meta, os.path.join(tmp_directory, META_FILE))
+    os.rename(tmp_directory, directory)
+
+    previous = current_bundle(root, name)
+    pointer = _pointer_path(root, name)
+    with open(f"{pointer}.tmp", "w") as tmp_pointer:
+        tmp_pointer.write(bundle)
+    os.replace(f"{pointer}.tmp", pointer)
+
+    # The previous bundle survives one more swap for readers that just resolved it
+    _prune(root, name, keep={bundle, os.path.basename(previous or "")})
+    logger.info(f"Wrote {name} bundle {bundle}")
+    return directory
+
+
+def open_bundle(directory: str) -> Tuple[Dict[str, np.ndarray], Any]:
+    """Memory-map every array of a bundle and load its metadata"""
+    arrays = {
+        file_name[:-len(".npy")]: np.load(os.path.join(directory, file_name), mmap_mode="r", allow_pickle=False)
+        for file_name in os.listdir(directory)
+        if file_name.endswith(".npy")
+    }
+    return arrays, joblib.load(os.path.join(directory, META_FILE))
+
+
+def csr_arrays(matrix: csr_matrix, prefix: str) -> Dict[str, np.ndarray]:
+    """The three arrays of a CSR matrix, keyed for write_bundle"""
+    # One index dtype for indices and indptr, or scipy copies them on load
+    index_dtype = np.int32 if matrix.nnz < np.iinfo(np.int32).max else np.int64
+    return {
+        f"{prefix}_data": matrix.data.astype(np.float32, copy=False),
+        f"{prefix}_indices": matrix.indices.astype(index_dtype, copy=False),
+        f"{prefix}_indptr": matrix.indptr.astype(index_dtype, copy=False)
+    }
+
+
+def mapped_csr(arrays: Dict[str, np.ndarray], prefix: str, n_columns: int) -> csr_matrix:
+    """CSR matrix whose arrays stay memory-mapped (no copy)"""
+    indptr = arrays[f"{prefix}_indptr"]
+    return csr_matrix(
+        (arrays[f"{prefix}_data"], arrays[f"{prefix}_indices"], indptr),
+        shape=(len(indptr) - 1, n_columns),
+        copy=False
+    )
+
+
+def _prune(root: str, name: str, keep: set, min_age: float = 60.0) -> None:
+    """
+    Delete superseded bundles of a name
+
+    Workers that still map an old bundle keep reading it after the unlink;
+    bundles younger than min_age are kept too, which also spares another
+    writer's in-progress temporary directory.
+    """
+    now = time.time()
+    for entry in os.listdir(root):
+        if not entry.startswith(f"{name}-") or entry in keep:
+            continue
+        path = os.path.join(root, entry)
+        try:
+            if os.path.isdir(path) and now - os.path.getmtime(path) > min_age:
+                shutil.rmtree(path)
+        except OSError:
+            pass
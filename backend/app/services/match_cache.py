@@ -0,0 +1,122 @@
+"""
+Cache of calculate_match_score results
+
+Keys are (job id, job updated_at, profile content hash, scoring model
+version), so an edited job, a re-uploaded resume or a new model simply
+stops hitting old entries; nothing has to be invalidated explicitly.
+Results live in a bounded in-process LRU with TTL by default, or in a
+shared store behind a Redis-style client (get / set with ex=).
+"""
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.services.match_facts import MatchFacts
+from app.services.shared_cache import SharedCache, build_cache
+
+MatchKey = Tuple[Hashable, Any, str, str]  # (job id, updated_at, profile hash, model version)
+MatchResult = Tuple[int, MatchFacts, List[str]]  # calculate_match_score's return value
+
+
+def profile_hash(parsed_profile: Any, resume_text: str = "") -> str:
+    """Content hash of everything calculate_match_score reads from a profile"""
+    content = json.dumps(
+        [
+            parsed_profile.skills,
+            parsed_profile.experience,
+            parsed_profile.education,
+            parsed_profile.summary,
+            resume_text
+        ],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class InProcessMatchCache:
+    """Thread-safe LRU cache of match results with a per-entry TTL"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[MatchKey, Tuple[float, MatchResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: MatchKey) -> Optional[MatchResult]:
+        """Return a cached result and mark it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: MatchKey, result: MatchResult) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters"""
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class SharedMatchCache(SharedCache):
+    """Match results in a store shared by every worker and replica"""
+
+    label = "Match cache"
+
+    def __init__(self, client: Any, ttl: float, prefix: str = "match:"):
+        super().__init__(client, ttl, prefix)
+
+    def _name(self, key: MatchKey) -> str:
+        job_id, updated_at, digest, model_version = key
+        return f"{self.prefix}{job_id}:{updated_at}:{digest}:{model_version}"
+
+    def _encode(self, result: MatchResult) -> str:
+        score, facts, missing_skills = result
+        return json.dumps({"score": score, "facts": facts.to_json(), "missing": missing_skills})
+
+    def _decode(self, raw: bytes) -> MatchResult:
+        data = json.loads(raw)
+        return data["score"], MatchFacts.from_json(data["facts"]), data["missing"]
+
+
+def build_match_cache(backend: str, max_size: int, ttl: float, url: Optional[str] = None):
+    """
+    Match cache for the configured backend (see build_cache): the in-process
+    LRU, or a SharedMatchCache on the Redis server at url
+    """
+    return build_cache(
+        backend,
+        url,
+        lambda: InProcessMatchCache(max_size, ttl),
+        lambda client: SharedMatchCache(client, ttl),
+        "match cache"
+    )
@@ -0,0 +1,144 @@
+"""
+Structured match facts and their lazily rendered analysis text
+
+The scorer records only what the analysis paragraph is derived from:
+score components, matched / missing skill ids (positions in SKILL_KEYWORDS,
+in requirement order) and experience / education counts. The English text
+is rendered on demand when a single application is viewed, through a
+memoized renderer, so rows and list payloads carry no repeated prose.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from app.services.skill_bitmask import SKILL_BITS
+from app.services.skill_matcher import SKILL_KEYWORDS
+
+ANALYSIS_CACHE_SIZE = 4096
+
+
+class MatchFacts(NamedTuple):
+    """Everything the analysis text of one match is rendered from"""
+    score: int
+    similarity_score: int  # int(cosine similarity * 100)
+    skill_bonus: int  # Up to 20 points for required skills the candidate has
+    matched_skills: Tuple[int, ...]  # Skill ids, in requirement order
+    missing_skills: Tuple[int, ...]
+    experience_count: int
+    education_count: int
+    note: Optional[str] = None  # Replaces the rendered text (no data, fallback scoring, errors)
+
+    @classmethod
+    def build(
+        cls,
+        score: int,
+        similarity_score: int,
+        skill_bonus: int,
+        matched_skills: List[str],
+        missing_skills: List[str],
+        experience_count: int,
+        education_count: int
+    ) -> "MatchFacts":
+        """Facts from canonical skill names (skills outside the vocabulary are dropped)"""
+        return cls(
+            score=score,
+            similarity_score=similarity_score,
+            skill_bonus=skill_bonus,
+            matched_skills=skill_ids(matched_skills),
+            missing_skills=skill_ids(missing_skills),
+            experience_count=experience_count,
+            education_count=education_count
+        )
+
+    @classmethod
+    def noted(cls, score: int, note: str) -> "MatchFacts":
+        """Facts of a match that has a fixed message instead of an analysis"""
+        return cls(score, 0, 0, (), (), 0, 0, note)
+
+    @property
+    def matched_skill_names(self) -> List[str]:
+        return [SKILL_KEYWORDS[skill_id] for skill_id in self.matched_skills]
+
+    @property
+    def missing_skill_names(self) -> List[str]:
+        return [SKILL_KEYWORDS[skill_id] for skill_id in self.missing_skills]
+
+    def details(self) -> Dict[str, Any]:
+        """Score components and skill names, as shipped in list responses"""
+        return {
+            "similarity_score": self.similarity_score,
+            "skill_bonus": self.skill_bonus,
+            "matched_skills": self.matched_skill_names,
+            "missing_skills": self.missing_skill_names,
+            "experience_count": self.experience_count,
+            "education_count": self.education_count
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """Compact form stored in Application.match_facts"""
+        data = {
+            "score": self.score,
+            "similarity": self.similarity_score,
+            "bonus": self.skill_bonus,
+            "matched": list(self.matched_skills),
+            "missing": list(self.missing_skills),
+            "experience": self.experience_count,
+            "education": self.education_count
+        }
+        if self.note is not None:
+            data["note"] = self.note
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MatchFacts":
+        return cls(
+            score=data["score"],
+            similarity_score=data["similarity"],
+            skill_bonus=data["bonus"],
+            matched_skills=tuple(data["matched"]),
+            missing_skills=tuple(data["missing"]),
+            experience_count=data["experience"],
+            education_count=data["education"],
+            note=data.get("note")
+        )
+
+
+def skill_ids(skills: List[str]) -> Tuple[int, ...]:
+    """Vocabulary positions of canonical skill names"""
+    return tuple(SKILL_BITS[skill] for skill in skills if skill in SKILL_BITS)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def render_analysis(facts: MatchFacts) -> str:
+    """Human-readable analysis of a match"""
+    if facts.note is not None:
+        return facts.note
+
+    analysis_parts = []
+
+    # Score interpretation
+    if facts.score >= 80:
+        analysis_parts.append("Excellent match! The candidate's profile strongly aligns with the job requirements.")
+    elif facts.score >= 60:
+        analysis_parts.append("Good match. The candidate has relevant skills and experience.")
+    elif facts.score >= 40:
+        analysis_parts.append("Moderate match. Some relevant experience but missing key requirements.")
+    else:
+        analysis_parts.append("Weak match. Significant gaps between candidate profile and job requirements.")
+
+    # Skills analysis
+    if facts.matched_skills:
+        analysis_parts.append(f"Matched skills: {', '.join(facts.matched_skill_names[:5])}.")
+
+    if facts.missing_skills:
+        analysis_parts.append(f"Missing skills: {', '.join(facts.missing_skill_names[:5])}.")
+
+    # Experience analysis
+    if facts.experience_count:
+        analysis_parts.append(f"Candidate has {facts.experience_count} previous position(s).")
+
+    # Education analysis
+    if facts.education_count:
+        analysis_parts.append(f"Candidate has {facts.education_count} education qualification(s).")
+
+    return " ".join(analysis_parts)
+
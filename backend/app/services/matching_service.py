@@ -1,28 +1,258 @@
 """
 AI-powered resume-job matching service using TF-IDF and Cosine Similarity
 """
+import os
+import time
+import threading
+import multiprocessing
 import logging
-from typing import Dict, List, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.orm import Session
 import numpy as np
+from scipy.sparse import csr_matrix, vstack
 
+from app.core.config import settings
 from app.models.job import Job
 from app.models.parsed_profile import ParsedProfile
+from app.models.user import User
+from app.services.tfidf_model import (
+    HashingTfidfModel, MatchingModel, TfidfModel, build_vectorizer, load_model
+)
+from app.services.df_store import DocumentFrequencyStore
+from app.services.lsa_embedding import LSAEmbedding
+from app.services.sparse_vectors import encode_vector, decode_vector, stack_vectors
+from app.services.job_cache import JobFeatureCache, JobFeatures
+from app.services.job_matrix import JobMatrix, JobMatrixCache
+from app.services.skill_matcher import JOB_SKILL_KEYWORDS, skill_matcher
+from app.services.skill_bitmask import mask_array, popcount, skill_mask, split_skills
+from app.services.match_facts import MatchFacts
+from app.services.match_cache import MatchKey, build_match_cache, profile_hash
+from app.services.ann_index import CandidateANNIndex
+from app.services.ranking_stats import CascadeStats
 
 logger = logging.getLogger(__name__)
 
+JOB_SKILLS = frozenset(JOB_SKILL_KEYWORDS)
+NO_DATA = MatchFacts.noted(0, "Insufficient data for matching")
+SCORING_ERROR = "Error calculating match"  # Prefix of the note on failed scorings, which are never cached
+
 
 class MatchingService:
-    """Service for matching resumes to job postings"""
-    
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(
-            max_features=500,
-            stop_words='english',
-            ngram_range=(1, 2),
-            min_df=1
+    """
+    Service for matching resumes to job postings
+    
+    Safe to call from many threads: the loaded model is immutable and is
+    only ever replaced as a whole, and every scoring call reads it once and
+    keeps all per-call state (matrices, throwaway vectorizers) local.
+    
+    With MATCHING_VECTORIZER=hashing the model is a HashingTfidfModel: terms
+    are hashed into 2^MATCHING_HASH_BITS columns, so replicas need only share
+    the IDF vector, and until one is fitted they score with uniform IDF.
+    
+    With MATCHING_EMBEDDING_DIM set, similarities are computed in an LSA
+    space fitted on top of the model, from stored fixed-width profile
+    embeddings where current.
+    """
+    
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or settings.MATCHING_MODEL_PATH
+        self.hashing = settings.MATCHING_VECTORIZER == "hashing"
+        self.df_store = DocumentFrequencyStore(1 << settings.MATCHING_HASH_BITS) if self.hashing else None
+        self.model: Optional[MatchingModel] = None
+        self._model_mtime: Optional[float] = None
+        self.embedding: Optional[LSAEmbedding] = None
+        self._embedding_mtime: Optional[float] = None
+        self._last_reload_check = 0.0
+        self.job_cache = JobFeatureCache(settings.JOB_FEATURE_CACHE_SIZE)
+        self.match_cache = build_match_cache(
+            settings.MATCH_CACHE_BACKEND, settings.MATCH_CACHE_SIZE, settings.MATCH_CACHE_TTL, settings.MATCH_CACHE_URL
+        )
+        self.job_matrix = JobMatrixCache(settings.JOB_MATRIX_TTL, settings.MATRIX_STORE_DIR)
+        self.cascade_stats = CascadeStats()
+        self.candidate_index: Optional[CandidateANNIndex] = None
+        self._index_inserts_since_save = 0
+        self._reload_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        
+        if not self.reload_model() and self.hashing:
+            self.model = HashingTfidfModel.unweighted(1 << settings.MATCHING_HASH_BITS)
+            logger.info(
+                f"No IDF vector loaded from {self.model_path}; hashing with uniform IDF "
+                "until scripts/fit_matching_model.py fits one."
+            )
+        elif self.model is None:
+            logger.warning(
+                f"No TF-IDF model loaded from {self.model_path}. "
+                "Run scripts/fit_matching_model.py to fit one."
+            )
+        self._load_candidate_index()
+    
+    @property
+    def model_version(self) -> Optional[str]:
+        """Version of the corpus model in use, or None when unfitted"""
+        model = self.model
+        return model.version if model else None
+    
+    def reload_model(self) -> bool:
+        """Load the persisted corpus model if it changed on disk"""
+        with self._reload_lock:
+            return self._reload_model()
+    
+    def _reload_model(self) -> bool:
+        """Swap in the model file if it changed (reload lock held)"""
+        self._last_reload_check = time.monotonic()
+        if settings.MATCHING_EMBEDDING_DIM:
+            self._reload_embedding()
+        
+        try:
+            mtime = os.path.getmtime(self.model_path)
+        except OSError:
+            return False
+        
+        if self.model is not None and mtime == self._model_mtime:
+            return False
+        
+        try:
+            model = load_model(self.model_path)
+        except Exception as e:
+            logger.error(f"Failed to load TF-IDF model: {str(e)}")
+            return False
+        
+        if model is None:
+            return False
+        
+        if isinstance(model, HashingTfidfModel) != self.hashing:
+            logger.warning(
+                f"Ignoring model {model.version} at {self.model_path}: it does not match "
+                f"MATCHING_VECTORIZER={settings.MATCHING_VECTORIZER}"
+            )
+            self._model_mtime = mtime
+            return False
+        
+        # A single reference assignment: concurrent callers see the old or the new model
+        self.model = model
+        self._model_mtime = mtime
+        logger.info(f"Loaded TF-IDF model {model.version}")
+        return True
+    
+    def _reload_embedding(self) -> None:
+        """Swap in the LSA embedding file if it changed (reload lock held)"""
+        try:
+            mtime = os.path.getmtime(settings.MATCHING_EMBEDDING_PATH)
+        except OSError:
+            return
+        if mtime == self._embedding_mtime:
+            return
+        
+        try:
+            embedding = LSAEmbedding.load(settings.MATCHING_EMBEDDING_PATH)
+        except Exception as e:
+            logger.error(f"Failed to load LSA embedding: {str(e)}")
+            return
+        
+        self.embedding = embedding
+        self._embedding_mtime = mtime
+        if embedding is not None:
+            logger.info(f"Loaded LSA embedding {embedding.version}")
+    
+    def current_embedding(self, model: Optional[MatchingModel]) -> Optional[LSAEmbedding]:
+        """The loaded LSA embedding if enabled and fitted on the given model"""
+        embedding = self.embedding
+        if not settings.MATCHING_EMBEDDING_DIM or embedding is None or model is None:
+            return None
+        return embedding if embedding.base_version == model.version else None
+    
+    def current_model(self) -> Optional[MatchingModel]:
+        """
+        Snapshot of the corpus model for one call
+        
+        Picks up a model refitted by another worker at most once per interval;
+        callers never wait for a reload already running in another thread.
+        """
+        if time.monotonic() - self._last_reload_check >= settings.MATCHING_MODEL_RELOAD_INTERVAL:
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    self._reload_model()
+                    self._load_candidate_index()
+                finally:
+                    self._reload_lock.release()
+        return self.model
+    
+    def _corpus_documents(self, db: Session) -> List[str]:
+        """Matching text of every job and parsed profile"""
+        documents = [self.extract_job_requirements(job) for job in db.query(Job).all()]
+        
+        profiles = db.query(ParsedProfile, User.resume_text).join(
+            User, User.id == ParsedProfile.user_id
+        ).all()
+        documents.extend(
+            self.extract_resume_text(profile, resume_text or "")
+            for profile, resume_text in profiles
         )
+        return documents
+    
+    def fit_model(self, db: Session, rebuild_frequencies: bool = False) -> MatchingModel:
+        """
+        Fit the corpus model over all jobs and parsed profiles and persist it
+        
+        In hashing mode the IDF vector is derived from the incrementally
+        maintained document frequencies; the corpus is only scanned to seed
+        them (first fit, or rebuild_frequencies=True).
+        """
+        documents = None
+        if self.hashing:
+            df, n_documents = self.df_store.snapshot(db)
+            if rebuild_frequencies or n_documents == 0:
+                documents = self._corpus_documents(db)
+                self.df_store.rebuild(db, documents)
+                df, n_documents = self.df_store.snapshot(db)
+            model = HashingTfidfModel.from_document_frequencies(df, n_documents)
+        else:
+            documents = self._corpus_documents(db)
+            model = TfidfModel.fit(documents)
+        with self._reload_lock:
+            model.save(self.model_path)
+            self.model = model
+            self._model_mtime = os.path.getmtime(self.model_path)
+        
+        if settings.MATCHING_EMBEDDING_DIM:
+            self.fit_embedding(db, model, documents)
+        return model
+    
+    def fit_embedding(
+        self,
+        db: Session,
+        model: MatchingModel,
+        documents: Optional[List[str]] = None
+    ) -> LSAEmbedding:
+        """Fit the LSA embedding over the corpus vectors of a model and persist it"""
+        if documents is None:
+            documents = self._corpus_documents(db)
+        tfidf_matrix = model.transform(documents)
+        embedding = LSAEmbedding.fit(tfidf_matrix, model.version, settings.MATCHING_EMBEDDING_DIM)
+        with self._reload_lock:
+            embedding.save(settings.MATCHING_EMBEDDING_PATH)
+            self.embedding = embedding
+            self._embedding_mtime = os.path.getmtime(settings.MATCHING_EMBEDDING_PATH)
+        return embedding
+    
+    def record_document_change(self, db: Session, old_text: Optional[str], new_text: Optional[str]) -> None:
+        """
+        Update document frequencies for a job or resume write (hashing mode only)
+        
+        Call before committing the write so both land in one transaction;
+        old_text is None for a new document and new_text None for a deleted one.
+        """
+        if self.df_store is not None:
+            self.df_store.apply(db, old_text, new_text)
+    
+    def record_document_changes(
+        self, db: Session, changes: List[Tuple[Optional[str], Optional[str]]]
+    ) -> None:
+        """Batch form of record_document_change: one upsert for many (old_text, new_text) writes"""
+        if self.df_store is not None:
+            self.df_store.apply_many(db, changes)
     
     def extract_job_requirements(self, job: Job) -> str:
         """Extract and combine job requirements into a single text"""
@@ -69,90 +299,528 @@ class MatchingService:
         self,
         job: Job,
         parsed_profile: ParsedProfile,
-        resume_text: str = ""
-    ) -> Tuple[int, str, List[str]]:
+        resume_text: str = "",
+        use_cache: bool = True
+    ) -> Tuple[int, MatchFacts, List[str]]:
         """
         Calculate match score between a job and a resume
         
+        Results are cached per (job version, profile content, model version)
+        in self.match_cache; transient jobs without an id are not cached.
+        Scoring in a worker process passes use_cache=False and leaves the
+        cache to the caller (see cached_match_score).
+        
         Returns:
-            Tuple of (score: int, analysis: str, missing_skills: List[str])
+            Tuple of (score: int, facts: MatchFacts, missing_skills: List[str])
         """
         try:
-            # Extract texts
-            job_text = self.extract_job_requirements(job)
-            resume_text_combined = self.extract_resume_text(parsed_profile, resume_text)
-            
-            if not job_text or not resume_text_combined:
-                return 0, "Insufficient data for matching", []
-            
-            # Vectorize texts
-            texts = [job_text, resume_text_combined]
-            try:
-                tfidf_matrix = self.vectorizer.fit_transform(texts)
-            except ValueError as e:
-                logger.warning(f"Vectorization error: {e}. Using fallback method.")
-                return self._calculate_fallback_score(job, parsed_profile)
+            model = self.current_model()
+            key = self._match_cache_key(job, parsed_profile, resume_text, model) if use_cache else None
+            if key is not None:
+                cached = self.match_cache.get(key)
+                if cached is not None:
+                    return cached
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            result = self._score_pair(job, parsed_profile, resume_text, model)
+            if key is not None:
+                self.match_cache.put(key, result)
+            return result
             
-            # Convert similarity (0-1) to score (0-100)
-            base_score = int(similarity * 100)
-            
-            # Extract required skills from job
-            required_skills = self._extract_skills_from_text(job_text)
-            candidate_skills = [skill.lower() for skill in parsed_profile.skills] if parsed_profile.skills else []
+        except Exception as e:
+            logger.error(f"Error calculating match score: {str(e)}")
+            return 0, MatchFacts.noted(0, f"{SCORING_ERROR}: {str(e)}"), []
+    
+    def cached_match_score(
+        self,
+        job: Job,
+        parsed_profile: ParsedProfile,
+        resume_text: str = ""
+    ) -> Tuple[Optional[MatchKey], Optional[Tuple[int, MatchFacts, List[str]]]]:
+        """
+        Look up a pair in this process's match cache before scoring it elsewhere
+        
+        Returns:
+            (cache key, cached result); the key is None when the pair cannot be
+            cached, the result None on a miss
+        """
+        key = self._match_cache_key(job, parsed_profile, resume_text, self.current_model())
+        if key is None:
+            return None, None
+        return key, self.match_cache.get(key)
+    
+    def cache_match_score(self, key: Optional[MatchKey], result: Tuple[int, MatchFacts, List[str]]) -> None:
+        """Store a result scored elsewhere under a key from cached_match_score; errors are not cached"""
+        note = result[1].note
+        if key is not None and not (note and note.startswith(SCORING_ERROR)):
+            self.match_cache.put(key, result)
+    
+    def _match_cache_key(
+        self,
+        job: Job,
+        parsed_profile: ParsedProfile,
+        resume_text: str,
+        model: Optional[MatchingModel]
+    ) -> Optional[MatchKey]:
+        """Cache key of one (job, profile) pair, or None when it cannot be cached"""
+        job_id = getattr(job, "id", None)
+        if self.match_cache is None or job_id is None:
+            return None
+        
+        embedding = self.current_embedding(model)
+        version = embedding.version if embedding else (model.version if model else "unfitted")
+        return job_id, getattr(job, "updated_at", None), profile_hash(parsed_profile, resume_text), version
+    
+    def _score_pair(
+        self,
+        job: Job,
+        parsed_profile: ParsedProfile,
+        resume_text: str,
+        model: Optional[MatchingModel]
+    ) -> Tuple[int, MatchFacts, List[str]]:
+        """calculate_match_score for an explicit model snapshot, uncached"""
+        # Job side comes from the feature cache; the resume side uses
+        # the stored vector when current
+        job_features = self._job_features(job, model)
+        if not job_features.text:
+            return 0, NO_DATA, []
+        
+        # Vectorize texts and calculate cosine similarity
+        try:
+            similarities, has_data = self._candidate_similarities(
+                job_features, [(parsed_profile, resume_text)], model
+            )
+            if not has_data[0]:
+                return 0, NO_DATA, []
+            similarity = similarities[0]
+        except ValueError as e:
+            logger.warning(f"Vectorization error: {e}. Using fallback method.")
+            return self._calculate_fallback_score(job, parsed_profile)
+        
+        # Convert similarity (0-1) to score (0-100)
+        base_score = int(similarity * 100)
+        
+        # Required skills from job
+        required_skills = job_features.required_skills
+        matched_mask = self.profile_skill_masks([parsed_profile])[0] & job_features.skill_mask
+        
+        # Calculate skill match bonus
+        skill_match_ratio = int(popcount(matched_mask)[0]) / len(required_skills) if required_skills else 0
+        
+        # Adjust score based on skill match
+        skill_bonus = int(skill_match_ratio * 20)  # Up to 20 points bonus
+        final_score = min(100, base_score + skill_bonus)
+        
+        # Matched and missing skills, in requirement order
+        matched_skills, missing_skills = split_skills(required_skills, matched_mask)
+        
+        # Facts the analysis text is rendered from
+        facts = self._match_facts(
+            final_score,
+            base_score,
+            skill_bonus,
+            matched_skills,
+            missing_skills,
+            parsed_profile
+        )
+        
+        return final_score, facts, missing_skills[:10]  # Limit missing skills
+    
+    def job_features(self, job: Job) -> JobFeatures:
+        """Text, vector and required skills of a job, cached per job version"""
+        return self._job_features(job, self.current_model())
+    
+    def _job_features(self, job: Job, model: Optional[MatchingModel]) -> JobFeatures:
+        """job_features for an explicit model snapshot"""
+        job_id = getattr(job, "id", None)
+        key = (job_id, getattr(job, "updated_at", None), model.version if model else None)
+        
+        if job_id is not None:
+            features = self.job_cache.get(key)
+            if features is not None:
+                return features
+        
+        text = self.extract_job_requirements(job)
+        if (
+            model is not None
+            and getattr(job, "feature_vector", None) is not None
+            and getattr(job, "feature_model_version", None) == model.version
+        ):
+            # Persisted at write time: no tokenization needed
+            required_skills = list(job.required_skills or [])
+            stored_mask = (
+                getattr(job, "required_skill_mask_lo", None),
+                getattr(job, "required_skill_mask_hi", None)
+            )
+            features = JobFeatures(
+                text=text,
+                vector=decode_vector(job.feature_vector, model.n_features),
+                required_skills=required_skills,
+                skill_mask=mask_array([
+                    stored_mask if None not in stored_mask else skill_mask(required_skills)
+                ])[0]
+            )
+        else:
+            required_skills = self._extract_skills_from_text(text)
+            features = JobFeatures(
+                text=text,
+                vector=model.transform([text]) if model is not None and text else None,
+                required_skills=required_skills,
+                skill_mask=mask_array([skill_mask(required_skills)])[0]
+            )
+        
+        if job_id is not None:
+            self.job_cache.put(key, features)
+        return features
+    
+    def apply_job_features(self, job: Job) -> None:
+        """Persist a job's vector and required skills on its row at write time"""
+        model = self.current_model()
+        text = self.extract_job_requirements(job)
+        
+        job.required_skills = self._extract_skills_from_text(text)
+        job.required_skill_mask_lo, job.required_skill_mask_hi = skill_mask(job.required_skills)
+        if model is not None:
+            job.feature_vector = encode_vector(model.transform([text]))
+            job.feature_model_version = model.version
+        else:
+            job.feature_vector = None
+            job.feature_model_version = None
+    
+    def invalidate_job(self, job_id) -> None:
+        """Forget cached features of a created, updated or deleted job"""
+        self.job_cache.invalidate(job_id)
+        self.job_matrix.invalidate()
+    
+    @staticmethod
+    def profile_skill_masks(parsed_profiles: List[ParsedProfile]) -> np.ndarray:
+        """(profiles x SKILL_MASK_WORDS) uint64 skill bitmasks, from the stored columns when set"""
+        return mask_array([
+            (parsed_profile.skill_mask_lo, parsed_profile.skill_mask_hi)
+            if getattr(parsed_profile, "skill_mask_lo", None) is not None
+            else skill_mask(parsed_profile.skills or [])
+            for parsed_profile in parsed_profiles
+        ])
+    
+    @staticmethod
+    def _has_current_vector(parsed_profile: ParsedProfile, model: Optional[MatchingModel]) -> bool:
+        """Whether the profile carries a vector from the given model"""
+        return (
+            model is not None
+            and getattr(parsed_profile, "resume_vector", None) is not None
+            and getattr(parsed_profile, "vector_model_version", None) == model.version
+        )
+    
+    def compute_profile_vector(
+        self,
+        parsed_profile: ParsedProfile,
+        resume_text: str = ""
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Vectorize a profile once for storage
+        
+        Returns:
+            Tuple of (encoded vector, model version), or (None, None) without a model
+        """
+        model = self.current_model()
+        if model is None:
+            return None, None
+        
+        text = self.extract_resume_text(parsed_profile, resume_text)
+        return encode_vector(model.transform([text])), model.version
+    
+    def compute_profile_embedding(
+        self,
+        parsed_profile: ParsedProfile,
+        resume_text: str = ""
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Project a profile into the LSA space once for storage
+        
+        Call after compute_profile_vector so the fresh vector is reused.
+        
+        Returns:
+            Tuple of (encoded embedding, embedding version), or (None, None) when disabled
+        """
+        model = self.current_model()
+        embedding = self.current_embedding(model)
+        if embedding is None:
+            return None, None
+        
+        vector = self.candidate_matrix([(parsed_profile, resume_text)], model)
+        return embedding.encode(embedding.transform(vector)[0]), embedding.version
+    
+    def compute_profile_features(
+        self,
+        candidates: List[Tuple[ParsedProfile, str]]
+    ) -> List[Tuple[Optional[bytes], Optional[str], Optional[bytes], Optional[str]]]:
+        """
+        Batch form of compute_profile_vector and compute_profile_embedding:
+        one transform and one projection for many profiles
+        
+        Returns:
+            One (vector, model version, embedding, embedding version) tuple per candidate
+        """
+        model = self.current_model()
+        if model is None or not candidates:
+            return [(None, None, None, None)] * len(candidates)
+        
+        matrix = self.candidate_matrix(candidates, model)
+        embedding = self.current_embedding(model)
+        embeddings = embedding.transform(matrix) if embedding is not None else None
+        return [
+            (
+                encode_vector(matrix[row]),
+                model.version,
+                embedding.encode(embeddings[row]) if embedding is not None else None,
+                embedding.version if embedding is not None else None
+            )
+            for row in range(len(candidates))
+        ]
+    
+    def candidate_matrix(
+        self,
+        candidates: List[Tuple[ParsedProfile, str]],
+        model: Optional[MatchingModel] = None
+    ) -> csr_matrix:
+        """
+        Build the candidate matrix for a model (the loaded one by default)
+        
+        Stored vectors are decoded as-is; only profiles without a current
+        vector are vectorized from text, all in one transform call.
+        """
+        model = model or self.current_model()
+        stored_rows = [
+            row for row, (parsed_profile, _) in enumerate(candidates)
+            if self._has_current_vector(parsed_profile, model)
+        ]
+        stored_set = set(stored_rows)
+        text_rows = [row for row in range(len(candidates)) if row not in stored_set]
+        
+        return self._assemble_matrix(
+            model,
+            stored_rows,
+            [candidates[row][0].resume_vector for row in stored_rows],
+            text_rows,
+            [self.extract_resume_text(*candidates[row]) for row in text_rows]
+        )
+    
+    @staticmethod
+    def _assemble_matrix(
+        model: MatchingModel,
+        stored_rows: List[int],
+        stored_blobs: List[bytes],
+        text_rows: List[int],
+        texts: List[str]
+    ) -> csr_matrix:
+        """Stack stored vectors and freshly transformed texts back into row order"""
+        stored = stack_vectors(stored_blobs, model.n_features)
+        if not text_rows:
+            return stored
+        
+        computed = model.transform(texts).astype(np.float32)
+        order = np.argsort(np.array(stored_rows + text_rows))
+        return vstack([stored, computed], format="csr")[order]
+    
+    def _candidate_similarities(
+        self,
+        job_features: JobFeatures,
+        candidates: List[Tuple[ParsedProfile, str]],
+        model: Optional[MatchingModel]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine similarity of each candidate against the job
+        
+        Returns:
+            Tuple of (similarities, has_data) arrays, one entry per candidate
+        """
+        has_data = np.array([
+            self._has_current_vector(parsed_profile, model)
+            or bool(self.extract_resume_text(parsed_profile, resume_text))
+            for parsed_profile, resume_text in candidates
+        ], dtype=bool)
+        
+        if model is None or job_features.vector is None:
+            # No corpus model yet: fit a throwaway vectorizer on these texts
+            resume_texts = [self.extract_resume_text(*candidate) for candidate in candidates]
+            tfidf_matrix = build_vectorizer().fit_transform([job_features.text] + resume_texts)
+            return self.cosine_scores(tfidf_matrix[0], tfidf_matrix[1:]), has_data
+        
+        embedding = self.current_embedding(model)
+        if embedding is not None:
+            job_embedding = embedding.transform(job_features.vector)[0]
+            candidate_embeddings = self.candidate_embeddings(candidates, model, embedding)
+            return self.embedding_scores(job_embedding, candidate_embeddings), has_data
+        
+        return self.cosine_scores(job_features.vector, self.candidate_matrix(candidates, model)), has_data
+    
+    def candidate_embeddings(
+        self,
+        candidates: List[Tuple[ParsedProfile, str]],
+        model: MatchingModel,
+        embedding: LSAEmbedding
+    ) -> np.ndarray:
+        """
+        Contiguous (candidates x dim) LSA embeddings
+        
+        Stored embeddings are decoded as-is; the rest are projected from the
+        candidates' TF-IDF vectors in one batch.
+        """
+        stored_rows = [
+            row for row, (parsed_profile, _) in enumerate(candidates)
+            if getattr(parsed_profile, "resume_embedding", None) is not None
+            and getattr(parsed_profile, "embedding_version", None) == embedding.version
+        ]
+        stored_set = set(stored_rows)
+        projected_rows = [row for row in range(len(candidates)) if row not in stored_set]
+        
+        embeddings = np.empty((len(candidates), embedding.dim), dtype=np.float32)
+        if stored_rows:
+            embeddings[stored_rows] = embedding.stack(
+                [candidates[row][0].resume_embedding for row in stored_rows]
+            )
+        if projected_rows:
+            embeddings[projected_rows] = embedding.transform(
+                self.candidate_matrix([candidates[row] for row in projected_rows], model)
+            )
+        return embeddings
+    
+    def _vector_scores(self, model: MatchingModel, query: csr_matrix, rows: csr_matrix) -> np.ndarray:
+        """Similarity of every TF-IDF row against a query row, in LSA space when enabled"""
+        embedding = self.current_embedding(model)
+        if embedding is None:
+            return self.cosine_scores(query, rows)
+        return self.embedding_scores(embedding.transform(query)[0], embedding.transform(rows))
+    
+    @staticmethod
+    def cosine_scores(job_vector: csr_matrix, candidate_matrix: csr_matrix) -> np.ndarray:
+        """Cosine similarity of every candidate row against the job vector"""
+        # Rows are L2-normalized, so one sparse matrix-vector product gives all cosines
+        return candidate_matrix @ job_vector.toarray().ravel()
+    
+    @staticmethod
+    def embedding_scores(query: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every embedding row against the query embedding"""
+        # One BLAS matrix-vector product; LSA cosines can be negative, scores cannot
+        return np.maximum(embeddings @ query, 0.0)
+    
+    def refresh_profile_vectors(self, db: Session, batch_size: int = 500) -> int:
+        """Regenerate stored profile vectors that predate the loaded model"""
+        model = self.current_model()
+        if model is None:
+            return 0
+        
+        refreshed = 0
+        while True:
+            rows = db.query(ParsedProfile, User.resume_text).join(
+                User, User.id == ParsedProfile.user_id
+            ).filter(
+                (ParsedProfile.vector_model_version.is_(None))
+                | (ParsedProfile.vector_model_version != model.version)
+            ).limit(batch_size).all()
             
-            # Calculate skill match bonus
-            matched_skills = [skill for skill in required_skills if skill in candidate_skills]
-            skill_match_ratio = len(matched_skills) / len(required_skills) if required_skills else 0
+            if not rows:
+                break
             
-            # Adjust score based on skill match
-            skill_bonus = int(skill_match_ratio * 20)  # Up to 20 points bonus
-            final_score = min(100, base_score + skill_bonus)
+            matrix = model.transform([
+                self.extract_resume_text(profile, resume_text or "")
+                for profile, resume_text in rows
+            ])
+            db.bulk_update_mappings(ParsedProfile, [
+                {
+                    "id": profile.id,
+                    "resume_vector": encode_vector(matrix[row]),
+                    "vector_model_version": model.version
+                }
+                for row, (profile, _) in enumerate(rows)
+            ])
+            db.commit()
+            refreshed += len(rows)
+        
+        logger.info(f"Refreshed {refreshed} profile vectors for model {model.version}")
+        return refreshed
+    
+    def refresh_profile_embeddings(self, db: Session, batch_size: int = 500) -> int:
+        """Regenerate stored profile embeddings that predate the loaded LSA embedding"""
+        model = self.current_model()
+        embedding = self.current_embedding(model)
+        if embedding is None:
+            return 0
+        
+        refreshed = 0
+        while True:
+            rows = db.query(ParsedProfile, User.resume_text).join(
+                User, User.id == ParsedProfile.user_id
+            ).filter(
+                (ParsedProfile.embedding_version.is_(None))
+                | (ParsedProfile.embedding_version != embedding.version)
+            ).limit(batch_size).all()
             
-            # Find missing skills
-            missing_skills = [skill for skill in required_skills if skill not in candidate_skills]
+            if not rows:
+                break
             
-            # Generate analysis
-            analysis = self._generate_analysis(
-                final_score,
-                matched_skills,
-                missing_skills,
-                parsed_profile,
-                job
-            )
+            candidates = [(profile, resume_text or "") for profile, resume_text in rows]
+            embeddings = embedding.transform(self.candidate_matrix(candidates, model))
+            db.bulk_update_mappings(ParsedProfile, [
+                {
+                    "id": profile.id,
+                    "resume_embedding": embedding.encode(embeddings[row]),
+                    "embedding_version": embedding.version
+                }
+                for row, (profile, _) in enumerate(rows)
+            ])
+            db.commit()
+            refreshed += len(rows)
+        
+        logger.info(f"Refreshed {refreshed} profile embeddings for {embedding.version}")
+        return refreshed
+    
+    def refresh_job_features(self, db: Session, batch_size: int = 500) -> int:
+        """Regenerate persisted job vectors that predate the loaded model"""
+        model = self.current_model()
+        if model is None:
+            return 0
+        
+        refreshed = 0
+        while True:
+            jobs = db.query(Job).filter(
+                (Job.feature_model_version.is_(None))
+                | (Job.feature_model_version != model.version)
+            ).limit(batch_size).all()
             
-            return final_score, analysis, missing_skills[:10]  # Limit missing skills
+            if not jobs:
+                break
             
-        except Exception as e:
-            logger.error(f"Error calculating match score: {str(e)}")
-            return 0, f"Error calculating match: {str(e)}", []
+            texts = [self.extract_job_requirements(job) for job in jobs]
+            matrix = model.transform(texts)
+            for row, (job, text) in enumerate(zip(jobs, texts)):
+                required_skills = self._extract_skills_from_text(text)
+                mask_lo, mask_hi = skill_mask(required_skills)
+                # Keep updated_at as-is: this is not a content change
+                db.execute(
+                    update(Job).where(Job.id == job.id).values(
+                        feature_vector=encode_vector(matrix[row]),
+                        feature_model_version=model.version,
+                        required_skills=required_skills,
+                        required_skill_mask_lo=mask_lo,
+                        required_skill_mask_hi=mask_hi,
+                        updated_at=Job.updated_at
+                    )
+                )
+            db.commit()
+            refreshed += len(jobs)
+        
+        logger.info(f"Refreshed {refreshed} job vectors for model {model.version}")
+        return refreshed
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract skill keywords from text"""
-        # Common technical skills
-        skill_keywords = [
-            "python", "javascript", "java", "react", "node.js", "sql", "aws",
-            "docker", "kubernetes", "git", "agile", "scrum", "api", "rest",
-            "typescript", "angular", "vue", "django", "flask", "fastapi",
-            "postgresql", "mongodb", "redis", "machine learning", "data analysis"
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        """Extract required skill keywords from job text"""
+        return skill_matcher.find(text, JOB_SKILLS)
     
     def _calculate_fallback_score(
         self,
         job: Job,
         parsed_profile: ParsedProfile
-    ) -> Tuple[int, str, List[str]]:
+    ) -> Tuple[int, MatchFacts, List[str]]:
         """Fallback scoring method when vectorization fails"""
         required_skills = self._extract_skills_from_text(
             self.extract_job_requirements(job)
@@ -163,73 +831,441 @@ class MatchingService:
         score = int((len(matched_skills) / len(required_skills) * 100)) if required_skills else 50
         missing_skills = [skill for skill in required_skills if skill not in candidate_skills]
         
-        analysis = f"Matched {len(matched_skills)} out of {len(required_skills)} required skills."
+        facts = MatchFacts.noted(
+            score, f"Matched {len(matched_skills)} out of {len(required_skills)} required skills."
+        )
         
-        return score, analysis, missing_skills
+        return score, facts, missing_skills
     
-    def _generate_analysis(
-        self,
+    @staticmethod
+    def _match_facts(
         score: int,
+        similarity_score: int,
+        skill_bonus: int,
         matched_skills: List[str],
         missing_skills: List[str],
-        parsed_profile: ParsedProfile,
-        job: Job
-    ) -> str:
-        """Generate human-readable analysis of the match"""
-        analysis_parts = []
-        
-        # Score interpretation
-        if score >= 80:
-            analysis_parts.append("Excellent match! The candidate's profile strongly aligns with the job requirements.")
-        elif score >= 60:
-            analysis_parts.append("Good match. The candidate has relevant skills and experience.")
-        elif score >= 40:
-            analysis_parts.append("Moderate match. Some relevant experience but missing key requirements.")
-        else:
-            analysis_parts.append("Weak match. Significant gaps between candidate profile and job requirements.")
-        
-        # Skills analysis
-        if matched_skills:
-            analysis_parts.append(f"Matched skills: {', '.join(matched_skills[:5])}.")
-        
-        if missing_skills:
-            analysis_parts.append(f"Missing skills: {', '.join(missing_skills[:5])}.")
-        
-        # Experience analysis
-        if parsed_profile.experience:
-            exp_count = len(parsed_profile.experience)
-            analysis_parts.append(f"Candidate has {exp_count} previous position(s).")
-        
-        # Education analysis
-        if parsed_profile.education:
-            edu_count = len(parsed_profile.education)
-            analysis_parts.append(f"Candidate has {edu_count} education qualification(s).")
-        
-        return " ".join(analysis_parts)
+        parsed_profile: ParsedProfile
+    ) -> MatchFacts:
+        """Structured facts of a match; render_analysis turns them into text on demand"""
+        return MatchFacts.build(
+            score=score,
+            similarity_score=similarity_score,
+            skill_bonus=skill_bonus,
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            experience_count=len(parsed_profile.experience or []),
+            education_count=len(parsed_profile.education or [])
+        )
     
     def rank_candidates(
         self,
         job: Job,
-        candidates: List[Tuple[ParsedProfile, str]]
-    ) -> List[Tuple[ParsedProfile, int, str]]:
+        candidates: List[Tuple[ParsedProfile, str]],
+        top_k: Optional[int] = None,
+        candidate_matrix: Optional[csr_matrix] = None
+    ) -> List[Tuple[ParsedProfile, int, MatchFacts]]:
         """
         Rank multiple candidates for a job
         
+        A three-stage cascade when top_k is given:
+        1. prefilter: keep the RANK_PREFILTER_KEEP fraction with the most
+           required skills (AND/popcount over skill bitmasks, no text work)
+        2. score: TF-IDF cosine for the survivors in one matrix-vector product;
+           the best RANK_SCORE_KEEP fraction of them, never fewer than top_k,
+           is ordered and passed on
+        3. analysis: matched/missing skills and match facts only for the
+           min(top_k, survivors) rows returned
+        Without top_k every candidate is scored (exact). Per-stage counts and
+        timings accumulate in self.cascade_stats.
+        
         Args:
             job: Job posting
             candidates: List of (ParsedProfile, resume_text) tuples
+            top_k: Only return the best top_k candidates (all when None)
+            candidate_matrix: Precomputed candidate vectors from the loaded model,
+                one row per candidate; skips re-vectorizing resume texts
         
         Returns:
-            List of (ParsedProfile, score, analysis) tuples sorted by score (descending)
+            List of (ParsedProfile, score, MatchFacts) tuples sorted by score (descending)
         """
+        if not candidates:
+            return []
+        
+        model = self.current_model()
+        job_features = self._job_features(job, model)
+        timings = {}
+        
+        # Stage 1: skill overlap as AND + popcount over the candidates' skill bitmasks
+        started = time.perf_counter()
+        required_skills = job_features.required_skills
+        matched_masks = self.profile_skill_masks([profile for profile, _ in candidates]) & job_features.skill_mask
+        matched_counts = popcount(matched_masks)
+        
+        survivors = np.arange(len(candidates))
+        keep = self._cascade_keep(len(candidates), settings.RANK_PREFILTER_KEEP, top_k)
+        if required_skills and keep < len(candidates):
+            survivors = np.sort(self._top_k_indices(matched_counts, keep))
+        timings["prefilter"] = (len(candidates), len(survivors), time.perf_counter() - started)
+        
+        # Stage 2: cosine similarity for the survivors only
+        started = time.perf_counter()
+        stage_candidates = candidates if len(survivors) == len(candidates) else [
+            candidates[row] for row in survivors
+        ]
+        try:
+            if not job_features.text:
+                similarities = np.zeros(len(survivors))
+                has_data = np.zeros(len(survivors), dtype=bool)
+            elif candidate_matrix is not None and job_features.vector is not None:
+                rows = candidate_matrix if len(survivors) == len(candidates) else candidate_matrix[survivors]
+                similarities = self._vector_scores(model, job_features.vector, rows)
+                has_data = np.ones(len(survivors), dtype=bool)
+            else:
+                similarities, has_data = self._candidate_similarities(job_features, stage_candidates, model)
+        except ValueError as e:
+            logger.warning(f"Vectorization error: {e}. Ranking with per-candidate fallback.")
+            results = []
+            for parsed_profile, resume_text in stage_candidates:
+                score, facts, _ = self.calculate_match_score(job, parsed_profile, resume_text)
+                results.append((parsed_profile, score, facts))
+            results.sort(key=lambda x: x[1], reverse=True)
+            return results[:top_k] if top_k else results
+        
+        matched_masks = matched_masks[survivors]
+        if required_skills:
+            skill_match_ratio = matched_counts[survivors] / len(required_skills)
+        else:
+            skill_match_ratio = np.zeros(len(survivors))
+        
+        # Same arithmetic as calculate_match_score, applied to whole arrays
+        base_scores = (similarities * 100).astype(int)
+        skill_bonus = (skill_match_ratio * 20).astype(int)
+        scores = np.minimum(100, base_scores + skill_bonus)
+        
+        scores[~has_data] = 0
+        
+        # Partial sort: only the rows passed on are fully ordered
+        passed = top_k
+        if top_k is not None and settings.RANK_SCORE_KEEP < 1:
+            # Never fewer than top_k: the ratio must not cut the results
+            passed = max(top_k, int(np.ceil(settings.RANK_SCORE_KEEP * len(survivors))))
+        order = self._top_k_indices(scores, passed)
+        timings["score"] = (len(survivors), len(order), time.perf_counter() - started)
+        
+        # Stage 3: analysis for the final rows
+        started = time.perf_counter()
         results = []
+        for row in order[:top_k]:
+            parsed_profile = stage_candidates[row][0]
+            score = int(scores[row])
+            if not has_data[row]:
+                results.append((parsed_profile, 0, NO_DATA))
+                continue
+            
+            matched_skills, missing_skills = split_skills(required_skills, matched_masks[row])
+            facts = self._match_facts(
+                score, int(base_scores[row]), int(skill_bonus[row]), matched_skills, missing_skills, parsed_profile
+            )
+            results.append((parsed_profile, score, facts))
+        timings["analysis"] = (len(order), len(results), time.perf_counter() - started)
+        
+        self.cascade_stats.record(timings)
+        if logger.isEnabledFor(logging.DEBUG):
+            stages = ", ".join(
+                f"{stage} {kept}/{count} in {seconds * 1000:.1f} ms"
+                for stage, (count, kept, seconds) in timings.items()
+            )
+            logger.debug(f"Ranking cascade for job {getattr(job, 'id', None)}: {stages}")
+        return results
+    
+    @staticmethod
+    def _cascade_keep(count: int, ratio: float, top_k: Optional[int]) -> int:
+        """Rows the prefilter passes on: ratio of count, never fewer than top_k"""
+        if top_k is None or ratio >= 1:
+            return count
+        return min(count, max(top_k, int(np.ceil(ratio * count))))
+    
+    def score_against_jobs(
+        self,
+        jobs: List[Job],
+        parsed_profile: ParsedProfile,
+        resume_text: str = ""
+    ) -> List[Tuple[int, MatchFacts]]:
+        """
+        Score one profile against several jobs
+        
+        Job vectors come from the feature cache and are stacked into one
+        matrix, so the profile is vectorized once and scored against all
+        jobs with a single matrix-vector product.
         
-        for parsed_profile, resume_text in candidates:
-            score, analysis, _ = self.calculate_match_score(job, parsed_profile, resume_text)
-            results.append((parsed_profile, score, analysis))
+        Returns:
+            List of (score, MatchFacts) tuples, one per job
+        """
+        model = self.current_model()
+        features = [self._job_features(job, model) for job in jobs]
+        vector_rows = [row for row, job_features in enumerate(features) if job_features.vector is not None]
+        vector_set = set(vector_rows)
+        
+        # Jobs without a model vector go through the per-pair path
+        results: List[Optional[Tuple[int, MatchFacts]]] = [
+            None if row in vector_set else self.calculate_match_score(job, parsed_profile, resume_text)[:2]
+            for row, job in enumerate(jobs)
+        ]
+        if not vector_rows:
+            return results
+        
+        if not (
+            self._has_current_vector(parsed_profile, model)
+            or self.extract_resume_text(parsed_profile, resume_text)
+        ):
+            for row in vector_rows:
+                results[row] = (0, NO_DATA)
+            return results
         
-        # Sort by score (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
+        profile_vector = self.candidate_matrix([(parsed_profile, resume_text)], model)
+        job_vectors = vstack([features[row].vector for row in vector_rows], format="csr")
+        similarities = self._vector_scores(model, profile_vector, job_vectors)
+        
+        job_masks = np.stack([features[row].skill_mask for row in vector_rows])
+        matched_masks = job_masks & self.profile_skill_masks([parsed_profile])[0]
+        matched_counts = popcount(matched_masks)
+        for position, (row, similarity) in enumerate(zip(vector_rows, similarities)):
+            required_skills = features[row].required_skills
+            matched_skills, missing_skills = split_skills(required_skills, matched_masks[position])
+            skill_match_ratio = matched_counts[position] / len(required_skills) if required_skills else 0
+            
+            # Same arithmetic as calculate_match_score
+            base_score, skill_bonus = int(similarity * 100), int(skill_match_ratio * 20)
+            score = min(100, base_score + skill_bonus)
+            results[row] = (
+                score,
+                self._match_facts(score, base_score, skill_bonus, matched_skills, missing_skills, parsed_profile)
+            )
         
         return results
+    
+    def _load_candidate_index(self) -> None:
+        """
+        Map the shared candidate ANN index if it matches the loaded model
+        
+        Re-run on every reload check to pick up bundles saved by other
+        workers; an index with unsaved inserts is left alone because its
+        next save merges them into the newer bundle.
+        """
+        if multiprocessing.parent_process() is not None:
+            return  # Worker processes only score; talent-pool search stays in the API process
+        
+        current = self.candidate_index
+        bundle = CandidateANNIndex.current_bundle(settings.MATRIX_STORE_DIR)
+        if bundle is None or (current is not None and (current.bundle == bundle or current.unsaved)):
+            return
+        
+        try:
+            index = CandidateANNIndex.load(settings.MATRIX_STORE_DIR)
+        except Exception as e:
+            logger.error(f"Failed to load candidate index: {str(e)}")
+            return
+        
+        if index is not None and index.model_version == self.model_version:
+            with self._index_lock:
+                self.candidate_index = index
+                self._index_inserts_since_save = 0
+            logger.info(f"Mapped candidate index with {len(index)} profiles")
+    
+    def build_candidate_index(self, db: Session, batch_size: int = 5000) -> Optional[CandidateANNIndex]:
+        """Build the candidate ANN index over every parsed profile and persist it"""
+        model = self.current_model()
+        if model is None:
+            return None
+        
+        index = CandidateANNIndex(model.n_features, model.version)
+        offset = 0
+        while True:
+            rows = db.query(ParsedProfile, User.resume_text).join(
+                User, User.id == ParsedProfile.user_id
+            ).order_by(ParsedProfile.id).offset(offset).limit(batch_size).all()
+            if not rows:
+                break
+            
+            candidates = [(profile, resume_text or "") for profile, resume_text in rows]
+            index.add([str(profile.user_id) for profile, _ in rows], self.candidate_matrix(candidates, model))
+            offset += len(rows)
+        
+        index.save(settings.MATRIX_STORE_DIR, merge=False)
+        with self._index_lock:
+            self.candidate_index = index
+            self._index_inserts_since_save = 0
+        return index
+    
+    def index_profile(self, user_id, resume_vector: Optional[bytes], model_version: Optional[str]) -> None:
+        """Insert an uploaded profile's vector into the candidate index"""
+        index = self.candidate_index
+        if index is None or resume_vector is None or model_version != index.model_version:
+            return
+        
+        index.add([str(user_id)], decode_vector(resume_vector, index.n_features))
+        with self._index_lock:
+            self._index_inserts_since_save += 1
+            due = self._index_inserts_since_save >= settings.CANDIDATE_INDEX_SAVE_EVERY
+        if due:
+            self.save_candidate_index()
+    
+    def unindex_profile(self, user_id) -> None:
+        """Drop a deleted profile from the candidate index"""
+        index = self.candidate_index
+        if index is None:
+            return
+        
+        index.remove(str(user_id))
+        with self._index_lock:
+            # Counted like an insert, so the removal reaches the saved bundle
+            self._index_inserts_since_save += 1
+            due = self._index_inserts_since_save >= settings.CANDIDATE_INDEX_SAVE_EVERY
+        if due:
+            self.save_candidate_index()
+    
+    def save_candidate_index(self) -> None:
+        """Persist the candidate index if it has unsaved inserts or removals"""
+        with self._index_lock:
+            index = self.candidate_index
+            pending, self._index_inserts_since_save = self._index_inserts_since_save, 0
+        if index is not None and pending and index.model_version == self.model_version:
+            index.save(settings.MATRIX_STORE_DIR)
+    
+    def nearest_candidates(self, job: Job, k: int = 20) -> List[Tuple[str, float]]:
+        """
+        Approximate top-k profiles in the whole talent pool for a job
+        
+        Returns:
+            List of (user_id, cosine similarity) tuples sorted by similarity (descending)
+        """
+        model = self.current_model()
+        job_features = self._job_features(job, model)
+        index = self.candidate_index
+        if index is None or job_features.vector is None or model is None or index.model_version != model.version:
+            raise ValueError("Candidate search requires a fitted model and a built candidate index")
+        
+        return index.search(job_features.vector, k)
+    
+    def recommend_jobs(
+        self,
+        db: Session,
+        parsed_profile: ParsedProfile,
+        resume_text: str = "",
+        limit: int = 10,
+        location: Optional[str] = None,
+        job_type: Optional[str] = None
+    ) -> List[Tuple[object, int, List[str]]]:
+        """
+        Score a profile against every active job in one sparse matrix product
+        
+        Returns:
+            List of (job_id, score, missing_skills) tuples sorted by score (descending)
+        """
+        model = self.current_model()
+        if model is None:
+            raise ValueError("Job recommendations require a fitted matching model")
+        
+        embedding = self.current_embedding(model)
+        matrix = self.job_matrix.get(
+            embedding.version if embedding else model.version,
+            lambda: self._build_job_matrix(db, model, embedding)
+        )
+        if not len(matrix):
+            return []
+        
+        # Cosine over all jobs, then the skill bonus from the jobs' skill bitmasks
+        if embedding is not None:
+            profile_embedding = self.candidate_embeddings([(parsed_profile, resume_text)], model, embedding)[0]
+            similarities = self.embedding_scores(profile_embedding, matrix.embeddings)
+        else:
+            profile_vector = self.candidate_matrix([(parsed_profile, resume_text)], model)
+            similarities = self.cosine_scores(profile_vector, matrix.vectors)
+        
+        matched_masks = matrix.skill_masks & self.profile_skill_masks([parsed_profile])[0]
+        matched_counts = popcount(matched_masks)
+        skill_match_ratio = np.divide(
+            matched_counts,
+            matrix.required_counts,
+            out=np.zeros(len(matrix)),
+            where=matrix.required_counts > 0
+        )
+        
+        # Same arithmetic as calculate_match_score
+        scores = np.minimum(100, (similarities * 100).astype(int) + (skill_match_ratio * 20).astype(int))
+        scores[~matrix.filter_mask(location, job_type)] = -1
+        
+        results = []
+        for row in self._top_k_indices(scores, limit):
+            if scores[row] < 0:
+                break
+            _, missing_skills = split_skills(matrix.required_skills[row], matched_masks[row])
+            results.append((matrix.job_ids[row], int(scores[row]), missing_skills[:10]))
+        
+        return results
+    
+    def _build_job_matrix(
+        self,
+        db: Session,
+        model: MatchingModel,
+        embedding: Optional[LSAEmbedding] = None
+    ) -> JobMatrix:
+        """Load every active job and stack its vector into a JobMatrix"""
+        jobs = db.query(
+            Job.id,
+            Job.location,
+            Job.type,
+            Job.description,
+            Job.requirements,
+            Job.required_skills,
+            Job.feature_vector,
+            Job.feature_model_version,
+            Job.required_skill_mask_lo,
+            Job.required_skill_mask_hi
+        ).filter(Job.is_active == "true").all()
+        
+        stored_rows, text_rows = [], []
+        required_skills, skill_masks = [], []
+        for row, job in enumerate(jobs):
+            if job.feature_vector is not None and job.feature_model_version == model.version:
+                stored_rows.append(row)
+                required_skills.append(list(job.required_skills or []))
+                if job.required_skill_mask_lo is not None:
+                    skill_masks.append((job.required_skill_mask_lo, job.required_skill_mask_hi))
+                    continue
+            else:
+                text_rows.append(row)
+                required_skills.append(self._extract_skills_from_text(self.extract_job_requirements(job)))
+            skill_masks.append(skill_mask(required_skills[-1]))
+        
+        vectors = self._assemble_matrix(
+            model,
+            stored_rows,
+            [jobs[row].feature_vector for row in stored_rows],
+            text_rows,
+            [self.extract_job_requirements(jobs[row]) for row in text_rows]
+        )
+        
+        logger.info(f"Built job matrix: {len(jobs)} active jobs, {len(text_rows)} vectorized from text")
+        return JobMatrix(
+            job_ids=[job.id for job in jobs],
+            vectors=vectors,
+            required_skills=required_skills,
+            locations=[(job.location or "").lower() for job in jobs],
+            types=[job.type for job in jobs],
+            model_version=embedding.version if embedding else model.version,
+            embeddings=embedding.transform(vectors) if embedding else None,
+            skill_masks=mask_array(skill_masks)
+        )
+    
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+        """Indices of the top_k scores, descending, ties kept in input order"""
+        indices = np.arange(len(scores))
+        if top_k is not None and top_k < len(scores):
+            indices = np.argpartition(-scores, top_k - 1)[:top_k]
+        
+        return indices[np.lexsort((indices, -scores[indices]))]
+
 
+matching_service = MatchingService()
@@ -0,0 +1,47 @@
+"""
+Per-stage counters and timings of the candidate ranking cascade
+"""
+import threading
+from typing import Any, Dict
+
+STAGES = ("prefilter", "score", "analysis")
+
+
+class CascadeStats:
+    """Thread-safe running totals of candidates in, candidates kept and seconds per stage"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rankings = 0
+        self._stages = {
+            stage: {"candidates_in": 0, "kept": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            for stage in STAGES
+        }
+
+    def record(self, timings: Dict[str, tuple]) -> None:
+        """Add one ranking: stage -> (candidates in, kept, seconds)"""
+        with self._lock:
+            self._rankings += 1
+            for stage, (candidates_in, kept, seconds) in timings.items():
+                totals = self._stages[stage]
+                totals["candidates_in"] += candidates_in
+                totals["kept"] += kept
+                totals["total_seconds"] += seconds
+                totals["max_seconds"] = max(totals["max_seconds"], seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Rankings so far and per-stage throughput, keep rate and latency"""
+        with self._lock:
+            count = max(self._rankings, 1)
+            return {
+                "rankings": self._rankings,
+                "stages": {
+                    stage: {
+                        "candidates_in": totals["candidates_in"],
+                        "kept": totals["kept"],
+                        "avg_seconds": totals["total_seconds"] / count,
+                        "max_seconds": totals["max_seconds"]
+                    }
+                    for stage, totals in self._stages.items()
+                }
+            }
@@ -0,0 +1,219 @@
+"""
+Background re-scoring of stored application scores
+
+When a job's requirements change, its applications are read in
+keyset-paginated chunks of plain column data, scored in a process pool with
+the vectorized ranker, and written back with one bulk UPDATE per chunk.
+Progress is kept in memory per job. When a resume is re-uploaded, the
+candidate's open applications are re-scored in one batch in-process.
+"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application
+from app.models.job import Job
+from app.models.parsed_profile import ParsedProfile
+from app.models.user import User
+from app.services.match_facts import MatchFacts
+from app.services.matching_service import matching_service
+from app.services.scoring_tasks import PROFILE_FIELDS, ApplicationRow, job_fields, score_chunk
+
+logger = logging.getLogger(__name__)
+
+# Applications whose score still matters to recruiters
+OPEN_APPLICATION_STATUSES = ("Pending", "Reviewing", "Interviewed")
+
+
+class ApplicationRescorer:
+    """Re-scores stored applications off the request path"""
+
+    def __init__(self, workers: int, chunk_size: int):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._progress: Dict[Hashable, Dict[str, Any]] = {}
+        self._generations: Dict[Hashable, int] = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking a threaded server can copy held locks into the children
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def enqueue(self, job_id: Hashable) -> int:
+        """
+        Mark a job for re-scoring
+
+        Returns:
+            Generation number to pass to run(); a newer enqueue supersedes it
+        """
+        with self._lock:
+            generation = self._generations.get(job_id, 0) + 1
+            self._generations[job_id] = generation
+            self._progress[job_id] = {
+                "job_id": job_id,
+                "status": "queued",
+                "total": 0,
+                "completed": 0,
+                "started_at": None,
+                "finished_at": None,
+                "error": None
+            }
+        return generation
+
+    def progress(self, job_id: Hashable) -> Optional[Dict[str, Any]]:
+        """Snapshot of the latest re-scoring run of a job"""
+        with self._lock:
+            progress = self._progress.get(job_id)
+            return dict(progress) if progress else None
+
+    def run(self, job_id: Hashable, generation: int) -> None:
+        """Background task: re-score all applications of a job"""
+        db = SessionLocal()
+        try:
+            self._run(db, job_id, generation)
+        except Exception as e:
+            logger.error(f"Re-scoring job {job_id} failed: {str(e)}")
+            self._update(job_id, generation, status="failed", error=str(e), finished_at=_now())
+        finally:
+            db.close()
+
+    def rescore_user(self, user_id: Hashable) -> None:
+        """Background task: re-score a candidate's open applications after a resume upload"""
+        db = SessionLocal()
+        try:
+            parsed_profile = db.query(ParsedProfile).filter(ParsedProfile.user_id == user_id).first()
+            user = db.query(User).filter(User.id == user_id).first()
+            if not parsed_profile or not user:
+                return
+
+            rows = db.query(Application.id, Job).join(
+                Job, Job.id == Application.job_id
+            ).filter(
+                Application.user_id == user_id,
+                Application.status.in_(OPEN_APPLICATION_STATUSES)
+            ).all()
+            if not rows:
+                return
+
+            # One profile vector dotted against every cached job vector
+            scores = matching_service.score_against_jobs(
+                [job for _, job in rows], parsed_profile, user.resume_text or ""
+            )
+            updated = self._write_back(db, [
+                (application_id, score, facts)
+                for (application_id, _), (score, facts) in zip(rows, scores)
+            ])
+            logger.info(f"Re-scored {updated} open applications for user {user_id}")
+        except Exception as e:
+            logger.error(f"Re-scoring applications of user {user_id} failed: {str(e)}")
+        finally:
+            db.close()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, db: Session, job_id: Hashable, generation: int) -> None:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            self._update(job_id, generation, status="failed", error="Job not found", finished_at=_now())
+            return
+
+        fields = job_fields(job)
+        # Applicants without a parsed profile keep their apply-time score
+        total = db.query(Application).join(
+            ParsedProfile, ParsedProfile.user_id == Application.user_id
+        ).filter(Application.job_id == job_id).count()
+        self._update(job_id, generation, status="running", total=total, started_at=_now())
+
+        pool = self._get_pool()
+        in_flight: List[Future] = []
+        completed = 0
+        last_id = None
+
+        while True:
+            if not self._is_current(job_id, generation):
+                for future in in_flight:
+                    future.cancel()
+                logger.info(f"Re-scoring job {job_id} superseded by a newer update")
+                return
+
+            rows = self._next_chunk(db, job_id, last_id)
+            if rows:
+                last_id = rows[-1][0]
+                in_flight.append(pool.submit(score_chunk, fields, rows))
+
+            # Keep one chunk per worker in flight; write back the oldest when full
+            if in_flight and (len(in_flight) >= self.workers or not rows):
+                completed += self._write_back(db, in_flight.pop(0).result())
+                self._update(job_id, generation, completed=completed)
+
+            if not rows and not in_flight:
+                break
+
+        self._update(job_id, generation, status="completed", finished_at=_now())
+        logger.info(f"Re-scored {completed} applications for job {job_id}")
+
+    def _next_chunk(self, db: Session, job_id: Hashable, last_id: Optional[Any]) -> List[ApplicationRow]:
+        """Next page of applications (keyset on Application.id) as plain data"""
+        query = db.query(
+            Application.id,
+            *[getattr(ParsedProfile, field) for field in PROFILE_FIELDS],
+            User.resume_text
+        ).join(
+            ParsedProfile, ParsedProfile.user_id == Application.user_id
+        ).join(
+            User, User.id == Application.user_id
+        ).filter(Application.job_id == job_id)
+
+        if last_id is not None:
+            query = query.filter(Application.id > last_id)
+
+        return [
+            (row[0], dict(zip(PROFILE_FIELDS, row[1:-1])), row[-1] or "")
+            for row in query.order_by(Application.id).limit(self.chunk_size).all()
+        ]
+
+    @staticmethod
+    def _write_back(db: Session, results: List[Tuple[Any, int, MatchFacts]]) -> int:
+        """One bulk UPDATE for a scored chunk (facts only; legacy analysis text is cleared)"""
+        db.bulk_update_mappings(Application, [
+            {"id": application_id, "match_score": score, "match_facts": facts.to_json(), "match_analysis": None}
+            for application_id, score, facts in results
+        ])
+        db.commit()
+        return len(results)
+
+    def _is_current(self, job_id: Hashable, generation: int) -> bool:
+        with self._lock:
+            return self._generations.get(job_id) == generation
+
+    def _update(self, job_id: Hashable, generation: int, **fields) -> None:
+        """Record progress unless a newer run has taken over"""
+        with self._lock:
+            if self._generations.get(job_id) == generation:
+                self._progress[job_id].update(fields)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+application_rescorer = ApplicationRescorer(settings.RESCORE_WORKERS, settings.RESCORE_CHUNK_SIZE)
@@ -0,0 +1,149 @@
+"""
+Content-addressed cache of extracted resume text and parsed output
+
+Uploads are keyed by the SHA-256 of the PDF bytes plus PARSER_VERSION, so
+the same file re-uploaded, or submitted through several accounts, skips
+PyPDF2 and the parser, while a parser change simply stops hitting old
+entries. Entries are zlib-compressed JSON. They live in an in-process LRU
+bounded by total bytes by default, or in a shared store behind a
+Redis-style client (get / set with ex=), where the server's maxmemory
+policy bounds the size.
+"""
+import json
+import zlib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.services.resume_parser import PARSER_VERSION
+from app.services.shared_cache import SharedCache, build_cache
+
+ParsedResume = Tuple[str, Dict[str, Any]]  # parse_resume_file's return value: (resume_text, parsed_data)
+
+
+def resume_digest(pdf_bytes: bytes) -> str:
+    """Content address of an uploaded PDF"""
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def _encode(parsed: ParsedResume) -> bytes:
+    resume_text, parsed_data = parsed
+    return zlib.compress(json.dumps({"text": resume_text, "parsed": parsed_data}).encode("utf-8"))
+
+
+def _decode(raw: bytes) -> ParsedResume:
+    # Decoded afresh on every hit, so callers never share mutable parsed data
+    data = json.loads(zlib.decompress(raw))
+    return data["text"], data["parsed"]
+
+
+class InProcessResumeCache:
+    """Thread-safe LRU of parsed resumes, evicting by total compressed size"""
+
+    def __init__(self, max_bytes: int, parser_version: str = PARSER_VERSION):
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, digest: str) -> Optional[ParsedResume]:
+        """Return a cached parse and mark it as recently used"""
+        key = f"{self.parser_version}:{digest}"
+        with self._lock:
+            raw = self._entries.get(key)
+            if raw is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _decode(raw)
+
+    def put(self, digest: str, parsed: ParsedResume) -> None:
+        """Store a parse, evicting least recently used entries beyond max_bytes"""
+        raw = _encode(parsed)
+        if len(raw) > self.max_bytes:
+            return
+        key = f"{self.parser_version}:{digest}"
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = raw
+            self._bytes += len(raw)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, hit/miss/eviction counters and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "parser_version": self.parser_version,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+class SharedResumeCache(SharedCache):
+    """Parsed resumes in a store shared by every worker and replica"""
+
+    label = "Resume cache"
+
+    def __init__(self, client: Any, ttl: float, parser_version: str = PARSER_VERSION, prefix: str = "resume:"):
+        super().__init__(client, ttl, prefix)
+        self.parser_version = parser_version
+
+    def _name(self, digest: str) -> str:
+        return f"{self.prefix}{self.parser_version}:{digest}"
+
+    def _encode(self, parsed: ParsedResume) -> bytes:
+        return _encode(parsed)
+
+    def _decode(self, raw: bytes) -> ParsedResume:
+        return _decode(raw)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/error counters and hit rate of this process"""
+        return {**super().stats(), "parser_version": self.parser_version}
+
+
+def build_resume_cache(backend: str, max_bytes: int, ttl: float, url: Optional[str] = None):
+    """
+    Resume cache for the configured backend (see build_cache): the in-process
+    LRU, or a SharedResumeCache on the Redis server at url
+    """
+    return build_cache(
+        backend,
+        url,
+        lambda: InProcessResumeCache(max_bytes),
+        lambda client: SharedResumeCache(client, ttl),
+        "resume cache"
+    )
+
+
+resume_cache = build_resume_cache(
+    settings.RESUME_CACHE_BACKEND,
+    settings.RESUME_CACHE_MAX_BYTES,
+    settings.RESUME_CACHE_TTL,
+    settings.RESUME_CACHE_URL
+)
@@ -0,0 +1,371 @@
+"""
+Asynchronous resume ingestion backed by a database queue
+
+An upload is stored as a ResumeIngestion row and acknowledged right away.
+Worker tasks claim queued rows with SELECT ... FOR UPDATE SKIP LOCKED, so
+several workers (in this process or a separate one, see
+scripts/run_ingestion_worker.py) never take the same resume. PDF
+extraction and parsing run in the CPU executor; the profile and the
+ingestion status are written in one transaction. A claim older than the
+lease is put back in the queue, so resumes in flight when a process dies
+are picked up again after a restart.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.parsed_profile import ParsedProfile
+from app.models.resume_ingestion import (
+    INGESTION_COMPLETED, INGESTION_FAILED, INGESTION_PROCESSING, INGESTION_QUEUED, ResumeIngestion
+)
+from app.models.user import User
+from app.services.executor import cpu_executor, ExecutorBusyError
+from app.services.matching_service import matching_service
+from app.services.rescoring import application_rescorer
+from app.services.resume_cache import ParsedResume, resume_cache, resume_digest
+from app.services.resume_parser import parse_resume_file
+from app.services.skill_bitmask import skill_mask
+from app.services.skill_index import skill_index
+
+logger = logging.getLogger(__name__)
+
+
+async def parse_resume_upload(pdf_bytes: bytes) -> ParsedResume:
+    """
+    Extract and parse an uploaded PDF in the CPU executor, or reuse the
+    cached result for identical bytes
+
+    Raises:
+        ValueError, ExecutorBusyError, asyncio.TimeoutError: as cpu_executor.run(parse_resume_file)
+    """
+    digest = resume_digest(pdf_bytes)
+    if resume_cache is not None:
+        cached = resume_cache.get(digest)
+        if cached is not None:
+            return cached
+
+    parsed = await cpu_executor.run(parse_resume_file, pdf_bytes)
+    if resume_cache is not None:
+        resume_cache.put(digest, parsed)
+    return parsed
+
+
+def store_parsed_resume(
+    db: Session, user: User, resume_text: str, parsed_data: Dict[str, Any]
+) -> ParsedProfile:
+    """
+    Write a parsed resume onto the user's profile, with its skill mask, vectors
+    and document-frequency changes. The caller commits, then calls publish_profile.
+    """
+    parsed_profile = db.query(ParsedProfile).filter(
+        ParsedProfile.user_id == user.id
+    ).first()
+
+    old_text = None
+    if parsed_profile:
+        old_text = matching_service.extract_resume_text(parsed_profile, user.resume_text or "")
+
+        # Update existing profile
+        parsed_profile.skills = parsed_data["skills"]
+        parsed_profile.experience = parsed_data["experience"]
+        parsed_profile.education = parsed_data["education"]
+        parsed_profile.summary = parsed_data["summary"]
+    else:
+        # Create new profile
+        parsed_profile = ParsedProfile(
+            user_id=user.id,
+            skills=parsed_data["skills"],
+            experience=parsed_data["experience"],
+            education=parsed_data["education"],
+            summary=parsed_data["summary"]
+        )
+        db.add(parsed_profile)
+
+    # Update user's resume text
+    user.resume_text = resume_text
+
+    # Skill bitmask for AND/popcount matching and SQL skill filters
+    parsed_profile.skill_mask_lo, parsed_profile.skill_mask_hi = skill_mask(parsed_profile.skills)
+
+    # Vectorize once so matching never re-reads the raw text
+    parsed_profile.resume_vector, parsed_profile.vector_model_version = (
+        matching_service.compute_profile_vector(parsed_profile, resume_text)
+    )
+    parsed_profile.resume_embedding, parsed_profile.embedding_version = (
+        matching_service.compute_profile_embedding(parsed_profile, resume_text)
+    )
+    matching_service.record_document_change(
+        db, old_text, matching_service.extract_resume_text(parsed_profile, resume_text)
+    )
+    return parsed_profile
+
+
+def publish_profile(user_id: Hashable, parsed_profile: ParsedProfile) -> None:
+    """After the commit: make a stored profile visible to skill search and candidate ranking"""
+    skill_index.update(user_id, parsed_profile.skills)
+    matching_service.index_profile(
+        user_id, parsed_profile.resume_vector, parsed_profile.vector_model_version
+    )
+
+
+class ClaimedIngestion(NamedTuple):
+    """A queued upload taken by one worker"""
+    id: Any
+    user_id: Any
+    content: bytes
+    attempts: int
+
+
+class ResumeIngestionWorker:
+    """Pool of asyncio tasks draining the resume ingestion queue"""
+
+    def __init__(self, workers: int, poll_interval: float, lease_seconds: float, max_attempts: int):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._tasks = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._next_stale_check = 0.0
+        self._lock = threading.Lock()
+        self._counters = {"completed": 0, "failed": 0, "retried": 0, "requeued_stale": 0}
+
+    def enqueue(self, db: Session, user_id: Hashable, filename: str, content: bytes) -> ResumeIngestion:
+        """Store an upload for parsing and wake an idle worker"""
+        ingestion = ResumeIngestion(
+            user_id=user_id,
+            filename=filename[:255],
+            content=content,
+            status=INGESTION_QUEUED,
+            attempts=0
+        )
+        db.add(ingestion)
+        db.commit()
+        db.refresh(ingestion)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return ingestion
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop"""
+        if self._tasks or self.workers <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} resume ingestion workers")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks; a resume being parsed goes back to the queue when its lease expires"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_forever(self) -> None:
+        """Entry point for a standalone worker process"""
+        self.start()
+        await asyncio.gather(*self._tasks)
+
+    def stats(self) -> Dict[str, Any]:
+        """Worker count and outcome counters"""
+        with self._lock:
+            return {"workers": len(self._tasks), **self._counters}
+
+    async def _work(self) -> None:
+        while True:
+            if time.monotonic() >= self._next_stale_check:
+                # A quarter lease: stale claims are back in the queue well before a second lease passes
+                self._next_stale_check = time.monotonic() + self.lease_seconds / 4
+                await asyncio.to_thread(self._requeue_stale)
+            try:
+                claimed = await asyncio.to_thread(self._claim)
+            except Exception as e:
+                logger.error(f"Claiming a resume ingestion failed: {str(e)}")
+                claimed = None
+            if claimed is None:
+                await self._idle()
+                continue
+            await self._process(claimed)
+
+    async def _idle(self) -> None:
+        """Sleep until an upload arrives or the poll interval passes (uploads from other processes)"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _process(self, claimed: ClaimedIngestion) -> None:
+        try:
+            resume_text, parsed_data = await parse_resume_upload(claimed.content)
+        except ValueError as e:
+            # Unreadable or unparseable PDF: retrying will not help
+            await asyncio.to_thread(self._fail, claimed, str(e))
+            return
+        except ExecutorBusyError:
+            await asyncio.to_thread(self._release, claimed, None, count_attempt=False)
+            await asyncio.sleep(self.poll_interval)
+            return
+        except Exception as e:
+            error = "Resume parsing timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+            await asyncio.to_thread(self._release, claimed, error, count_attempt=True)
+            return
+
+        try:
+            await asyncio.to_thread(self._complete, claimed, resume_text, parsed_data)
+        except Exception as e:
+            logger.error(f"Storing resume ingestion {claimed.id} failed: {str(e)}")
+            await asyncio.to_thread(self._release, claimed, str(e), count_attempt=True)
+
+    def _claim(self) -> Optional[ClaimedIngestion]:
+        """Take the oldest queued upload no other worker holds"""
+        db = SessionLocal()
+        try:
+            ingestion = db.query(ResumeIngestion).filter(
+                ResumeIngestion.status == INGESTION_QUEUED
+            ).order_by(ResumeIngestion.created_at).with_for_update(skip_locked=True).first()
+            if ingestion is None:
+                return None
+            ingestion.status = INGESTION_PROCESSING
+            ingestion.attempts += 1
+            ingestion.started_at = _now()
+            claimed = ClaimedIngestion(ingestion.id, ingestion.user_id, ingestion.content, ingestion.attempts)
+            db.commit()
+            return claimed
+        finally:
+            db.close()
+
+    def _complete(self, claimed: ClaimedIngestion, resume_text: str, parsed_data: Dict[str, Any]) -> None:
+        """Write the profile and mark the upload completed in one transaction"""
+        db = SessionLocal()
+        try:
+            ingestion = db.query(ResumeIngestion).filter(
+                ResumeIngestion.id == claimed.id
+            ).with_for_update().first()
+            user = db.query(User).filter(User.id == claimed.user_id).first()
+            if ingestion is None or not self._still_held(ingestion, claimed):
+                return  # Deleted, or the lease expired and another worker took it
+            if user is None:
+                ingestion.status, ingestion.error, ingestion.finished_at = INGESTION_FAILED, "User not found", _now()
+                db.commit()
+                return
+
+            parsed_profile = store_parsed_resume(db, user, resume_text, parsed_data)
+            ingestion.status = INGESTION_COMPLETED
+            ingestion.error = None
+            ingestion.content = None
+            ingestion.finished_at = _now()
+            db.commit()
+            db.refresh(parsed_profile)
+            publish_profile(user.id, parsed_profile)
+        finally:
+            db.close()
+
+        self._count("completed")
+        logger.info(f"Resume ingestion {claimed.id} parsed for user {claimed.user_id}")
+        # Existing applications were scored against the previous resume
+        application_rescorer.rescore_user(claimed.user_id)
+
+    @staticmethod
+    def _still_held(ingestion: ResumeIngestion, claimed: ClaimedIngestion) -> bool:
+        """Whether this worker's claim is still the latest (a re-claim after the lease bumps attempts)"""
+        return ingestion.status == INGESTION_PROCESSING and ingestion.attempts == claimed.attempts
+
+    def _fail(self, claimed: ClaimedIngestion, error: Optional[str]) -> None:
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(ResumeIngestion)
+                .where(
+                    ResumeIngestion.id == claimed.id,
+                    ResumeIngestion.status == INGESTION_PROCESSING,
+                    ResumeIngestion.attempts == claimed.attempts
+                )
+                .values(status=INGESTION_FAILED, error=error, finished_at=_now())
+            )
+            db.commit()
+        finally:
+            db.close()
+        self._count("failed")
+        logger.warning(f"Resume ingestion {claimed.id} failed: {error}")
+
+    def _release(self, claimed: ClaimedIngestion, error: Optional[str], count_attempt: bool) -> None:
+        """Return a claimed upload to the queue, or fail it after max_attempts tries"""
+        if count_attempt and claimed.attempts >= self.max_attempts:
+            self._fail(claimed, error)
+            return
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(ResumeIngestion)
+                .where(
+                    ResumeIngestion.id == claimed.id,
+                    ResumeIngestion.status == INGESTION_PROCESSING,
+                    ResumeIngestion.attempts == claimed.attempts
+                )
+                .values(
+                    status=INGESTION_QUEUED,
+                    error=error,
+                    attempts=claimed.attempts if count_attempt else claimed.attempts - 1
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+        if count_attempt:
+            self._count("retried")
+
+    def _requeue_stale(self) -> None:
+        """
+        Put back uploads whose worker has held them past the lease (crashed or
+        restarted process); fail those that have used up their attempts
+        """
+        expired = [
+            ResumeIngestion.status == INGESTION_PROCESSING,
+            ResumeIngestion.started_at < _now() - timedelta(seconds=self.lease_seconds)
+        ]
+        db = SessionLocal()
+        try:
+            failed = db.execute(
+                update(ResumeIngestion)
+                .where(*expired, ResumeIngestion.attempts >= self.max_attempts)
+                .values(status=INGESTION_FAILED, error="Worker stopped while parsing", finished_at=_now())
+            ).rowcount
+            requeued = db.execute(
+                update(ResumeIngestion).where(*expired).values(status=INGESTION_QUEUED)
+            ).rowcount
+            db.commit()
+        except Exception as e:
+            logger.error(f"Re-queueing stale resume ingestions failed: {str(e)}")
+            return
+        finally:
+            db.close()
+        if failed or requeued:
+            logger.warning(f"Resume ingestions past their lease: {requeued} re-queued, {failed} failed")
+            with self._lock:
+                self._counters["requeued_stale"] += requeued
+                self._counters["failed"] += failed
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._counters[outcome] += 1
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+resume_ingestion = ResumeIngestionWorker(
+    settings.RESUME_INGESTION_WORKERS,
+    settings.RESUME_INGESTION_POLL_INTERVAL,
+    settings.RESUME_INGESTION_LEASE,
+    settings.RESUME_INGESTION_MAX_ATTEMPTS
+)
@@ -1,38 +1,48 @@
 """
 Resume parsing service using NLP and PDF extraction
 """
-import re
+import time
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import PyPDF2
 from io import BytesIO
 
+from app.core.config import settings
+from app.services import resume_patterns as patterns
+from app.services.skill_matcher import RESUME_SKILL_KEYWORDS, skill_matcher
+from app.services.resume_sections import (
+    EDUCATION, EXPERIENCE, PROJECTS, SUMMARY, ResumeSections, segment_resume
+)
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction or parsing output changes; cached parses of older versions stop matching
+PARSER_VERSION = "3"
+
+# Degree strings naming a project rather than a qualification
+PROJECT_WORDS = ['project', 'system', 'detection', 'forecasting', 'matching', 'anomaly', 'screening']
+
+RESUME_SKILLS = frozenset(RESUME_SKILL_KEYWORDS)
+
+
+class ParseBudget:
+    """Wall-clock allowance for parsing one document; extractors keep what they found once it is spent"""
+
+    def __init__(self, seconds: float):
+        self.deadline = time.monotonic() + seconds if seconds > 0 else None
+        self.exhausted = False
+
+    def spent(self) -> bool:
+        if not self.exhausted and self.deadline is not None and time.monotonic() > self.deadline:
+            self.exhausted = True
+        return self.exhausted
+
 
 class ResumeParser:
     """Service for parsing resumes and extracting structured data"""
     
-    # Common skill keywords
-    SKILL_KEYWORDS = [
-        # Programming Languages
-        "python", "javascript", "java", "typescript", "c++", "c#", "go", "rust", "php", "ruby",
-        "swift", "kotlin", "scala", "r", "matlab", "sql", "html", "css", "sass", "less",
-        # Frameworks & Libraries
-        "react", "vue", "angular", "node.js", "express", "django", "flask", "fastapi",
-        "spring", "laravel", "rails", "asp.net", "next.js", "nuxt.js", "svelte",
-        # Databases
-        "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "cassandra", "dynamodb",
-        # Cloud & DevOps
-        "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "ci/cd", "terraform",
-        "ansible", "git", "github", "gitlab", "linux", "bash", "shell scripting",
-        # Data Science & ML
-        "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn",
-        "pandas", "numpy", "matplotlib", "seaborn", "jupyter", "data analysis",
-        # Other
-        "agile", "scrum", "rest api", "graphql", "microservices", "api development",
-        "testing", "tdd", "bdd", "selenium", "cypress", "jest", "pytest"
-    ]
+    # Common skill keywords (resume part of the shared canonical vocabulary)
+    SKILL_KEYWORDS = RESUME_SKILL_KEYWORDS
     
     # Education keywords
     EDUCATION_KEYWORDS = [
@@ -61,71 +71,39 @@ class ResumeParser:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Check for skills section
-        skills_section_pattern = r'(?:skills?|technical skills?|technologies?|proficiencies?)[:;]?\s*(.*?)(?:\n\n|\n[A-Z]|$)'
-        skills_match = re.search(skills_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
-        
-        if skills_match:
-            skills_text = skills_match.group(1)
-            # Extract skills from the section
-            for skill in self.SKILL_KEYWORDS:
-                if skill in skills_text:
-                    found_skills.append(skill.title())
-        
-        # Also check entire text for skill mentions
-        for skill in self.SKILL_KEYWORDS:
-            if skill in text_lower and skill.title() not in found_skills:
-                # Check if it's a meaningful mention (not just part of another word)
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    found_skills.append(skill.title())
-        
-        return list(set(found_skills))  # Remove duplicates
+        # One pass over the whole text also covers the skills section
+        return [skill.title() for skill in skill_matcher.find(text, RESUME_SKILLS)]
     
-    def extract_education(self, text: str) -> List[Dict[str, str]]:
+    def extract_education(
+        self, text: str, sections: Optional[ResumeSections] = None, budget: Optional[ParseBudget] = None
+    ) -> List[Dict[str, str]]:
         """Extract education information - balance between accuracy and completeness"""
         education = []
-        text_lower = text.lower()
-        original_text = text  # Keep original for better matching
-        
-        # Look for education section
-        education_pattern = r'(?:education|academic background|qualifications?|academic qualifications?)[:;]?\s*(.*?)(?:\n\n|\n(?:experience|work experience|professional experience|projects?|skills?|technical skills?)|$)'
-        education_match = re.search(education_pattern, text_lower, re.IGNORECASE | re.DOTALL)
-        
-        education_text = ""
-        if education_match:
-            education_text = education_match.group(1)
-        else:
-            # If no explicit section, search entire text but be more careful
-            education_text = text
+        sections = sections or segment_resume(text)
+        budget = budget or ParseBudget(0)
         
-        # Flexible degree patterns - look for degree keywords followed by field and institution
-        degree_patterns = [
-            # B.E. / B.E in Computer Science / B.E Computer Science
-            r'(b\.?e\.?|bachelor(?:\s+of)?\s+engineering)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-            # B.Sc / Bachelor of Science
-            r'(b\.?s\.?c\.?|bachelor(?:\s+of)?\s+science)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-            # M.Sc / Master of Science
-            r'(m\.?s\.?c\.?|master(?:\s+of)?\s+science)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-            # M.E / Master of Engineering
-            r'(m\.?e\.?|master(?:\s+of)?\s+engineering)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-            # MBA
-            r'(m\.?b\.?a\.?|master(?:\s+of)?\s+business\s+administration)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-            # PhD
-            r'(ph\.?d\.?|doctorate|ph\.?d)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))',
-        ]
+        # Education section (lowercased), or the entire text if there is no explicit one.
+        # Matches are found in the lowercased lines; names are sliced from the original ones.
+        original_text = sections.get(EDUCATION) or text
+        education_text = original_text.lower() if sections.get(EDUCATION) else text
+        lines = self._cased_lines(education_text, original_text)
         
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, education_text, re.IGNORECASE)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) >= 3:
-                    degree_type = groups[0].strip()
-                    field = groups[1].strip() if groups[1] else ""
-                    institution = groups[2].strip()
+        # Degree keyword followed by field and institution: "B.E in Computer Science, Anna University"
+        line_start = 0
+        for line, original_line in lines:
+            if budget.spent():
+                break
+            resume_at = 0
+            if patterns.INSTITUTION_KEYWORD.search(line):
+                for match in patterns.DEGREE.finditer(line):
+                    if match.start() < resume_at:
+                        continue
+                    if budget.spent():
+                        break
+                    entry = self._degree_entry(line, match, original_line)
+                    if entry is None:
+                        continue
+                    degree_type, field, institution, resume_at = entry
                     
                     # Build degree name
                     if field:
@@ -134,52 +112,113 @@ class ResumeParser:
                         degree = degree_type
                     
                     # Skip if this looks like a project (has project-like keywords)
-                    if any(proj_word in degree.lower() for proj_word in ['project', 'system', 'detection', 'forecasting', 'matching', 'anomaly', 'screening']):
+                    if any(proj_word in degree.lower() for proj_word in PROJECT_WORDS):
                         continue
                     
-                    year = self._extract_year(education_text, match.start())
+                    year = self._extract_year(education_text, line_start + match.start())
                     
                     education.append({
                         "degree": degree.title(),
                         "institution": institution,
                         "year": year
                     })
+            line_start += len(line) + 1
         
         # Fallback: Simple pattern matching for common formats
         if not education:
             # Pattern: "B.E in Computer Science" or "B.E Computer Science" followed by institution
-            simple_pattern = r'\b(b\.?e\.?|b\.?s\.?c\.?|m\.?s\.?c\.?|m\.?e\.?|m\.?b\.?a\.?|ph\.?d\.?|bachelor|master|doctorate)\b[^\n]{0,150}?(college|university|institute|school|univ)[^\n]{0,50}'
-            matches = re.finditer(simple_pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                match_text = original_text[match.start():match.end()].strip()
-                # Find where institution keyword starts
-                inst_match = re.search(r'(college|university|institute|school|univ)', match_text, re.IGNORECASE)
-                if inst_match:
-                    degree = match_text[:inst_match.start()].strip()
-                    institution = match_text[inst_match.start():].strip()
+            line_start = 0
+            for line, original_line in lines:
+                if budget.spent():
+                    break
+                resume_at = 0
+                for match in patterns.SIMPLE_DEGREE.finditer(line):
+                    if match.start() < resume_at:
+                        continue
+                    if budget.spent():
+                        break
+                    # Find where institution keyword starts
+                    inst_match = patterns.INSTITUTION_KEYWORD.search(
+                        line, match.end(), match.end() + patterns.SIMPLE_DEGREE_REACH + len("university")
+                    )
+                    if inst_match is None or inst_match.start() - match.end() > patterns.SIMPLE_DEGREE_REACH:
+                        continue
+                    resume_at = min(len(line), inst_match.end() + patterns.SIMPLE_DEGREE_TAIL)
+                    degree = original_line[match.start():inst_match.start()].strip()
+                    institution = original_line[inst_match.start():resume_at].strip()
                     
                     # Skip projects
-                    if not any(proj_word in degree.lower() for proj_word in ['project', 'system', 'detection', 'forecasting', 'matching', 'anomaly']):
-                        year = self._extract_year(text, match.start())
+                    if not any(proj_word in degree.lower() for proj_word in PROJECT_WORDS):
+                        year = self._extract_year(education_text, line_start + match.start())
                         education.append({
                             "degree": degree.title(),
                             "institution": institution[:100],
                             "year": year
                         })
+                line_start += len(line) + 1
         
         return education
     
+    @staticmethod
+    def _cased_lines(education_text: str, original_text: str) -> List[Tuple[str, str]]:
+        """
+        (scanned line, original-case line) pairs at the same offsets
+        
+        Where lowercasing changed a line's length (a few non-ASCII letters), the
+        scanned line stands in for the original so offsets stay valid.
+        """
+        return [
+            (line, original if len(original) == len(line) else line)
+            for line, original in zip(education_text.split('\n'), original_text.split('\n'))
+        ]
+    
+    @staticmethod
+    def _degree_entry(line: str, degree, original_line: Optional[str] = None) -> Optional[Tuple[str, str, str, int]]:
+        """
+        Field and institution following a degree keyword on one line
+        
+        "<degree> [in] <field>, <name> <keyword>" or, without a comma, "<field word> <name> <keyword>".
+        The first institution keyword within DEGREE_WINDOW characters that leaves a
+        valid field (up to 50 characters) and name (a letter, up to 81 characters) wins.
+        The parts are sliced from original_line (same offsets, original case) when given.
+        
+        Returns:
+            Tuple of (degree type, field, institution, end offset in line), or None
+        """
+        lead = patterns.DEGREE_LEAD.match(line, degree.end())
+        field_start = lead.end()
+        for keyword in patterns.INSTITUTION_KEYWORD.finditer(line, field_start, field_start + patterns.DEGREE_WINDOW):
+            head = line[field_start:keyword.start()]
+            commas = head.count(",")
+            if commas > 1:
+                break  # Neither field nor institution may contain a comma
+            if commas:
+                field, _, name = head.partition(",")
+                name = name.lstrip()
+            else:
+                separator = patterns.FIELD_SEPARATOR.search(head)
+                if separator is None:
+                    continue
+                field, name = head[:separator.start()], head[separator.end():]
+            if len(field) > 50 or not name or len(name) > 81 or not (name[0].isascii() and name[0].isalpha()):
+                continue
+            source = original_line or line
+            name_start = keyword.start() - len(name)
+            field_end = field_start + len(field)
+            return (
+                source[degree.start(1):degree.end(1)].strip(),
+                source[field_start:field_end].strip(),
+                source[name_start:keyword.end()].strip(),
+                keyword.end()
+            )
+        return None
+    
     def _extract_institution(self, text: str, position: int) -> str:
         """Extract institution name near a position"""
         # Look for common institution indicators
         context = text[max(0, position-100):position+200]
-        institution_patterns = [
-            r'university\s+of\s+([^\n,]+)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:university|college|institute|school)',
-        ]
-        
-        for pattern in institution_patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in (patterns.UNIVERSITY_OF, patterns.NAMED_INSTITUTION):
+            match = pattern.search(context)
             if match:
                 return match.group(0).strip()
         
@@ -188,34 +227,68 @@ class ResumeParser:
     def _extract_year(self, text: str, position: int) -> str:
         """Extract year near a position"""
         context = text[max(0, position-50):position+50]
-        year_pattern = r'\b(19|20)\d{2}\b'
-        match = re.search(year_pattern, context)
+        match = patterns.YEAR.search(context)
         if match:
             return match.group(0)
         return "Not specified"
     
-    def extract_experience(self, text: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _title_at_company(line: str) -> Optional[Tuple[str, str, str]]:
+        """(title, company, duration) from "Title at Company (Duration)", or None"""
+        paren = line.find('(')
+        close = line.find(')', paren + 1) if paren >= 0 else -1
+        if close <= paren + 1:
+            return None
+        head = line[:paren].rstrip()
+        for separator in patterns.AT_SEPARATOR.finditer(head):
+            if separator.start() > 81:
+                break  # Titles run 6-81 characters
+            title, company = head[:separator.start()], head[separator.end():]
+            if (6 <= len(title) <= 81 and 4 <= len(company) <= 51
+                    and title[0].isascii() and title[0].isalpha()
+                    and company[0].isascii() and company[0].isalpha()):
+                return title.strip(), company.strip(), line[paren + 1:close].strip()
+        return None
+    
+    @staticmethod
+    def _looks_like_title(line: str) -> bool:
+        """A standalone project or job title: capitalized, 11-101 characters, two or more words"""
+        return 11 <= len(line) <= 101 and 'A' <= line[0] <= 'Z' and len(line.split()) >= 2
+    
+    @staticmethod
+    def _project_title(line: str) -> Optional[Tuple[str, Optional[str]]]:
+        """(title, duration or None) from a "Project Title (Duration)" line of letters and spaces"""
+        run = patterns.TITLE_RUN.match(line)
+        if run is None:
+            return None
+        rest = line[run.end():]
+        if not rest:
+            return (line, None) if 11 <= len(line) <= 101 else None
+        suffix = patterns.PAREN_SUFFIX.fullmatch(rest)
+        title = run.group(0).rstrip()
+        if suffix is None or len(title) > 101:
+            return None
+        return title, suffix.group(1)
+    
+    def extract_experience(
+        self, text: str, sections: Optional[ResumeSections] = None, budget: Optional[ParseBudget] = None
+    ) -> List[Dict[str, str]]:
         """Extract work experience and projects"""
         experience = []
-        text_lower = text.lower()
-        original_text = text
-        
-        # Look for experience/projects section
-        experience_pattern = r'(?:experience|work experience|employment|professional experience|projects?|project experience)[:;]?\s*(.*?)(?:\n\n|\n(?:education|academic|skills?|technical skills?|certifications?)|$)'
-        experience_match = re.search(experience_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        sections = sections or segment_resume(text)
+        budget = budget or ParseBudget(0)
         
-        experience_text = ""
-        if experience_match:
-            experience_text = experience_match.group(1)
-        else:
-            # If no explicit section, try to find project/experience entries in the text
-            experience_text = text
+        # Experience and project sections (lowercased), or the entire text if there are none
+        experience_text = sections.get(EXPERIENCE, PROJECTS)
+        experience_text = experience_text.lower() if experience_text else text
         
         # Split into lines for line-by-line parsing
         lines = experience_text.split('\n')
         current_entry = None
         
         for i, line in enumerate(lines):
+            if budget.spent():
+                break
             line_stripped = line.strip()
             if not line_stripped or len(line_stripped) < 5:
                 continue
@@ -227,20 +300,20 @@ class ResumeParser:
                     continue
             
             # Pattern 1: Title at Company (Duration)
-            match1 = re.search(r'^([A-Z][^\n(]{5,80}?)\s+(?:at|@)\s+([A-Z][^\n(]{3,50}?)\s*\(([^)]+)\)', line_stripped, re.IGNORECASE)
+            match1 = self._title_at_company(line_stripped)
             if match1:
                 if current_entry:
                     experience.append(current_entry)
                 current_entry = {
-                    "title": match1.group(1).strip(),
-                    "company": match1.group(2).strip(),
-                    "duration": match1.group(3).strip(),
+                    "title": match1[0],
+                    "company": match1[1],
+                    "duration": match1[2],
                     "description": ""
                 }
                 continue
             
             # Pattern 2: Project Title or Job Title (standalone, might be followed by description)
-            if re.match(r'^[A-Z][^\n]{10,100}?$', line_stripped) and len(line_stripped.split()) >= 2:
+            if self._looks_like_title(line_stripped):
                 # Check if next lines have more info
                 if i + 1 < len(lines) and lines[i + 1].strip():
                     # Might be a project or job title
@@ -259,7 +332,7 @@ class ResumeParser:
                         if not next_line or len(next_line) < 10:
                             break
                         # Stop if we hit another entry
-                        if re.match(r'^[A-Z][^\n]{10,100}?$', next_line) and len(next_line.split()) >= 2:
+                        if self._looks_like_title(next_line):
                             break
                         desc_lines.append(next_line)
                     if desc_lines:
@@ -284,12 +357,13 @@ class ResumeParser:
         # Fallback: Look for common project/job patterns in entire text
         if not experience:
             # Pattern: Lines that look like project titles (capitalized, multiple words, not education)
-            project_pattern = r'^([A-Z][A-Za-z\s]{10,100}?)(?:\s*\(([^)]+)\))?$'
             for line in lines:
+                if budget.spent():
+                    break
                 line_stripped = line.strip()
-                match = re.match(project_pattern, line_stripped)
+                match = self._project_title(line_stripped)
                 if match and len(line_stripped.split()) >= 2:
-                    title = match.group(1).strip()
+                    title = match[0].strip()
                     # Skip education
                     if any(edu_word in title.lower() for edu_word in ['bachelor', 'master', 'phd', 'b.e', 'degree']):
                         continue
@@ -297,7 +371,7 @@ class ResumeParser:
                     if len(title) < 10 or title.isupper():
                         continue
                     
-                    duration = match.group(2).strip() if match.group(2) else "Not specified"
+                    duration = match[1].strip() if match[1] else "Not specified"
                     experience.append({
                         "title": title,
                         "company": "Not specified",
@@ -307,32 +381,46 @@ class ResumeParser:
         
         return experience
     
-    def extract_summary(self, text: str) -> str:
+    def extract_summary(self, text: str, sections: Optional[ResumeSections] = None) -> str:
         """Extract summary/objective from resume"""
-        summary_patterns = [
-            r'(?:summary|objective|profile|about)[:;]?\s*(.*?)(?:\n\n|\n(?:experience|education|skills)|$)',
-            r'^([^\n]{50,300})',  # First paragraph if no explicit summary
-        ]
+        sections = sections or segment_resume(text)
         
-        for pattern in summary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                summary = match.group(1).strip()
-                if len(summary) > 50:  # Ensure meaningful summary
-                    return summary[:500]  # Limit length
+        # First paragraph of the summary section
+        summary_text = sections.get(SUMMARY)
+        if summary_text:
+            summary = patterns.PARAGRAPH_BREAK.split(summary_text.strip(), maxsplit=1)[0].strip()
+            if len(summary) > 50:  # Ensure meaningful summary
+                return summary[:500]  # Limit length
+        
+        # First line of the document if no explicit summary
+        match = patterns.FIRST_LINE.match(text.lstrip())
+        if match:
+            return match.group(0).strip()[:500]
         
         return ""
     
-    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
-        """Main method to parse resume and return structured data"""
+    def parse_resume(self, resume_text: str, budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Main method to parse resume and return structured data
+        
+        Experience and education extraction share a time budget (RESUME_PARSE_BUDGET
+        seconds by default); once it is spent they return the entries found so far.
+        """
         try:
+            budget = ParseBudget(settings.RESUME_PARSE_BUDGET if budget_seconds is None else budget_seconds)
+            # One segmentation pass; each extractor reads only its sections
+            sections = segment_resume(resume_text)
             parsed_data = {
                 "skills": self.extract_skills(resume_text),
-                "experience": self.extract_experience(resume_text),
-                "education": self.extract_education(resume_text),
-                "summary": self.extract_summary(resume_text)
+                "experience": self.extract_experience(resume_text, sections, budget),
+                "education": self.extract_education(resume_text, sections, budget),
+                "summary": self.extract_summary(resume_text, sections)
             }
             
+            if budget.exhausted:
+                logger.warning(f"Resume parse budget exhausted on {len(resume_text)} characters; "
+                               f"returning partial experience and education")
+            
             logger.info(f"Successfully parsed resume. Found {len(parsed_data['skills'])} skills, "
                        f"{len(parsed_data['experience'])} experiences, "
                        f"{len(parsed_data['education'])} education entries")
@@ -342,3 +430,29 @@ class ResumeParser:
             logger.error(f"Error parsing resume: {str(e)}")
             raise ValueError(f"Failed to parse resume: {str(e)}")
 
+
+def parse_resume_file(pdf_bytes: bytes) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extract and parse a PDF resume (runs in a worker process)
+    
+    Returns:
+        Tuple of (resume_text, parsed_data)
+    """
+    parser = ResumeParser()
+    resume_text = parser.extract_text_from_pdf(pdf_bytes)
+    return resume_text, parser.parse_resume(resume_text)
+
+
+def parse_resume_file_timed(pdf_bytes: bytes) -> Tuple[str, Dict[str, Any], float, float]:
+    """
+    parse_resume_file that also reports where the time went (bulk ingestion workers)
+    
+    Returns:
+        Tuple of (resume_text, parsed_data, extract_seconds, parse_seconds)
+    """
+    parser = ResumeParser()
+    started = time.perf_counter()
+    resume_text = parser.extract_text_from_pdf(pdf_bytes)
+    extracted = time.perf_counter()
+    parsed_data = parser.parse_resume(resume_text)
+    return resume_text, parsed_data, extracted - started, time.perf_counter() - extracted
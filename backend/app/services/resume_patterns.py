@@ -0,0 +1,56 @@
+"""
+Precompiled regular expressions for ResumeParser
+
+Every pattern is compiled once at import, and none of them nests
+quantifiers or lets two unbounded quantifiers compete for the same
+characters, so a search costs time linear in its input (NAMED_INSTITUTION
+only ever sees a fixed 300-character window). Where the old patterns raced
+lazy quantifiers against an alternation (degree / field / institution,
+title at company), the parser finds the anchors with these patterns and
+splits the text between them in code.
+"""
+import re
+
+# Degree names, longest alternatives first; the degree must be a whole word
+# followed by whitespace
+DEGREE = re.compile(
+    r"\b(bachelor(?:\s+of)?\s+(?:engineering|science)"
+    r"|master(?:\s+of)?\s+(?:science|engineering|business\s+administration)"
+    r"|b\.?s\.?c\.?|b\.?e\.?|m\.?s\.?c\.?|m\.?b\.?a\.?|m\.?e\.?|ph\.?d\.?|doctorate)(?=\s)",
+    re.IGNORECASE
+)
+
+# Whitespace and an optional "in" between a degree and its field
+DEGREE_LEAD = re.compile(r"\s+(?:in\s+)?", re.IGNORECASE)
+# Between field and institution when there is no comma: the first whitespace run or dash
+FIELD_SEPARATOR = re.compile(r"\s*-\s*|\s+")
+
+# How far past a degree the field and institution may run (field 50, institution 81, keyword, separators)
+DEGREE_WINDOW = 160
+INSTITUTION_KEYWORD = re.compile(r"college|university|institute|school|univ", re.IGNORECASE)
+
+# Fallback: a degree word, then an institution keyword starting within
+# SIMPLE_DEGREE_REACH characters on the same line, plus SIMPLE_DEGREE_TAIL characters after it
+SIMPLE_DEGREE = re.compile(
+    r"\b(?:b\.?e\.?|b\.?s\.?c\.?|m\.?s\.?c\.?|m\.?e\.?|m\.?b\.?a\.?|ph\.?d\.?|bachelor|master|doctorate)\b",
+    re.IGNORECASE
+)
+SIMPLE_DEGREE_REACH = 150
+SIMPLE_DEGREE_TAIL = 50
+
+UNIVERSITY_OF = re.compile(r"university\s+of\s+([^\n,]+)", re.IGNORECASE)
+NAMED_INSTITUTION = re.compile(
+    r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:university|college|institute|school)", re.IGNORECASE
+)
+
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+# "Title at Company (Duration)": the separator, located before the first '('
+AT_SEPARATOR = re.compile(r"\s+(?:at|@)\s+", re.IGNORECASE)
+
+# Project title lines: letters and spaces, optionally followed by "(duration)"
+TITLE_RUN = re.compile(r"[A-Z][A-Za-z\s]*")
+PAREN_SUFFIX = re.compile(r"\s*\(([^)]+)\)")
+
+PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+FIRST_LINE = re.compile(r"[^\n]{50,300}")
@@ -0,0 +1,110 @@
+"""
+Single-pass segmentation of resume text into typed sections
+
+A line that is a known section heading ("Work Experience", "EDUCATION:",
+"Summary: ...") starts a new section that runs until the next heading.
+One compiled regex scan finds every heading and records character offsets
+into the original text, so every extractor reads its own slice with the
+same boundaries instead of re-searching the whole document.
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+HEADER = "header"  # Text before the first heading (name, contact details)
+SUMMARY = "summary"
+SKILLS = "skills"
+EXPERIENCE = "experience"
+EDUCATION = "education"
+PROJECTS = "projects"
+CERTIFICATIONS = "certifications"
+
+SECTION_HEADINGS: Dict[str, str] = {
+    heading: kind
+    for kind, headings in {
+        SUMMARY: [
+            "summary", "professional summary", "career summary", "objective", "career objective",
+            "profile", "professional profile", "about", "about me"
+        ],
+        SKILLS: [
+            "skills", "skill", "technical skills", "technical skill", "core skills", "key skills",
+            "skills and tools", "technologies", "technology", "proficiencies", "competencies"
+        ],
+        EXPERIENCE: [
+            "experience", "work experience", "professional experience", "employment",
+            "employment history", "work history", "career history", "internships", "internship"
+        ],
+        EDUCATION: [
+            "education", "academic background", "academics", "academic", "qualifications",
+            "qualification", "academic qualifications", "academic qualification", "education and training"
+        ],
+        PROJECTS: [
+            "projects", "project", "project experience", "personal projects", "academic projects",
+            "key projects"
+        ],
+        CERTIFICATIONS: [
+            "certifications", "certification", "certificates", "licenses and certifications", "courses"
+        ],
+    }.items()
+    for heading in headings
+}
+
+
+def _heading_pattern(heading: str) -> str:
+    """Regex for one heading: any whitespace between words, '&' for 'and'"""
+    return r"\s+".join("(?:and|&)" if word == "and" else re.escape(word) for word in heading.split())
+
+
+# A heading at the start of a line, alone on it ("WORK EXPERIENCE", "Skills:")
+# or followed by a colon and inline content ("Summary: ..."). One alternation
+# of literals, longest first, so matching never backtracks beyond a line. The
+# leading literal newline (instead of ^) lets re jump from line to line.
+_HEADING = re.compile(
+    r"\n[ \t#*•|_\-]*(?P<heading>"
+    + "|".join(_heading_pattern(heading) for heading in sorted(SECTION_HEADINGS, key=len, reverse=True))
+    + r")[ \t]*(?:(?P<inline>[:;])[ \t]*|[ \t:;\-_*\r]*$)",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+class Section(NamedTuple):
+    """One typed slice of the resume: text[start:end] is the section body"""
+    kind: str
+    start: int
+    end: int
+
+
+class ResumeSections:
+    """The sections of one resume, with their bodies sliced from the original text"""
+
+    def __init__(self, text: str, sections: List[Section]):
+        self.text = text
+        self.sections = sections
+
+    def get(self, *kinds: str) -> Optional[str]:
+        """Bodies of every section of the given kinds, in document order, or None if absent"""
+        bodies = [self.text[section.start:section.end] for section in self.sections if section.kind in kinds]
+        return "\n".join(bodies) if bodies else None
+
+
+def _heading_kind(heading: str) -> str:
+    """Section kind of a matched heading"""
+    return SECTION_HEADINGS[" ".join(heading.lower().replace("&", " and ").split())]
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """Split resume text into typed sections in one scan for heading lines"""
+    sections: List[Section] = []
+    kind, start = HEADER, 0
+
+    # Offsets in the scanned string are one past those in text
+    for match in _HEADING.finditer("\n" + text):
+        line_start = match.start()
+        if line_start > start and text[start:line_start].strip():
+            sections.append(Section(kind, start, line_start))
+        kind = _heading_kind(match.group("heading"))
+        # Inline content starts after the colon; otherwise on the next line
+        start = match.end() - 1 if match.group("inline") else min(len(text), match.end())
+
+    if len(text) > start and text[start:].strip():
+        sections.append(Section(kind, start, len(text)))
+    return ResumeSections(text, sections)
@@ -0,0 +1,68 @@
+"""
+Scoring entry points for worker processes
+
+Worker processes receive plain column dicts instead of ORM objects; each
+function rebuilds transient Job / ParsedProfile instances and calls the
+process-local matching_service.
+"""
+from typing import Any, Dict, List, Tuple
+
+from app.models.job import Job
+from app.models.parsed_profile import ParsedProfile
+from app.services.match_facts import MatchFacts
+from app.services.matching_service import matching_service
+
+# Columns shipped to worker processes instead of ORM objects
+JOB_FIELDS = (
+    "id", "title", "description", "requirements", "updated_at",
+    "required_skills", "feature_vector", "feature_model_version",
+    "required_skill_mask_lo", "required_skill_mask_hi"
+)
+PROFILE_FIELDS = (
+    "id", "user_id", "skills", "experience", "education", "summary",
+    "resume_vector", "vector_model_version", "resume_embedding", "embedding_version",
+    "skill_mask_lo", "skill_mask_hi"
+)
+
+# (application id, profile columns, resume text)
+ApplicationRow = Tuple[Any, Dict[str, Any], str]
+
+
+def job_fields(job: Job) -> Dict[str, Any]:
+    """Plain-data copy of the job columns the scorer reads"""
+    return {field: getattr(job, field) for field in JOB_FIELDS}
+
+
+def profile_fields(parsed_profile: ParsedProfile) -> Dict[str, Any]:
+    """Plain-data copy of the profile columns the scorer reads"""
+    return {field: getattr(parsed_profile, field) for field in PROFILE_FIELDS}
+
+
+def score_match(
+    job_columns: Dict[str, Any],
+    profile_columns: Dict[str, Any],
+    resume_text: str
+) -> Tuple[int, MatchFacts, List[str]]:
+    """Score one application (runs in a worker process; the caller owns the match cache)"""
+    return matching_service.calculate_match_score(
+        Job(**job_columns), ParsedProfile(**profile_columns), resume_text, use_cache=False
+    )
+
+
+def score_chunk(job_columns: Dict[str, Any], rows: List[ApplicationRow]) -> List[Tuple[Any, int, MatchFacts]]:
+    """
+    Score one chunk of applications (runs in a worker process)
+
+    Returns:
+        List of (application id, score, facts) tuples
+    """
+    job = Job(**job_columns)
+    candidates = []
+    application_ids = {}
+    for application_id, profile_columns, resume_text in rows:
+        profile = ParsedProfile(**profile_columns)
+        application_ids[id(profile)] = application_id
+        candidates.append((profile, resume_text))
+
+    ranked = matching_service.rank_candidates(job, candidates)
+    return [(application_ids[id(profile)], score, facts) for profile, score, facts in ranked]
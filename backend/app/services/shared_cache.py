@@ -0,0 +1,146 @@
+"""
+Pieces shared by the result caches (match scores, parsed resumes)
+
+SharedCache keeps entries in a store shared by every worker and replica
+behind a Redis-style client (get / set with ex=); each cache only supplies
+its key scheme and value encoding. build_cache picks the configured
+backend.
+"""
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCache(ABC):
+    """
+    Entries in a store shared by every worker and replica
+
+    The client only needs get(name) and set(name, value, ex=seconds), so a
+    redis.Redis instance or a LocalCacheClient fits. A failing store counts
+    as a miss: callers never depend on the cache being up.
+    """
+
+    label = "Cache"  # Names the cache in log messages
+
+    def __init__(self, client: Any, ttl: float, prefix: str):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @abstractmethod
+    def _name(self, key: Hashable) -> str:
+        """Store key for a cache key (prefix included)"""
+
+    @abstractmethod
+    def _encode(self, value: Any) -> Any:
+        """Value as stored (bytes or str)"""
+
+    @abstractmethod
+    def _decode(self, raw: bytes) -> Any:
+        """Value back from its stored form"""
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value, or None on a miss or store error"""
+        try:
+            raw = self.client.get(self._name(key))
+        except Exception as e:
+            logger.warning(f"{self.label} read failed: {str(e)}")
+            self._count("errors")
+            raw = None
+
+        if raw is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return self._decode(raw)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value with the cache TTL"""
+        try:
+            self.client.set(self._name(key), self._encode(value), ex=max(1, int(self.ttl)))
+        except Exception as e:
+            logger.warning(f"{self.label} write failed: {str(e)}")
+            self._count("errors")
+
+    def clear(self) -> None:
+        """Entries expire on their own; nothing is deleted from a shared store"""
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/error counters and hit rate of this process"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "shared",
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class LocalCacheClient:
+    """In-memory stand-in for a Redis client (get / set with ex=), for tests and benchmarks"""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name: str, value, ex: Optional[int] = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        with self._lock:
+            self._values[name] = (time.monotonic() + ex if ex else None, value)
+        return True
+
+
+def build_cache(
+    backend: str,
+    url: Optional[str],
+    in_process: Callable[[], Any],
+    shared: Callable[[Any], Any],
+    label: str
+):
+    """
+    Cache for the configured backend
+
+    "memory" is in_process(), "redis" shared(client) on the Redis server at
+    url (needs the redis package), "none" disables caching. An unreachable
+    server falls back to the in-process cache.
+    """
+    if backend == "none":
+        return None
+
+    if backend == "redis":
+        try:
+            import redis
+            client = redis.Redis.from_url(url)
+            client.ping()  # from_url does not connect
+            return shared(client)
+        except Exception as e:
+            logger.error(f"Shared {label} unavailable ({str(e)}); using the in-process cache")
+
+    return in_process()
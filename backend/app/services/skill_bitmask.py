@@ -0,0 +1,83 @@
+"""
+Fixed-width skill bitmasks over the canonical skill vocabulary
+
+Bit i stands for SKILL_KEYWORDS[i]. A mask is SKILL_MASK_WORDS 64-bit words,
+stored as signed BIGINT columns (Postgres has no unsigned type) and handled
+as a (rows x SKILL_MASK_WORDS) uint64 array in NumPy, so skill overlap is an
+AND plus a popcount, both in batches and in SQL filters.
+"""
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, or_
+
+from app.services.skill_matcher import SKILL_KEYWORDS
+from app.services.skill_index import Clause
+
+SKILL_MASK_WORDS = 2
+SKILL_BITS = {skill: index for index, skill in enumerate(SKILL_KEYWORDS)}
+assert len(SKILL_KEYWORDS) <= 64 * SKILL_MASK_WORDS, "Skill vocabulary outgrew the skill mask"
+
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _to_signed(word: int) -> int:
+    """Unsigned 64-bit word as the signed value a BIGINT column holds"""
+    return word - (1 << 64) if word >= 1 << 63 else word
+
+
+def skill_mask(skills: Iterable[str]) -> Tuple[int, ...]:
+    """Signed BIGINT words of the mask for a skill list (unknown skills are ignored)"""
+    value = 0
+    for skill in skills:
+        bit = SKILL_BITS.get(skill.lower())
+        if bit is not None:
+            value |= 1 << bit
+    return tuple(_to_signed((value >> (64 * word)) & ((1 << 64) - 1)) for word in range(SKILL_MASK_WORDS))
+
+
+def mask_array(words: Sequence[Sequence[int]]) -> np.ndarray:
+    """(rows x SKILL_MASK_WORDS) uint64 array from rows of signed BIGINT words"""
+    return np.array(words, dtype=np.int64).reshape(-1, SKILL_MASK_WORDS).view(np.uint64)
+
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a uint64 mask array"""
+    masks = np.ascontiguousarray(masks, dtype=np.uint64).reshape(-1, SKILL_MASK_WORDS)
+    return _POPCOUNT_TABLE[masks.view(np.uint8)].reshape(len(masks), -1).sum(axis=1, dtype=np.int64)
+
+
+def has_skill(mask: np.ndarray, skill: str) -> bool:
+    """Whether one uint64 mask row has the bit of a canonical skill set"""
+    bit = SKILL_BITS.get(skill)
+    return bit is not None and bool((int(mask[bit // 64]) >> (bit % 64)) & 1)
+
+
+def split_skills(required_skills: List[str], matched_mask: np.ndarray) -> Tuple[List[str], List[str]]:
+    """(matched, missing) required skills, in requirement order, from a matched-bits row"""
+    matched, missing = [], []
+    for skill in required_skills:
+        (matched if has_skill(matched_mask, skill) else missing).append(skill)
+    return matched, missing
+
+
+def mask_condition(columns: Sequence, clauses: List[Clause]) -> Optional[object]:
+    """
+    SQL condition for parsed skill-filter clauses over BIGINT mask columns
+
+    Returns None when a clause names a skill outside the vocabulary, which
+    the masks cannot represent; callers then fall back to the skill lists.
+    """
+    conditions = []
+    for negated, alternatives in clauses:
+        if any(skill not in SKILL_BITS for skill in alternatives):
+            return None
+
+        words = skill_mask(alternatives)
+        overlaps = [
+            func.coalesce(column, 0).op("&")(word) != 0
+            for column, word in zip(columns, words) if word
+        ]
+        clause = or_(*overlaps)
+        conditions.append(~clause if negated else clause)
+    return and_(*conditions)
@@ -0,0 +1,161 @@
+"""
+In-memory inverted index from canonical skill to profile bitmap
+
+Each skill maps to a bitmap (a Python int) over dense profile ordinals, so
+AND / OR / NOT skill filters resolve with a few big-integer operations
+before any TF-IDF work.
+"""
+import time
+import logging
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.parsed_profile import ParsedProfile
+
+logger = logging.getLogger(__name__)
+
+# One query clause: (negated, alternatives). Clauses are AND-ed together.
+Clause = Tuple[bool, List[str]]
+
+
+def parse_skill_query(query: str) -> List[Clause]:
+    """
+    Parse a skills filter expression
+
+    Comma separates AND clauses, '|' separates OR alternatives inside a
+    clause, and a leading '-' negates a clause:
+        "python,docker|kubernetes,-php"
+        = python AND (docker OR kubernetes) AND NOT php
+    """
+    clauses = []
+    for raw_clause in query.split(","):
+        raw_clause = raw_clause.strip()
+        if not raw_clause:
+            continue
+
+        negated = raw_clause.startswith("-")
+        if negated:
+            raw_clause = raw_clause[1:]
+
+        alternatives = [skill.strip().lower() for skill in raw_clause.split("|") if skill.strip()]
+        if not alternatives:
+            raise ValueError(f"Invalid skills filter clause: '{raw_clause}'")
+        clauses.append((negated, alternatives))
+
+    if not clauses:
+        raise ValueError("Skills filter is empty")
+    return clauses
+
+
+class SkillIndex:
+    """Thread-safe skill -> profile bitmap index keyed by user id"""
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, int] = {}
+        self._ordinals: Dict[Hashable, int] = {}
+        self._keys: List[Optional[Hashable]] = []
+        self._skills: List[Set[str]] = []
+        self._live = 0  # Bitmap of ordinals that still hold a profile
+        self._built_at: Optional[float] = None
+
+    def build(self, db: Session) -> None:
+        """(Re)build the whole index from ParsedProfile.skills"""
+        rows = db.query(ParsedProfile.user_id, ParsedProfile.skills).all()
+        ordinals_by_skill: Dict[str, List[int]] = {}
+        skills_by_ordinal = []
+        for ordinal, (_, skills) in enumerate(rows):
+            canonical = {skill.lower() for skill in skills or []}
+            skills_by_ordinal.append(canonical)
+            for skill in canonical:
+                ordinals_by_skill.setdefault(skill, []).append(ordinal)
+
+        with self._lock:
+            self._reset()
+            # One packbits per skill instead of a big-int OR per (profile, skill)
+            for skill, ordinals in ordinals_by_skill.items():
+                self._postings[skill] = self._encode(ordinals, len(rows))
+            self._keys = [user_id for user_id, _ in rows]
+            self._ordinals = {user_id: ordinal for ordinal, user_id in enumerate(self._keys)}
+            self._skills = skills_by_ordinal
+            self._live = (1 << len(rows)) - 1
+            self._built_at = time.monotonic()
+        logger.info(f"Built skill index: {len(rows)} profiles, {len(self._postings)} skills")
+
+    def ensure_built(self, db: Session) -> None:
+        """Build lazily, and rebuild after the TTL to pick up other workers' uploads"""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > self.ttl:
+            self.build(db)
+
+    def update(self, user_id: Hashable, skills: Iterable[str]) -> None:
+        """Replace the indexed skills of one profile (resume upload)"""
+        with self._lock:
+            if self._built_at is None:
+                return  # Not built yet; the first query loads everything
+            self.remove(user_id)
+            self._add(user_id, skills)
+
+    def remove(self, user_id: Hashable) -> None:
+        """Drop a profile from the index"""
+        with self._lock:
+            ordinal = self._ordinals.pop(user_id, None)
+            if ordinal is None:
+                return
+            bit = 1 << ordinal
+            for skill in self._skills[ordinal]:
+                self._postings[skill] &= ~bit
+            self._skills[ordinal] = set()
+            self._keys[ordinal] = None
+            self._live &= ~bit
+
+    def query(self, query: str) -> Set[Hashable]:
+        """User ids of profiles matching a parse_skill_query expression"""
+        clauses = parse_skill_query(query)
+        with self._lock:
+            result = self._live
+            for negated, alternatives in clauses:
+                matching = 0
+                for skill in alternatives:
+                    matching |= self._postings.get(skill, 0)
+                result = result & ~matching if negated else result & matching
+            return self._decode(result)
+
+    def _add(self, user_id: Hashable, skills: Iterable[str]) -> None:
+        """Append a profile under a fresh ordinal (lock held)"""
+        ordinal = len(self._keys)
+        bit = 1 << ordinal
+        canonical = {skill.lower() for skill in skills}
+
+        self._ordinals[user_id] = ordinal
+        self._keys.append(user_id)
+        self._skills.append(canonical)
+        self._live |= bit
+        for skill in canonical:
+            self._postings[skill] = self._postings.get(skill, 0) | bit
+
+    @staticmethod
+    def _encode(ordinals: List[int], size: int) -> int:
+        """Build a bitmap with the given ordinals set"""
+        bits = np.zeros(size, dtype=bool)
+        bits[ordinals] = True
+        return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+    def _decode(self, bitmap: int) -> Set[Hashable]:
+        """Turn a bitmap back into user ids (lock held)"""
+        if not bitmap:
+            return set()
+        raw = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+        ordinals = np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+        return {self._keys[ordinal] for ordinal in ordinals}
+
+
+skill_index = SkillIndex(settings.SKILL_INDEX_TTL)
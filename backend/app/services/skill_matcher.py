@@ -0,0 +1,140 @@
+"""
+Shared skill vocabulary and single-pass skill matcher
+
+All skills are compiled into one trie-shaped regular expression, so a
+document is scanned once regardless of vocabulary size, instead of once
+per keyword.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# Skills the resume parser reports (lowercase)
+RESUME_SKILL_KEYWORDS = [
+    # Programming Languages
+    "python", "javascript", "java", "typescript", "c++", "c#", "go", "rust", "php", "ruby",
+    "swift", "kotlin", "scala", "r", "matlab", "sql", "html", "css", "sass", "less",
+    # Frameworks & Libraries
+    "react", "vue", "angular", "node.js", "express", "django", "flask", "fastapi",
+    "spring", "laravel", "rails", "asp.net", "next.js", "nuxt.js", "svelte",
+    # Databases
+    "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "cassandra", "dynamodb",
+    # Cloud & DevOps
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "ci/cd", "terraform",
+    "ansible", "git", "github", "gitlab", "linux", "bash", "shell scripting",
+    # Data Science & ML
+    "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn",
+    "pandas", "numpy", "matplotlib", "seaborn", "jupyter", "data analysis",
+    # Other
+    "agile", "scrum", "rest api", "graphql", "microservices", "api development",
+    "testing", "tdd", "bdd", "selenium", "cypress", "jest", "pytest"
+]
+
+# Skills the matching service treats as job requirements
+JOB_SKILL_KEYWORDS = [
+    "python", "javascript", "java", "react", "node.js", "sql", "aws",
+    "docker", "kubernetes", "git", "agile", "scrum", "api", "rest",
+    "typescript", "angular", "vue", "django", "flask", "fastapi",
+    "postgresql", "mongodb", "redis", "machine learning", "data analysis"
+]
+
+# Canonical skill vocabulary: resume skills, then job-only ones ("api", "rest").
+# Positions are stable skill ids.
+SKILL_KEYWORDS = RESUME_SKILL_KEYWORDS + [
+    skill for skill in JOB_SKILL_KEYWORDS if skill not in RESUME_SKILL_KEYWORDS
+]
+
+# A skill must not be glued to letters or digits on either side
+_BOUNDARY_BEFORE = r"(?<![a-z0-9])"
+_BOUNDARY_AFTER = r"(?![a-z0-9])"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a prefix-factored alternation (longest alternatives first)"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def render(node: Dict) -> str:
+        is_terminal = "" in node
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_terminal:
+            # Optional continuation is greedy, so longer skills are tried first
+            return "(?:" + body + ")?"
+        return body
+
+    return render(trie)
+
+
+class SkillMatcher:
+    """Finds every vocabulary skill in a text in one linear pass"""
+
+    def __init__(self, skills: List[str]):
+        self.skills = [skill.lower() for skill in skills]
+        self.skill_ids = {skill: index for index, skill in enumerate(self.skills)}
+        self.pattern = re.compile(
+            _BOUNDARY_BEFORE + "(?:" + _trie_pattern(self.skills) + ")" + _BOUNDARY_AFTER,
+            re.IGNORECASE
+        )
+
+        # Multi-word skills that contain other skills ("rest api" -> "rest", "api").
+        # The scan is non-overlapping, so contained skills are added from this table.
+        self._contained: Dict[str, List[str]] = {}
+        # Offsets of the later words of multi-word skills, where an overlapping
+        # skill may start and run past the match ("rest api development")
+        self._word_starts: Dict[str, List[int]] = {}
+        for skill in self.skills:
+            inner = self._inner_skills(skill)
+            if inner:
+                self._contained[skill] = inner
+            starts = [
+                index for index in range(1, len(skill))
+                if not skill[index - 1].isalnum() and skill[index].isalnum()
+            ]
+            if starts:
+                self._word_starts[skill] = starts
+
+    def _inner_skills(self, skill: str) -> List[str]:
+        """Other skills occurring inside `skill` at word boundaries"""
+        found = []
+        for other in self.skills:
+            if other == skill or other not in skill:
+                continue
+            if re.search(_BOUNDARY_BEFORE + re.escape(other) + _BOUNDARY_AFTER, skill):
+                found.append(other)
+        return found
+
+    def find(self, text: str, vocabulary: Optional[Set[str]] = None) -> List[str]:
+        """
+        Canonical skills mentioned in text, in order of first occurrence
+
+        Args:
+            text: Text to scan
+            vocabulary: Optional subset of canonical skills to keep
+        """
+        found: Dict[str, None] = {}
+        for match in self.pattern.finditer(text):
+            pending = [match]
+            while pending:
+                current = pending.pop()
+                skill = current.group(0).lower()
+                found[skill] = None
+                for inner in self._contained.get(skill, ()):
+                    found[inner] = None
+                # Skills starting inside this match and ending after it; the scan resumes past the match
+                for offset in self._word_starts.get(skill, ()):
+                    overlap = self.pattern.match(text, current.start() + offset)
+                    if overlap and overlap.end() > current.end():
+                        pending.append(overlap)
+
+        if vocabulary is None:
+            return list(found)
+        return [skill for skill in found if skill in vocabulary]
+
+
+skill_matcher = SkillMatcher(SKILL_KEYWORDS)
@@ -0,0 +1,49 @@
+"""
+Compact binary encoding for sparse TF-IDF vectors
+
+A vector is stored as its int32 column indices followed by its float32
+values, so a row with nnz non-zeros takes exactly 8 * nnz bytes.
+"""
+from typing import List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+INDEX_DTYPE = np.dtype("<i4")
+DATA_DTYPE = np.dtype("<f4")
+ENTRY_SIZE = INDEX_DTYPE.itemsize + DATA_DTYPE.itemsize
+
+
+def encode_vector(row: csr_matrix) -> bytes:
+    """Encode a single sparse row as indices + float32 data"""
+    row = csr_matrix(row)
+    indices = row.indices.astype(INDEX_DTYPE, copy=False)
+    data = row.data.astype(DATA_DTYPE, copy=False)
+    return indices.tobytes() + data.tobytes()
+
+
+def _split(blob: bytes):
+    """Split an encoded vector into its (indices, data) arrays"""
+    nnz = len(blob) // ENTRY_SIZE
+    indices = np.frombuffer(blob, dtype=INDEX_DTYPE, count=nnz)
+    data = np.frombuffer(blob, dtype=DATA_DTYPE, count=nnz, offset=nnz * INDEX_DTYPE.itemsize)
+    return indices, data
+
+
+def decode_vector(blob: bytes, n_features: int) -> csr_matrix:
+    """Decode a single encoded vector into a 1 x n_features CSR row"""
+    return stack_vectors([blob], n_features)
+
+
+def stack_vectors(blobs: List[bytes], n_features: int) -> csr_matrix:
+    """Decode many encoded vectors straight into one CSR matrix"""
+    if not blobs:
+        return csr_matrix((0, n_features), dtype=DATA_DTYPE)
+
+    parts = [_split(blob) for blob in blobs]
+    indptr = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum([len(indices) for indices, _ in parts], out=indptr[1:])
+
+    indices = np.concatenate([indices for indices, _ in parts])
+    data = np.concatenate([data for _, data in parts])
+    return csr_matrix((data, indices, indptr), shape=(len(parts), n_features))
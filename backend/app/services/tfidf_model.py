@@ -0,0 +1,213 @@
+"""
+Corpus-level TF-IDF models used by the matching service
+
+TfidfModel learns a vocabulary from the corpus. HashingTfidfModel hashes
+terms into a fixed number of columns, so only its IDF vector is fitted and
+any node can vectorize text without a shared vocabulary.
+"""
+import os
+import uuid
+import logging
+from datetime import datetime
+from typing import List, Optional, Union
+
+import joblib
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+logger = logging.getLogger(__name__)
+
+
+def build_vectorizer() -> TfidfVectorizer:
+    """Create an unfitted vectorizer with the matching configuration"""
+    return TfidfVectorizer(
+        max_features=500,
+        stop_words='english',
+        ngram_range=(1, 2),
+        min_df=1
+    )
+
+
+class TfidfModel:
+    """
+    TF-IDF vectorizer fitted over the whole jobs + profiles corpus
+
+    Immutable once constructed: transform() only reads fitted state, so one
+    instance can be shared by any number of scoring threads. Refitting
+    produces a new instance.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer, version: str, n_documents: int):
+        self.vectorizer = vectorizer
+        self.version = version
+        self.n_documents = n_documents
+        self._n_features = len(vectorizer.vocabulary_)
+        vectorizer.idf_.setflags(write=False)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("TfidfModel is immutable; fit or load a new one")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def fit(cls, documents: List[str]) -> "TfidfModel":
+        """Fit a new model over the given corpus"""
+        documents = [doc for doc in documents if doc and doc.strip()]
+        if not documents:
+            raise ValueError("Cannot fit TF-IDF model on an empty corpus")
+
+        vectorizer = build_vectorizer()
+        vectorizer.fit(documents)
+        version = f"tfidf-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        logger.info(f"Fitted TF-IDF model {version} on {len(documents)} documents, "
+                    f"{len(vectorizer.vocabulary_)} features")
+        return cls(vectorizer, version, len(documents))
+
+    @property
+    def n_features(self) -> int:
+        """Dimensionality of the vectors produced by this model"""
+        return self._n_features
+
+    def transform(self, texts: List[str]) -> csr_matrix:
+        """Vectorize texts into L2-normalized sparse rows"""
+        return self.vectorizer.transform(texts)
+
+    def save(self, path: str) -> None:
+        """Persist the model, replacing any previous file atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        joblib.dump(
+            {
+                "vectorizer": self.vectorizer,
+                "version": self.version,
+                "n_documents": self.n_documents
+            },
+            tmp_path
+        )
+        os.replace(tmp_path, path)
+        logger.info(f"Saved TF-IDF model {self.version} to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["TfidfModel"]:
+        """Load a persisted model, returning None if none has been fitted yet"""
+        if not os.path.exists(path):
+            return None
+
+        data = joblib.load(path)
+        return cls(data["vectorizer"], data["version"], data["n_documents"])
+
+
+def build_hashing_vectorizer(n_features: int) -> HashingVectorizer:
+    """Stateless term-count hasher with the hashing-mode configuration"""
+    return HashingVectorizer(
+        n_features=n_features,
+        ngram_range=(1, 2),
+        stop_words=None,
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32
+    )
+
+
+class HashingTfidfModel:
+    """
+    Feature-hashing vectorizer weighted by a separately fitted IDF vector
+
+    The hasher needs no fitting, so its output is identical on every node;
+    only the IDF vector comes from the corpus and is refreshed by refitting.
+    Without one, terms are weighted uniformly (unweighted()). Immutable once
+    constructed, like TfidfModel.
+    """
+
+    def __init__(self, idf: np.ndarray, version: str, n_documents: int):
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.idf.setflags(write=False)
+        self.version = version
+        self.n_documents = n_documents
+        self.hasher = build_hashing_vectorizer(len(self.idf))
+        self._idf_diag = diags(self.idf, format="csr")
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("HashingTfidfModel is immutable; fit or load a new one")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def fit(cls, documents: List[str], n_features: int) -> "HashingTfidfModel":
+        """Fit the IDF vector over the given corpus"""
+        documents = [doc for doc in documents if doc and doc.strip()]
+        if not documents:
+            raise ValueError("Cannot fit hashing TF-IDF model on an empty corpus")
+
+        # Document frequency per hashed column
+        counts = build_hashing_vectorizer(n_features).transform(documents).tocsc()
+        return cls.from_document_frequencies(np.diff(counts.indptr), len(documents))
+
+    @classmethod
+    def from_document_frequencies(cls, df: np.ndarray, n_documents: int) -> "HashingTfidfModel":
+        """Build the model from per-column document frequencies in O(n_features)"""
+        if n_documents <= 0:
+            raise ValueError("Cannot build hashing TF-IDF model from an empty corpus")
+
+        # Smoothed like TfidfVectorizer
+        idf = np.log((1 + n_documents) / (1 + np.asarray(df, dtype=np.float64))) + 1
+        version = f"hash{len(idf).bit_length() - 1}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        logger.info(f"Built hashing TF-IDF model {version} over {n_documents} documents, "
+                    f"{np.count_nonzero(df)} of {len(idf)} columns used")
+        return cls(idf, version, n_documents)
+
+    @classmethod
+    def unweighted(cls, n_features: int) -> "HashingTfidfModel":
+        """Model with uniform IDF, usable before any corpus has been fitted"""
+        return cls(np.ones(n_features, dtype=np.float32), f"hash{n_features.bit_length() - 1}-noidf", 0)
+
+    @property
+    def n_features(self) -> int:
+        """Dimensionality of the vectors produced by this model"""
+        return len(self.idf)
+
+    def transform(self, texts: List[str]) -> csr_matrix:
+        """Vectorize texts into L2-normalized sparse rows"""
+        return normalize(self.hasher.transform(texts) @ self._idf_diag, copy=False)
+
+    def save(self, path: str) -> None:
+        """Persist the IDF vector, replacing any previous file atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        joblib.dump(
+            {
+                "kind": "hashing",
+                "idf": self.idf,
+                "version": self.version,
+                "n_documents": self.n_documents
+            },
+            tmp_path
+        )
+        os.replace(tmp_path, path)
+        logger.info(f"Saved hashing TF-IDF model {self.version} to {path}")
+
+
+MatchingModel = Union[TfidfModel, HashingTfidfModel]
+
+
+def load_model(path: str) -> Optional[MatchingModel]:
+    """Load whichever kind of model is persisted at path, or None if none is"""
+    if not os.path.exists(path):
+        return None
+
+    data = joblib.load(path)
+    if data.get("kind") == "hashing":
+        return HashingTfidfModel(data["idf"], data["version"], data["n_documents"])
+    return TfidfModel(data["vectorizer"], data["version"], data["n_documents"])
@@ -0,0 +1,77 @@
+"""
+Recall@k and latency of the candidate ANN index against exact search
+
+Usage: python scripts/benchmark_candidate_index.py [n_profiles]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.ann_index import CandidateANNIndex
+from app.services.tfidf_model import TfidfModel
+
+K = 20
+N_TOPICS = 40
+
+
+def make_corpus(rng: random.Random, n_docs: int, n_words: int):
+    """Topical synthetic profiles: each draws mostly from one topic's vocabulary"""
+    vocabulary = [f"term{index}" for index in range(3000)]
+    topics = [rng.sample(vocabulary, 60) for _ in range(N_TOPICS)]
+    docs = []
+    for _ in range(n_docs):
+        topic = rng.choice(topics)
+        docs.append(" ".join(
+            rng.choice(topic) if rng.random() < 0.7 else rng.choice(vocabulary)
+            for _ in range(n_words)
+        ))
+    return docs
+
+
+def main():
+    n_profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(11)
+
+    texts = make_corpus(rng, n_profiles + 50, 120)
+    query_texts, texts = texts[:50], texts[50:]
+    model = TfidfModel.fit(texts[:5000])
+    vectors = model.transform(texts)
+
+    index = CandidateANNIndex(model.n_features, model.version)
+    start = time.perf_counter()
+    index.add([str(row) for row in range(n_profiles)], vectors)
+    print(f"Indexed {n_profiles} profiles in {time.perf_counter() - start:.1f} s")
+
+    root = tempfile.mkdtemp()
+    index.save(root)
+    start = time.perf_counter()
+    index = CandidateANNIndex.load(root)
+    print(f"Mapped saved index in {(time.perf_counter() - start) * 1000:.0f} ms (cold start)")
+
+    queries = model.transform(query_texts)
+    recalls, ann_times, exact_times = [], [], []
+    for row in range(queries.shape[0]):
+        query = queries[row]
+
+        start = time.perf_counter()
+        approximate = index.search(query, K)
+        ann_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        exact = index.search(query, K, exact=True)
+        exact_times.append(time.perf_counter() - start)
+
+        recalls.append(len({key for key, _ in approximate} & {key for key, _ in exact}) / K)
+
+    print(f"recall@{K}: {np.mean(recalls):.3f} (min {np.min(recalls):.2f})")
+    print(f"ANN search: median {np.median(ann_times) * 1000:.1f} ms; "
+          f"exact search: median {np.median(exact_times) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Memory, latency and ranking agreement of LSA embeddings against sparse TF-IDF
+
+Usage: python scripts/benchmark_embeddings.py [n_profiles] [dim]
+"""
+import sys
+import os
+import time
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.lsa_embedding import LSAEmbedding
+from app.services.sparse_vectors import encode_vector
+from app.services.tfidf_model import TfidfModel
+from benchmark_ranking import SKILLS, make_text
+
+K = 50
+N_QUERIES = 50
+REPEATS = 20
+
+
+def main():
+    n_profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    rng = random.Random(5)
+
+    texts = [
+        " ".join(skill.lower() for skill in rng.sample(SKILLS, rng.randint(2, 8))) + " " + make_text(rng, 150)
+        for _ in range(n_profiles)
+    ]
+    query_texts = [make_text(rng, 60) for _ in range(N_QUERIES)]
+
+    model = TfidfModel.fit(texts[:5000] + query_texts)
+    vectors = model.transform(texts).astype(np.float32)
+    queries = model.transform(query_texts)
+
+    start = time.perf_counter()
+    embedding = LSAEmbedding.fit(model.transform(texts[:5000]), model.version, dim)
+    print(f"Fitted {embedding.dim}-dimensional LSA embedding in {time.perf_counter() - start:.1f} s")
+    embeddings = embedding.stack([embedding.encode(row) for row in embedding.transform(vectors)])
+    query_embeddings = embedding.transform(queries)
+
+    sparse_bytes = sum(len(encode_vector(vectors[row])) for row in range(n_profiles))
+    print(f"Stored size: sparse {sparse_bytes / n_profiles:.0f} B/profile (irregular), "
+          f"LSA {embeddings.nbytes / n_profiles:.0f} B/profile (fixed)")
+    print(f"In-memory matrix: sparse {(vectors.data.nbytes + vectors.indices.nbytes) / 1e6:.1f} MB, "
+          f"LSA {embeddings.nbytes / 1e6:.1f} MB")
+
+    sparse_times, dense_times, overlaps, correlations = [], [], [], []
+    for row in range(N_QUERIES):
+        query_dense = queries[row].toarray().ravel()
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            sparse_scores = vectors @ query_dense
+        sparse_times.append((time.perf_counter() - start) / REPEATS)
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            dense_scores = np.maximum(embeddings @ query_embeddings[row], 0.0)
+        dense_times.append((time.perf_counter() - start) / REPEATS)
+
+        sparse_top = set(np.argpartition(-sparse_scores, K)[:K])
+        dense_top = set(np.argpartition(-dense_scores, K)[:K])
+        overlaps.append(len(sparse_top & dense_top) / K)
+
+        # Spearman rank correlation of the two score vectors
+        sparse_ranks = np.argsort(np.argsort(sparse_scores))
+        dense_ranks = np.argsort(np.argsort(dense_scores))
+        correlations.append(np.corrcoef(sparse_ranks, dense_ranks)[0, 1])
+
+    print(f"Scoring {n_profiles} profiles: sparse median {np.median(sparse_times) * 1000:.2f} ms, "
+          f"LSA median {np.median(dense_times) * 1000:.2f} ms")
+    print(f"Top-{K} overlap with TF-IDF ranking: mean {np.mean(overlaps):.3f} (min {np.min(overlaps):.2f})")
+    print(f"Spearman correlation with TF-IDF scores: mean {np.mean(correlations):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark event-loop responsiveness during a burst of match scoring
+
+Measures how late a 1 ms heartbeat coroutine wakes up (a stand-in for
+unrelated requests) while a burst of scoring calls runs inline on the loop
+versus through the CPU executor.
+
+Usage: python scripts/benchmark_event_loop.py [n_tasks]
+"""
+import sys
+import os
+import time
+import random
+import asyncio
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.executor import CPUExecutor
+from app.services.scoring_tasks import score_match
+from benchmark_ranking import SKILLS, make_text
+
+CONCURRENCY = 8
+
+
+def make_task(rng: random.Random):
+    """score_match arguments for one synthetic application"""
+    job = {
+        "id": uuid.uuid4(),
+        "title": "Engineer",
+        "description": make_text(rng, 200),
+        "requirements": rng.sample(SKILLS, 5),
+        "updated_at": None,
+        "required_skills": None,
+        "feature_vector": None,
+        "feature_model_version": None,
+        "required_skill_mask_lo": None,
+        "required_skill_mask_hi": None
+    }
+    profile = {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "skills": rng.sample(SKILLS, 6),
+        "experience": [{"title": "Developer", "description": make_text(rng, 80)}],
+        "education": [{"degree": "BSc"}],
+        "summary": make_text(rng, 40),
+        "resume_vector": None,
+        "vector_model_version": None,
+        "resume_embedding": None,
+        "embedding_version": None,
+        "skill_mask_lo": None,
+        "skill_mask_hi": None
+    }
+    return job, profile, make_text(rng, 1500)
+
+
+async def heartbeat(stop: asyncio.Event, lags: list):
+    """Record how late each 1 ms sleep wakes up"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def burst(tasks, run_one):
+    """Run all tasks with bounded concurrency while the heartbeat ticks"""
+    stop, lags = asyncio.Event(), []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def bounded(task):
+        async with semaphore:
+            await run_one(task)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded(task) for task in tasks))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    return elapsed, np.array(lags)
+
+
+async def run_inline(task):
+    score_match(*task)
+    await asyncio.sleep(0)
+
+
+def main():
+    n_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(3)
+    tasks = [make_task(rng) for _ in range(n_tasks)]
+
+    executor = CPUExecutor(workers=os.cpu_count() or 2, max_queue=CONCURRENCY, default_timeout=30)
+
+    async def run_pooled(task):
+        await executor.run(score_match, *task)
+
+    # Warm up the worker processes (spawn + imports) outside the measurement
+    asyncio.run(burst(tasks[:CONCURRENCY], run_pooled))
+
+    for label, run_one in (("inline", run_inline), ("executor", run_pooled)):
+        elapsed, lags = asyncio.run(burst(tasks, run_one))
+        print(
+            f"{label:9s} {n_tasks} scorings in {elapsed:.2f}s; heartbeat lag "
+            f"p50 {np.percentile(lags, 50):.1f} ms, p99 {np.percentile(lags, 99):.1f} ms, "
+            f"max {lags.max():.1f} ms"
+        )
+
+    print(executor.stats())
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cold vs. cached calculate_match_score, with the in-process cache and with the
+shared cache on a local stand-in client
+
+Usage: python scripts/benchmark_match_cache.py [n_pairs]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.match_cache import InProcessMatchCache, SharedMatchCache
+from app.services.shared_cache import LocalCacheClient
+from app.services.matching_service import MatchingService
+from app.services.tfidf_model import TfidfModel
+from benchmark_ranking import SKILLS, make_text, make_candidate
+
+
+def main():
+    n_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(17)
+
+    service = MatchingService(model_path=os.path.join(tempfile.mkdtemp(), "tfidf_model.joblib"))
+    jobs = [
+        SimpleNamespace(
+            id=index,
+            updated_at=None,
+            description=make_text(rng, 60),
+            requirements=rng.sample(SKILLS, rng.randint(3, 7))
+        )
+        for index in range(20)
+    ]
+    candidates = [make_candidate(rng) for _ in range(n_pairs // len(jobs))]
+    pairs = [(job, profile, text) for job in jobs for profile, text in candidates]
+    service.model = TfidfModel.fit([service.extract_resume_text(profile, text) for profile, text in candidates])
+
+    for name, cache in (
+        ("in-process", InProcessMatchCache(max_size=len(pairs), ttl=3600)),
+        ("shared (local stand-in)", SharedMatchCache(LocalCacheClient(), ttl=3600))
+    ):
+        service.match_cache = cache
+        start = time.perf_counter()
+        cold = [service.calculate_match_score(*pair) for pair in pairs]
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = [service.calculate_match_score(*pair) for pair in pairs]
+        warm_time = time.perf_counter() - start
+
+        print(f"{name}: {len(pairs)} pairs cold {cold_time * 1000:.1f} ms, "
+              f"cached {warm_time * 1000:.1f} ms ({cold_time / warm_time:.0f}x)")
+        print(f"  results identical: {cold == warm}, stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark batch candidate ranking against the per-pair scoring path
+
+Usage: python scripts/benchmark_ranking.py [n_candidates]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.matching_service import MatchingService
+from app.services.tfidf_model import TfidfModel
+
+SKILLS = [
+    "Python", "JavaScript", "Java", "React", "Node.js", "SQL", "AWS", "Docker",
+    "Kubernetes", "Git", "Agile", "TypeScript", "Django", "Flask", "FastAPI",
+    "PostgreSQL", "MongoDB", "Redis", "Machine Learning", "Data Analysis"
+]
+WORDS = [
+    "built", "designed", "scalable", "services", "team", "led", "migrated", "pipelines",
+    "backend", "frontend", "cloud", "platform", "customers", "latency", "reduced",
+    "automated", "deployment", "testing", "mentored", "engineers", "analytics", "models",
+    "infrastructure", "microservices", "dashboards", "integration", "performance"
+]
+
+
+def make_text(rng: random.Random, n_words: int) -> str:
+    """Random resume-like text mixing filler words and skills"""
+    vocabulary = WORDS + [skill.lower() for skill in SKILLS]
+    return " ".join(rng.choice(vocabulary) for _ in range(n_words))
+
+
+def make_candidate(rng: random.Random):
+    """Synthetic (ParsedProfile-like, resume_text) pair"""
+    profile = SimpleNamespace(
+        skills=rng.sample(SKILLS, rng.randint(2, 8)),
+        experience=[{"title": "Engineer", "description": make_text(rng, 40)}],
+        education=[{"degree": "Bachelor of Science"}],
+        summary=make_text(rng, 20)
+    )
+    return profile, make_text(rng, 150)
+
+
+def main():
+    n_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(42)
+
+    job = SimpleNamespace(
+        description="Backend engineer building scalable python services on aws with docker",
+        requirements=["Python", "Docker", "AWS", "PostgreSQL", "FastAPI"]
+    )
+    candidates = [make_candidate(rng) for _ in range(n_candidates)]
+
+    service = MatchingService(model_path=os.path.join(tempfile.mkdtemp(), "tfidf_model.joblib"))
+    corpus = [service.extract_job_requirements(job)] + [
+        service.extract_resume_text(profile, text) for profile, text in candidates[:2000]
+    ]
+    service.model = TfidfModel.fit(corpus)
+
+    start = time.perf_counter()
+    ranked = service.rank_candidates(job, candidates, top_k=50)
+    batch_time = time.perf_counter() - start
+    print(f"Batch ranking of {n_candidates} candidates from text (top 50): {batch_time * 1000:.1f} ms")
+
+    candidate_matrix = service.model.transform([
+        service.extract_resume_text(profile, text) for profile, text in candidates
+    ])
+    start = time.perf_counter()
+    ranked = service.rank_candidates(job, candidates, top_k=50, candidate_matrix=candidate_matrix)
+    vector_time = time.perf_counter() - start
+    print(f"Batch ranking of {n_candidates} precomputed vectors (top 50): {vector_time * 1000:.1f} ms")
+
+    for profile, text in candidates:
+        profile.resume_vector, profile.vector_model_version = service.compute_profile_vector(profile, text)
+    start = time.perf_counter()
+    service.rank_candidates(job, candidates, top_k=50)
+    stored_time = time.perf_counter() - start
+    print(f"Batch ranking of {n_candidates} stored profile vectors (top 50): {stored_time * 1000:.1f} ms")
+
+    exact_top = {id(profile) for profile, _, _ in service.rank_candidates(job, candidates, top_k=50)}
+    for keep in (0.5, 0.2):
+        settings.RANK_PREFILTER_KEEP = keep
+        service.cascade_stats = type(service.cascade_stats)()
+        start = time.perf_counter()
+        cascade = service.rank_candidates(job, candidates, top_k=50)
+        cascade_time = time.perf_counter() - start
+        stages = service.cascade_stats.stats()["stages"]
+        overlap = len(exact_top & {id(profile) for profile, _, _ in cascade}) / 50
+        print(f"Cascade with prefilter keep {keep}: {cascade_time * 1000:.1f} ms, top-50 overlap {overlap:.2f} ("
+              + ", ".join(f"{stage} {values['avg_seconds'] * 1000:.1f} ms" for stage, values in stages.items())
+              + ")")
+    settings.RANK_PREFILTER_KEEP = 1.0
+
+    sample = candidates[:500]
+    start = time.perf_counter()
+    pair_scores = [service.calculate_match_score(job, profile, text)[0] for profile, text in sample]
+    pair_time = time.perf_counter() - start
+    print(f"Per-pair scoring of {len(sample)} candidates: {pair_time * 1000:.1f} ms "
+          f"(~{pair_time / len(sample) * n_candidates:.1f} s extrapolated to {n_candidates})")
+
+    batch_scores = {id(profile): score for profile, score, _ in service.rank_candidates(job, sample)}
+    mismatches = sum(
+        1 for (profile, _), score in zip(sample, pair_scores) if batch_scores[id(profile)] != score
+    )
+    print(f"Score mismatches between batch and per-pair paths: {mismatches}/{len(sample)}")
+    print(f"Best candidate score: {ranked[0][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark job recommendations against a large synthetic set of active jobs
+
+Usage: python scripts/benchmark_recommendations.py [n_jobs]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.matching_service import MatchingService
+from app.services.tfidf_model import TfidfModel
+from app.services.job_matrix import JobMatrix, JobMatrixCache
+from benchmark_ranking import SKILLS, make_text, make_candidate
+
+LOCATIONS = ["San Francisco, CA", "New York, NY", "Remote", "Austin, TX", "Seattle, WA"]
+JOB_TYPES = ["Full-time", "Part-time", "Remote", "Contract"]
+
+
+def main():
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(7)
+
+    service = MatchingService(model_path=os.path.join(tempfile.mkdtemp(), "tfidf_model.joblib"))
+    jobs = [
+        SimpleNamespace(
+            id=index,
+            description=make_text(rng, 60),
+            requirements=rng.sample(SKILLS, rng.randint(3, 7)),
+            location=rng.choice(LOCATIONS),
+            type=rng.choice(JOB_TYPES)
+        )
+        for index in range(n_jobs)
+    ]
+    service.model = TfidfModel.fit([service.extract_job_requirements(job) for job in jobs[:5000]])
+
+    start = time.perf_counter()
+    texts = [service.extract_job_requirements(job) for job in jobs]
+    matrix = JobMatrix(
+        job_ids=[job.id for job in jobs],
+        vectors=service.model.transform(texts),
+        required_skills=[service._extract_skills_from_text(text) for text in texts],
+        locations=[job.location.lower() for job in jobs],
+        types=[job.type for job in jobs],
+        model_version=service.model.version
+    )
+    print(f"Built job matrix for {n_jobs} jobs in {time.perf_counter() - start:.1f} s (one-off)")
+    # Publish it as a shared bundle, then time what another worker's cold start costs
+    service.job_matrix = JobMatrixCache(ttl=3600, root=tempfile.mkdtemp())
+    service.job_matrix.get(service.model.version, lambda: matrix)
+    start = time.perf_counter()
+    JobMatrix.load(service.job_matrix.root)
+    print(f"Mapped the shared job matrix bundle in {(time.perf_counter() - start) * 1000:.1f} ms (cold start)")
+
+    profile, resume_text = make_candidate(rng)
+    profile.resume_vector, profile.vector_model_version = service.compute_profile_vector(profile, resume_text)
+
+    for label, filters in [("no filters", {}), ("location + job_type", {"location": "remote", "job_type": "Full-time"})]:
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            results = service.recommend_jobs(None, profile, resume_text, limit=10, **filters)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"Recommend top 10 of {n_jobs} jobs ({label}): "
+              f"median {timings[len(timings) // 2] * 1000:.1f} ms, max {timings[-1] * 1000:.1f} ms")
+
+    job = jobs[results[0][0]]
+    print(f"Top score {results[0][1]} (per-pair path: "
+          f"{service.calculate_match_score(job, profile, resume_text)[0]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark single-pass resume segmentation against the per-extractor section
+regexes it replaced, and full parse time on long resumes
+
+Usage: python scripts/benchmark_resume_parser.py [n_sections]
+"""
+import sys
+import os
+import re
+import time
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.resume_parser import ResumeParser
+from app.services.resume_sections import segment_resume
+from benchmark_ranking import SKILLS, make_text
+
+REPEATS = 20
+HEADINGS = ["Work Experience", "Projects", "Technical Skills", "Certifications", "Education"]
+
+
+def legacy_sections(text: str):
+    """Previous section lookups: each extractor lowercased the text and ran its own DOTALL regex"""
+    education = re.search(
+        r'(?:education|academic background|qualifications?|academic qualifications?)[:;]?\s*(.*?)(?:\n\n|\n(?:experience|work experience|professional experience|projects?|skills?|technical skills?)|$)',
+        text.lower(), re.IGNORECASE | re.DOTALL
+    )
+    experience = re.search(
+        r'(?:experience|work experience|employment|professional experience|projects?|project experience)[:;]?\s*(.*?)(?:\n\n|\n(?:education|academic|skills?|technical skills?|certifications?)|$)',
+        text.lower(), re.IGNORECASE | re.DOTALL
+    )
+    summary = re.search(
+        r'(?:summary|objective|profile|about)[:;]?\s*(.*?)(?:\n\n|\n(?:experience|education|skills)|$)',
+        text, re.IGNORECASE | re.DOTALL
+    )
+    return education, experience, summary
+
+
+def make_resume(rng: random.Random, n_sections: int) -> str:
+    """Long synthetic resume: a summary, then n_sections headed blocks of entries"""
+    parts = ["Jane Doe\njane@example.com\n", "Summary\n" + make_text(rng, 60) + "\n"]
+    for index in range(n_sections):
+        heading = HEADINGS[index % len(HEADINGS)]
+        entries = [
+            f"Senior Engineer at Company {index} ({2010 + index % 10} - {2012 + index % 10})\n"
+            + "\n".join(make_text(rng, 14) for _ in range(4))
+            for _ in range(3)
+        ]
+        if heading == "Education":
+            entries.append(f"B.Sc in Computer Science, State University {2000 + index % 20}")
+        if heading == "Technical Skills":
+            entries = [", ".join(rng.sample(SKILLS, 8))]
+        parts.append(heading + "\n" + "\n\n".join(entries) + "\n")
+    return "\n".join(parts)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function(*args)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    n_sections = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(23)
+    text = make_resume(rng, n_sections)
+    parser = ResumeParser()
+
+    sections = segment_resume(text)
+    print(f"Resume of {len(text)} characters, {len(sections.sections)} sections found")
+
+    legacy_time = timed(legacy_sections, text)
+    segment_time = timed(segment_resume, text)
+    print(f"Section lookup: per-extractor regexes {legacy_time * 1000:.2f} ms, "
+          f"single-pass segmentation {segment_time * 1000:.2f} ms")
+
+    parse_time = timed(parser.parse_resume, text)
+    parsed = parser.parse_resume(text)
+    print(f"Full parse: {parse_time * 1000:.1f} ms ({len(parsed['skills'])} skills, "
+          f"{len(parsed['experience'])} experience entries, {len(parsed['education'])} education entries)")
+
+
+if __name__ == "__main__":
+    main()
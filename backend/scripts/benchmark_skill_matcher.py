@@ -0,0 +1,88 @@
+"""
+Benchmark the single-pass skill matcher against the per-keyword scan it replaced
+
+Usage: python scripts/benchmark_skill_matcher.py [n_words]
+"""
+import sys
+import os
+import re
+import time
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.resume_parser import ResumeParser
+from app.services.skill_matcher import RESUME_SKILL_KEYWORDS as SKILL_KEYWORDS
+
+FILLER = (
+    "designed built shipped owned led mentored scalable reliable services platform team "
+    "customers latency throughput pipelines dashboards migration cloud infrastructure "
+    "reduced improved automated deployment monitoring analytics product features"
+).split()
+
+
+def legacy_extract_skills(text: str):
+    """Previous ResumeParser.extract_skills: substring check + one regex per keyword"""
+    text_lower = text.lower()
+    found_skills = []
+
+    skills_section_pattern = r'(?:skills?|technical skills?|technologies?|proficiencies?)[:;]?\s*(.*?)(?:\n\n|\n[A-Z]|$)'
+    skills_match = re.search(skills_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+    if skills_match:
+        skills_text = skills_match.group(1)
+        for skill in SKILL_KEYWORDS:
+            if skill in skills_text:
+                found_skills.append(skill.title())
+
+    for skill in SKILL_KEYWORDS:
+        if skill in text_lower and skill.title() not in found_skills:
+            pattern = r'\b' + re.escape(skill) + r'\b'
+            if re.search(pattern, text_lower, re.IGNORECASE):
+                found_skills.append(skill.title())
+
+    return list(set(found_skills))
+
+
+def make_resume(rng: random.Random, n_words: int) -> str:
+    """Resume-like text with a skills section and skills sprinkled through the body"""
+    lines = ["Technical Skills: " + ", ".join(rng.sample(SKILL_KEYWORDS, 12)), ""]
+    words = []
+    for _ in range(n_words):
+        words.append(rng.choice(SKILL_KEYWORDS) if rng.random() < 0.03 else rng.choice(FILLER))
+        if len(words) == 15:
+            lines.append(" ".join(words).capitalize())
+            words = []
+    return "\n".join(lines)
+
+
+def bench(function, texts, repeat: int = 3) -> float:
+    """Best-of-repeat average seconds per text"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            function(text)
+        best = min(best, (time.perf_counter() - start) / len(texts))
+    return best
+
+
+def main():
+    n_words = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(3)
+    texts = [make_resume(rng, n_words) for _ in range(20)]
+    parser = ResumeParser()
+
+    legacy = bench(legacy_extract_skills, texts)
+    current = bench(parser.extract_skills, texts)
+    print(f"{n_words}-word resumes: legacy {legacy * 1000:.2f} ms, "
+          f"single pass {current * 1000:.2f} ms ({legacy / current:.1f}x faster)")
+
+    only_legacy, only_current = set(), set()
+    for text in texts:
+        legacy_skills, current_skills = set(legacy_extract_skills(text)), set(parser.extract_skills(text))
+        only_legacy |= legacy_skills - current_skills
+        only_current |= current_skills - legacy_skills
+    print(f"Only found by legacy: {sorted(only_legacy)}; only found by single pass: {sorted(only_current)}")
+
+
+if __name__ == "__main__":
+    main()
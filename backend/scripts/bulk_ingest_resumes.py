@@ -0,0 +1,370 @@
+"""
+Bulk-import a directory or tarball of resume PDFs
+
+Each PDF is named after its candidate: <email>.pdf or <user id>.pdf.
+PDFs are parsed with ResumeParser across a process pool, one worker per
+core by default; files whose bytes were parsed before (in this run, or
+earlier with the shared resume cache) are not parsed again. Results are
+written in batches: one executemany upsert of ParsedProfile rows, one bulk
+UPDATE of User.resume_text and one document-frequency upsert per batch,
+each batch in its own transaction.
+After every commit the finished files are appended to a checkpoint file,
+so an interrupted import picks up where it stopped.
+
+Usage: python scripts/bulk_ingest_resumes.py SOURCE [--workers N] [--batch-size N]
+       [--checkpoint PATH] [--create-users] [--retry-failed] [--limit N]
+"""
+import sys
+import os
+import time
+import uuid
+import secrets
+import tarfile
+import argparse
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.security import get_password_hash
+from app.models.parsed_profile import ParsedProfile
+from app.models.user import User, UserRole
+from app.services.matching_service import matching_service
+from app.services.resume_cache import resume_cache, resume_digest
+from app.services.resume_parser import parse_resume_file_timed
+from app.services.skill_bitmask import skill_mask
+
+DONE = "done"
+FAILED = "failed"
+
+# Columns replaced when a candidate already has a profile
+PROFILE_COLUMNS = [
+    "skills", "experience", "education", "summary", "resume_vector", "vector_model_version",
+    "resume_embedding", "embedding_version", "skill_mask_lo", "skill_mask_hi"
+]
+
+# (file key, resume text, parsed data)
+ParsedResume = Tuple[str, str, Dict[str, Any]]
+
+
+def iter_pdfs(source: str) -> Iterator[Tuple[str, bytes]]:
+    """(key, PDF bytes) for every PDF under a directory or in a tarball, in a stable order"""
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as pdf:
+                        yield os.path.relpath(path, source), pdf.read()
+    else:
+        # Members are read in archive order, so compressed tarballs stream without seeking
+        with tarfile.open(source, "r:*") as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith(".pdf"):
+                    yield member.name, archive.extractfile(member).read()
+
+
+def load_checkpoint(path: str, retry_failed: bool) -> Set[str]:
+    """Keys already handled by an earlier run"""
+    handled: Set[str] = set()
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as checkpoint:
+            for line in checkpoint:
+                key, _, status = line.rstrip("\n").rpartition("\t")
+                if key and (status == DONE or not retry_failed):
+                    handled.add(key)
+    return handled
+
+
+class Checkpoint:
+    """Append-only log of finished files, synced after every write"""
+
+    def __init__(self, path: str):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def record(self, entries: List[Tuple[str, str]]) -> None:
+        if not entries:
+            return
+        self.file.writelines(f"{key}\t{status}\n" for key, status in entries)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def candidate_ref(key: str) -> Tuple[Optional[str], Optional[uuid.UUID]]:
+    """(email, user id) named by a file, either of which may be None"""
+    stem = os.path.splitext(os.path.basename(key))[0]
+    if "@" in stem:
+        return stem, None
+    try:
+        return None, uuid.UUID(stem)
+    except ValueError:
+        return None, None
+
+
+def resolve_users(
+    db: Session, batch: List[ParsedResume], create_users: bool, password_hash: str
+) -> Dict[str, Any]:
+    """Map file keys to user ids, creating job seekers for unknown emails if asked"""
+    emails = {}
+    user_ids = {}
+    for key, _, _ in batch:
+        email, user_id = candidate_ref(key)
+        if email:
+            emails[key] = email
+        elif user_id:
+            user_ids[key] = user_id
+
+    by_email = {}
+    if emails:
+        wanted = set(emails.values())
+        by_email = dict(db.query(User.email, User.id).filter(User.email.in_(wanted)).all())
+        missing = wanted - set(by_email)
+        if missing and create_users:
+            db.execute(
+                insert(User).on_conflict_do_nothing(index_elements=[User.email]),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "email": email,
+                        "name": email.split("@")[0].replace(".", " ").replace("_", " ").title(),
+                        "hashed_password": password_hash,
+                        "role": UserRole.JOB_SEEKER
+                    }
+                    for email in sorted(missing)
+                ]
+            )
+            by_email.update(db.query(User.email, User.id).filter(User.email.in_(missing)).all())
+
+    existing_ids = set()
+    if user_ids:
+        existing_ids = {
+            user_id for (user_id,) in db.query(User.id).filter(User.id.in_(set(user_ids.values()))).all()
+        }
+
+    resolved = {key: by_email[email] for key, email in emails.items() if email in by_email}
+    resolved.update({key: user_id for key, user_id in user_ids.items() if user_id in existing_ids})
+    return resolved
+
+
+def write_batch(
+    db: Session, batch: List[ParsedResume], create_users: bool, password_hash: str, timings: Dict[str, float]
+) -> List[Tuple[str, str]]:
+    """
+    Upsert one batch of parsed resumes in a single transaction
+
+    Returns:
+        Checkpoint entries for every key in the batch
+    """
+    started = time.perf_counter()
+    resolved = resolve_users(db, batch, create_users, password_hash)
+
+    # The last file wins when several name the same candidate
+    latest: Dict[Any, Tuple[str, Dict[str, Any]]] = {}
+    for key, resume_text, parsed_data in batch:
+        if key in resolved:
+            latest[resolved[key]] = (resume_text, parsed_data)
+
+    old_texts = {}
+    if matching_service.df_store is not None and latest:
+        old_texts = {
+            profile.user_id: matching_service.extract_resume_text(profile, resume_text or "")
+            for profile, resume_text in db.query(ParsedProfile, User.resume_text).join(
+                User, User.id == ParsedProfile.user_id
+            ).filter(ParsedProfile.user_id.in_(list(latest))).all()
+        }
+    timings["db_read"] += time.perf_counter() - started
+
+    # Transient profiles, only used to vectorize and build the rows
+    started = time.perf_counter()
+    candidates = [
+        (
+            ParsedProfile(
+                user_id=user_id,
+                skills=parsed_data["skills"],
+                experience=parsed_data["experience"],
+                education=parsed_data["education"],
+                summary=parsed_data["summary"]
+            ),
+            resume_text
+        )
+        for user_id, (resume_text, parsed_data) in latest.items()
+    ]
+    features = matching_service.compute_profile_features(candidates)
+    rows = []
+    for (profile, _), (vector, version, embedding, embedding_version) in zip(candidates, features):
+        skill_mask_lo, skill_mask_hi = skill_mask(profile.skills)
+        rows.append({
+            "id": uuid.uuid4(),
+            "user_id": profile.user_id,
+            "skills": profile.skills,
+            "experience": profile.experience,
+            "education": profile.education,
+            "summary": profile.summary,
+            "resume_vector": vector,
+            "vector_model_version": version,
+            "resume_embedding": embedding,
+            "embedding_version": embedding_version,
+            "skill_mask_lo": skill_mask_lo,
+            "skill_mask_hi": skill_mask_hi
+        })
+    timings["vectorize"] += time.perf_counter() - started
+
+    started = time.perf_counter()
+    try:
+        if rows:
+            statement = insert(ParsedProfile)
+            db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[ParsedProfile.user_id],
+                    set_={column: statement.excluded[column] for column in PROFILE_COLUMNS}
+                ),
+                rows
+            )
+            db.execute(update(User), [
+                {"id": user_id, "resume_text": resume_text}
+                for user_id, (resume_text, _) in latest.items()
+            ])
+            matching_service.record_document_changes(db, [
+                (old_texts.get(profile.user_id), matching_service.extract_resume_text(profile, resume_text))
+                for profile, resume_text in candidates
+            ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    timings["db_write"] += time.perf_counter() - started
+
+    for row in rows:
+        matching_service.index_profile(row["user_id"], row["resume_vector"], row["vector_model_version"])
+    return [(key, DONE if key in resolved else FAILED) for key, _, _ in batch]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-import resume PDFs named <email>.pdf or <user id>.pdf")
+    parser.add_argument("source", help="Directory of PDFs or a (compressed) tarball")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes")
+    parser.add_argument("--batch-size", type=int, default=500, help="Resumes per database transaction")
+    parser.add_argument("--checkpoint", help="Progress file (default: <source name>.checkpoint)")
+    parser.add_argument("--create-users", action="store_true", help="Create job seekers for unknown emails")
+    parser.add_argument("--retry-failed", action="store_true", help="Retry files an earlier run failed")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many new files")
+    args = parser.parse_args()
+
+    checkpoint_path = args.checkpoint or os.path.basename(os.path.normpath(args.source)) + ".checkpoint"
+    handled = load_checkpoint(checkpoint_path, args.retry_failed)
+    checkpoint = Checkpoint(checkpoint_path)
+    # Imported accounts get a password nobody knows; candidates set their own through a reset
+    password_hash = get_password_hash(secrets.token_urlsafe(32))
+
+    timings: Dict[str, float] = defaultdict(float)
+    counts: Dict[str, int] = defaultdict(int)
+    errors: List[Tuple[str, str]] = []
+    batch: List[ParsedResume] = []
+    db = SessionLocal()
+
+    def flush():
+        entries = write_batch(db, batch, args.create_users, password_hash, timings)
+        started = time.perf_counter()
+        checkpoint.record(entries)
+        timings["checkpoint"] += time.perf_counter() - started
+        for key, status in entries:
+            counts[status] += 1
+            if status == FAILED:
+                errors.append((key, "No matching user"))
+        batch.clear()
+        elapsed = time.perf_counter() - run_started
+        print(f"  {counts[DONE]} imported, {counts[FAILED]} failed, "
+              f"{counts[DONE] / elapsed:.1f} resumes/sec")
+
+    print(f"Importing {args.source} with {args.workers} workers, {len(handled)} files already handled")
+    run_started = time.perf_counter()
+    pdfs = iter_pdfs(args.source)
+    submitted = 0
+    exhausted = False
+    pending = {}
+    try:
+        # spawn: workers start clean instead of inheriting this process's DB connections
+        with ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            while pending or not exhausted:
+                # Keep a few PDFs per worker in flight without reading the whole source into memory
+                while not exhausted and len(pending) < args.workers * 4:
+                    started = time.perf_counter()
+                    item = next(pdfs, None)
+                    timings["read"] += time.perf_counter() - started
+                    if item is None or (args.limit and submitted >= args.limit):
+                        exhausted = True
+                        break
+                    key, content = item
+                    if key in handled:
+                        counts["skipped"] += 1
+                        continue
+                    submitted += 1
+
+                    started = time.perf_counter()
+                    digest = resume_digest(content)
+                    cached = resume_cache.get(digest) if resume_cache is not None else None
+                    timings["cache"] += time.perf_counter() - started
+                    if cached is None:
+                        pending[pool.submit(parse_resume_file_timed, content)] = (key, digest)
+                        continue
+                    counts["cached"] += 1
+                    batch.append((key, *cached))
+                    if len(batch) >= args.batch_size:
+                        flush()
+                if not pending:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                failed = []
+                for future in finished:
+                    key, digest = pending.pop(future)
+                    try:
+                        resume_text, parsed_data, extract_seconds, parse_seconds = future.result()
+                    except Exception as e:
+                        failed.append((key, FAILED))
+                        errors.append((key, str(e)))
+                        continue
+                    timings["extract"] += extract_seconds
+                    timings["parse"] += parse_seconds
+                    if resume_cache is not None:
+                        resume_cache.put(digest, (resume_text, parsed_data))
+                    batch.append((key, resume_text, parsed_data))
+                checkpoint.record(failed)
+                counts[FAILED] += len(failed)
+
+                if len(batch) >= args.batch_size:
+                    flush()
+            if batch:
+                flush()
+    finally:
+        db.close()
+        checkpoint.close()
+        matching_service.save_candidate_index()
+
+    elapsed = time.perf_counter() - run_started
+    processed = counts[DONE] + counts[FAILED]
+    print(f"\nImported {counts[DONE]} resumes, {counts[FAILED]} failed, {counts['skipped']} skipped "
+          f"in {elapsed:.1f} s ({processed / elapsed if elapsed else 0:.1f} resumes/sec)")
+    print(f"{counts['cached']} resumes reused a cached parse")
+    print("Stage timings (extract and parse are summed over all workers):")
+    for stage in ("read", "cache", "extract", "parse", "db_read", "vectorize", "db_write", "checkpoint"):
+        per_resume = timings[stage] / processed * 1000 if processed else 0
+        print(f"  {stage:10s} {timings[stage]:9.2f} s  {per_resume:8.2f} ms/resume")
+    for key, error in errors[:10]:
+        print(f"  failed: {key}: {error}")
+    if len(errors) > 10:
+        print(f"  ... and {len(errors) - 10} more failures")
+
+
+if __name__ == "__main__":
+    main()
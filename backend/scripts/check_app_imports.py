@@ -0,0 +1,37 @@
+"""
+Import the application and every module under app/, failing on the first
+module that cannot be imported (shadowed names, bad route signatures,
+circular imports). Cheap enough to run in CI and in the image build.
+
+Usage: python scripts/check_app_imports.py
+Exits with status 1 if any module fails to import.
+"""
+import sys
+import os
+import pkgutil
+import importlib
+import traceback
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    import app
+
+    modules = ["app.main"] + sorted(
+        name for _, name, _ in pkgutil.walk_packages(app.__path__, prefix="app.")
+    )
+    failures = 0
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            failures += 1
+            print(f"FAILED {name}")
+            traceback.print_exc()
+
+    print(f"{len(modules)} modules, {failures} failed to import")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Fit the corpus-level TF-IDF matching model over all jobs and parsed profiles
+
+Usage: python scripts/fit_matching_model.py [--rebuild-df]
+
+In hashing mode the IDF vector comes from the stored document frequencies;
+--rebuild-df recounts them from every job and profile first (needed after
+changing MATCHING_HASH_BITS).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import SessionLocal
+from app.services.matching_service import matching_service
+
+
+def main():
+    """Fit and persist the matching model"""
+    print("Fitting TF-IDF matching model...")
+    db = SessionLocal()
+    try:
+        model = matching_service.fit_model(db, rebuild_frequencies="--rebuild-df" in sys.argv[1:])
+        refreshed = matching_service.refresh_profile_vectors(db)
+        refreshed_embeddings = matching_service.refresh_profile_embeddings(db)
+        refreshed_jobs = matching_service.refresh_job_features(db)
+        candidate_index = matching_service.build_candidate_index(db)
+    finally:
+        db.close()
+    
+    print(f"Fitted model {model.version} on {model.n_documents} documents "
+          f"({model.n_features} features)")
+    print(f"Saved to {matching_service.model_path}")
+    print(f"Refreshed {refreshed} stored profile vectors and {refreshed_jobs} job vectors")
+    if matching_service.embedding is not None:
+        print(f"Refreshed {refreshed_embeddings} profile embeddings ({matching_service.embedding.version})")
+    print(f"Built candidate index over {len(candidate_index)} profiles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Feed adversarial and random text to ResumeParser and fail if any document
+takes longer than a bound, printing how the legacy education regex fares
+on the same inputs
+
+Usage: python scripts/fuzz_resume_parser.py [size_chars] [n_random]
+Exits with status 1 if a parse exceeds MAX_SECONDS.
+"""
+import sys
+import os
+import re
+import time
+import random
+import string
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.resume_parser import ResumeParser
+
+# Parse time allowed per document; generous so slow CI machines pass, far below a backtracking blowup
+MAX_SECONDS = 5.0
+# Legacy regex runs are cut to this many characters so the comparison itself stays short
+LEGACY_CHARS = 20000
+
+LEGACY_DEGREE = (
+    r'(b\.?e\.?|bachelor(?:\s+of)?\s+engineering)\s+(?:in\s+)?([^\n,]{0,50}?)(?:\s*[,\-]\s*|\s+)'
+    r'([A-Z][^\n,]{0,80}?(?:college|university|institute|school|univ|university))'
+)
+
+
+def adversarial_inputs(size: int):
+    """Inputs that make lazy quantifiers and per-line regexes do the most work"""
+    yield "degree words, no institution", "be " * (size // 3)
+    yield "degree and 'in', no institution", "Education\n" + "b.e in " * (size // 7)
+    yield "degree words, institution at the end", "be " * (size // 3) + "university"
+    yield "one long line", "Experience\n" + "A" * size
+    yield "unclosed parentheses", "Experience\n" + ("Engineer at Acme (" * (size // 18))
+    yield "'at' chains", "Experience\n" + "A at " * (size // 5) + "(2020)"
+    yield "title-like lines", "Projects\n" + "\n".join("Aaaa Bbbb Cccc " * 6 for _ in range(size // 90))
+    yield "separators and spaces", "Education\nm.sc " + " - " * (size // 3) + "college"
+
+
+def random_inputs(rng: random.Random, size: int, count: int):
+    """Random text over an alphabet heavy in the characters the patterns key on"""
+    alphabet = string.ascii_letters + " \n\t,.-()@:" + "be" * 5
+    words = ["b.e", "m.sc", "phd", "in", "at", "@", "university", "college", "(", ")", "-", ",", "Education\n"]
+    for index in range(count):
+        chunks = []
+        while sum(map(len, chunks)) < size:
+            chunks.append(rng.choice(words) if rng.random() < 0.3 else "".join(rng.choices(alphabet, k=rng.randint(1, 12))))
+        yield f"random #{index}", " ".join(chunks)[:size]
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    n_random = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    parser = ResumeParser()
+    rng = random.Random(22)
+    failures = 0
+
+    cases = list(adversarial_inputs(size)) + list(random_inputs(rng, size, n_random))
+    for name, text in cases:
+        # No budget: the patterns themselves must be fast; the budget is a second line of defence
+        seconds = timed(parser.parse_resume, text, 0)
+        budgeted = timed(parser.parse_resume, text, 0.1)
+        legacy = timed(lambda: list(re.finditer(LEGACY_DEGREE, text[:LEGACY_CHARS].lower(), re.IGNORECASE)))
+        status = "ok" if seconds <= MAX_SECONDS else "TOO SLOW"
+        failures += seconds > MAX_SECONDS
+        print(f"{name:40s} {len(text):>8d} chars  parse {seconds * 1000:8.1f} ms  "
+              f"(0.1 s budget {budgeted * 1000:7.1f} ms)  legacy degree regex on {LEGACY_CHARS} chars "
+              f"{legacy * 1000:8.1f} ms  {status}")
+
+    print(f"{len(cases)} inputs, {failures} over {MAX_SECONDS:.0f} s")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Drain the resume ingestion queue in a standalone process
+
+Run alongside API processes started with RESUME_INGESTION_WORKERS=0 to keep
+PDF parsing off the API hosts. API processes pick up the new profiles
+through their usual index refreshes (SKILL_INDEX_TTL).
+
+Usage: python scripts/run_ingestion_worker.py [n_workers]
+"""
+import sys
+import os
+import asyncio
+import logging
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.executor import cpu_executor
+from app.services.matching_service import matching_service
+from app.services.resume_ingestion import ResumeIngestionWorker
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(1, settings.RESUME_INGESTION_WORKERS)
+    worker = ResumeIngestionWorker(
+        workers,
+        settings.RESUME_INGESTION_POLL_INTERVAL,
+        settings.RESUME_INGESTION_LEASE,
+        settings.RESUME_INGESTION_MAX_ATTEMPTS
+    )
+    try:
+        asyncio.run(worker.run_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        matching_service.save_candidate_index()
+        cpu_executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.models.job import Job
 from app.models.parsed_profile import ParsedProfile
+from app.services.skill_bitmask import skill_mask
 from datetime import datetime, timedelta
 
 # Create tables
@@ -212,6 +213,7 @@ def seed_profiles():
         
         if not existing_profile:
             profile = ParsedProfile(**profile_data)
+            profile.skill_mask_lo, profile.skill_mask_hi = skill_mask(profile.skills)
             db.add(profile)
             print(f"Created profile for user: {profile_data['user_id']}")
     
@@ -0,0 +1,109 @@
+"""
+Stress test: concurrent scoring must match serial scoring
+
+Scores the same synthetic workload serially and from a thread pool while
+another thread keeps forcing the model to reload from disk, and reports any
+result that differs.
+
+Usage: python scripts/stress_matching_threads.py [n_threads] [rounds]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.matching_service import MatchingService
+from app.services.tfidf_model import TfidfModel
+from benchmark_ranking import SKILLS, make_text, make_candidate
+
+
+def make_workload(rng: random.Random, service: MatchingService):
+    """Jobs and candidate batches; half the candidates carry stored vectors"""
+    jobs = [
+        SimpleNamespace(
+            id=index,
+            updated_at=None,
+            description=make_text(rng, 120),
+            requirements=rng.sample(SKILLS, rng.randint(3, 7))
+        )
+        for index in range(40)
+    ]
+    batches = []
+    for _ in range(40):
+        candidates = [make_candidate(rng) for _ in range(200)]
+        for profile, resume_text in candidates[::2]:
+            profile.resume_vector, profile.vector_model_version = (
+                service.compute_profile_vector(profile, resume_text)
+            )
+        batches.append(candidates)
+    return jobs, batches
+
+
+def run_task(service: MatchingService, job, candidates):
+    """Everything a request can do with the shared service"""
+    ranked = service.rank_candidates(job, candidates, top_k=20)
+    single = service.calculate_match_score(job, *candidates[0])
+    against = service.score_against_jobs([job], *candidates[1])
+    return (
+        [(id(profile), score, facts) for profile, score, facts in ranked],
+        single,
+        against
+    )
+
+
+def main():
+    n_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    rng = random.Random(11)
+
+    model_path = os.path.join(tempfile.mkdtemp(), "tfidf_model.joblib")
+    corpus = [make_text(rng, 120) for _ in range(2000)]
+    TfidfModel.fit(corpus).save(model_path)
+
+    settings.MATCHING_MODEL_RELOAD_INTERVAL = 0  # Check the model file on every call
+    service = MatchingService(model_path=model_path)
+    jobs, batches = make_workload(rng, service)
+    tasks = [(jobs[index % len(jobs)], batch) for index, batch in enumerate(batches)]
+
+    start = time.perf_counter()
+    expected = [run_task(service, job, batch) for job, batch in tasks]
+    serial_time = time.perf_counter() - start
+
+    # Keep swapping in freshly loaded (identical) model objects underneath the scorers
+    stop = threading.Event()
+
+    def reloader():
+        while not stop.is_set():
+            os.utime(model_path, None)
+            service.reload_model()
+            time.sleep(0.005)
+
+    reload_thread = threading.Thread(target=reloader)
+    reload_thread.start()
+
+    mismatches = 0
+    parallel_time = 0.0
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            results = list(pool.map(lambda task: run_task(service, *task), tasks))
+            parallel_time += time.perf_counter() - start
+            mismatches += sum(result != reference for result, reference in zip(results, expected))
+
+    stop.set()
+    reload_thread.join()
+
+    print(f"{len(tasks)} tasks x {rounds} rounds on {n_threads} threads: {mismatches} mismatches")
+    print(f"serial {serial_time:.2f}s per round; threaded {parallel_time / rounds:.2f}s per round")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
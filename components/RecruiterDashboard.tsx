@@ -127,6 +127,23 @@ const RecruiterDashboard: React.FC<RecruiterDashboardProps> = ({ user }) => {
     }
   };
 
+  const openCandidate = async (app: Application) => {
+    setSelectedCandidate({ application: app, profile: app.profile, resumeText: app.resumeText });
+    if (app.matchAnalysis) return;
+
+    // Applicant lists ship match scores only; the analysis is rendered per application
+    try {
+      const { matchAnalysis } = await apiService.getApplication(app.id);
+      setSelectedCandidate(current =>
+        current && current.application.id === app.id
+          ? { ...current, application: { ...current.application, matchAnalysis } }
+          : current
+      );
+    } catch (error) {
+      console.error('Failed to load match analysis:', error);
+    }
+  };
+
   const deleteJob = async (id: string) => {
     if (!confirm('Are you sure you want to delete this job?')) return;
     
@@ -260,7 +277,7 @@ const RecruiterDashboard: React.FC<RecruiterDashboardProps> = ({ user }) => {
                             </a>
                           )}
                           <button
-                            onClick={() => setSelectedCandidate({ application: app, profile: app.profile, resumeText: app.resumeText })}
+                            onClick={() => openCandidate(app)}
                             className="p-2 text-slate-400 hover:text-indigo-600 hover:bg-indigo-50 rounded-lg transition-all"
                             title="View resume and details"
                           >